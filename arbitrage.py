@@ -4,16 +4,20 @@ Description: The class calculates the maximum order sizes possible taking into a
              The maximum order sizes are also corrected to take into account base currency precision.
              A check on the notional value of each order is carried out to ensure it is valid.
              If arbitrage is profitable and valid, then the order sequence and profit can be printed to the console.
+             The legs of the arbitrage are typed Leg objects, so no strings are parsed during the analysis.
 """
 
 import numpy as np
 
+from leg import Leg
+
 
 class Arbitrage:
     """ Analyses arbitrage opportunity. """
 
     def __init__(self, arbitrageData):
-        self.arbitrage = arbitrageData  # A list of dictionaries
+        # A list of Leg objects; dictionaries (see Leg.fromDict) are parsed once here
+        self.arbitrage = [order if isinstance(order, Leg) else Leg.fromDict(order) for order in arbitrageData]
 
     def calculateMaximumOrderSize(self):
         """
@@ -29,12 +33,12 @@ class Arbitrage:
 
         for index, order in enumerate(self.arbitrage):
 
-            fee = eval(order['fee'])  # Get fee
-            price = eval(order['price'])  # Get price
-            size = eval(order['availableQuantity'])  # Get size
+            fee = order.fee  # Get fee
+            price = order.price  # Get price
+            size = order.availableQuantity  # Get size
 
             # Case if position is short
-            if order['position'] == 'short':
+            if order.position == 'short':
 
                 if amountAfterTrade <= size:
                     sizes[index] = amountAfterTrade
@@ -48,7 +52,7 @@ class Arbitrage:
                     sizes[index] = size
                     amountAfterTrade = size * price * (1 - fee)
 
-            else:  # trade['position'] == 'long'
+            else:  # order.position == 'long'
 
                 if amountAfterTrade <= size * price * (1 + fee):
                     sizes[index] = amountAfterTrade / (price * (1 + fee))
@@ -83,7 +87,7 @@ class Arbitrage:
         for index in range(len(sizes)):
 
             size = sizes[index]  # Get order size
-            precision = self.arbitrage[index]['basePrecision']
+            precision = self.arbitrage[index].basePrecision
             adjustedOrderSize = int(size * (10 ** -precision)) * (10 ** precision)
 
             if adjustedOrderSize != size:
@@ -107,8 +111,8 @@ class Arbitrage:
 
         for index in range(len(adjustedOrderSizes)):
 
-            notionalMinLimit = eval(self.arbitrage[index]['notionalMinimumLimit'])  # Get notional minimum limit
-            notional = adjustedOrderSizes[index] * eval(self.arbitrage[index]['price'])
+            notionalMinLimit = self.arbitrage[index].notionalMinimumLimit  # Get notional minimum limit
+            notional = adjustedOrderSizes[index] * self.arbitrage[index].price
 
             if notional <= notionalMinLimit:
                 return False
@@ -129,16 +133,16 @@ class Arbitrage:
         """
 
         # Get initial amount
-        if self.arbitrage[0]['position'] == 'short':
+        if self.arbitrage[0].position == 'short':
             startAmount = adjustedSizes[0]
         else:
-            startAmount = adjustedSizes[0] * eval(self.arbitrage[0]['price']) * (1 - eval(self.arbitrage[0]['fee']))
+            startAmount = adjustedSizes[0] * self.arbitrage[0].price * (1 - self.arbitrage[0].fee)
 
         # Get final amount
-        if self.arbitrage[-1]['position'] == 'long':
+        if self.arbitrage[-1].position == 'long':
             endAmount = adjustedSizes[-1]
         else:
-            endAmount = adjustedSizes[-1] * eval(self.arbitrage[-1]['price']) * (1 - eval(self.arbitrage[-1]['fee']))
+            endAmount = adjustedSizes[-1] * self.arbitrage[-1].price * (1 - self.arbitrage[-1].fee)
 
         profit = endAmount - startAmount
 
@@ -155,31 +159,33 @@ class Arbitrage:
 
         for index in range(len(self.arbitrage)):
 
-            if self.arbitrage[index]['position'] == 'short':  # Deal with case if take a short position
+            order = self.arbitrage[index]
+
+            if order.position == 'short':  # Deal with case if take a short position
 
                 print('Order {orderNumber}: Sell {base}, to get {quote}, via an order of {size} {base} at price {price} {quote}.\n   --> Get {amount} {quote} having paid a fee of {fee} {quote}.'.format(
                     orderNumber=str(index+1),
-                    base=self.arbitrage[index]['pair'][0],
-                    quote=self.arbitrage[index]['pair'][1],
+                    base=order.pair[0],
+                    quote=order.pair[1],
                     size=adjustedSizes[index],
-                    price=self.arbitrage[index]['price'],
-                    amount=adjustedSizes[index]*eval(self.arbitrage[index]['price'])*(1-eval(self.arbitrage[index]['fee'])),
-                    fee=adjustedSizes[index]*eval(self.arbitrage[index]['price'])*eval(self.arbitrage[index]['fee'])
+                    price=order.price,
+                    amount=adjustedSizes[index]*order.price*(1-order.fee),
+                    fee=adjustedSizes[index]*order.price*order.fee
                 ))
 
             else:  # Deal with case if take a long position
 
                 print('Order {orderNumber}: Buy {base}, using {quote}, via an order of {size} {base} at price {price} {quote}.\n   --> Pay {amount} {quote} and a a fee of {fee} {quote}.'.format(
                     orderNumber=str(index+1),
-                    base=self.arbitrage[index]['pair'][0],
-                    quote=self.arbitrage[index]['pair'][1],
+                    base=order.pair[0],
+                    quote=order.pair[1],
                     size=adjustedSizes[index],
-                    price=self.arbitrage[index]['price'],
-                    amount=adjustedSizes[index] * eval(self.arbitrage[index]['price']),
-                    fee=adjustedSizes[index] * eval(self.arbitrage[index]['price']) * eval(self.arbitrage[index]['fee'])
+                    price=order.price,
+                    amount=adjustedSizes[index] * order.price,
+                    fee=adjustedSizes[index] * order.price * order.fee
                 ))
 
-        if self.arbitrage[0]['position'] == 'short':
-            print("\nA profit of {profit} {ccy} can be made via arbitrage.".format(profit=self.calculateProfit(adjustedSizes), ccy=self.arbitrage[0]['pair'][0]))
+        if self.arbitrage[0].position == 'short':
+            print("\nA profit of {profit} {ccy} can be made via arbitrage.".format(profit=self.calculateProfit(adjustedSizes), ccy=self.arbitrage[0].pair[0]))
         else:
-            print("\nA profit of {profit} {ccy} can be made via arbitrage.".format(profit=self.calculateProfit(adjustedSizes), ccy=self.arbitrage[0]['pair'][1]))
+            print("\nA profit of {profit} {ccy} can be made via arbitrage.".format(profit=self.calculateProfit(adjustedSizes), ccy=self.arbitrage[0].pair[1]))
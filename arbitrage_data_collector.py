@@ -1,8 +1,13 @@
 """
 Brief: This script contains a class that collects the information required to analyse the arbitrage opportunity.
 Description: For each trade that needs to be placed information such as price, position and base/quote precision is collected for each currency pair.
+             The information is parsed once into typed Leg objects. Every level of the order books that have been fetched is
+             kept on the legs, so depth-aware sizing does not need to fetch the order books again.
 """
 
+from leg import Leg
+
+
 class ArbitrageDataCollector:
     """ Collects data required to analyse arbitrage. """
 
@@ -20,15 +25,16 @@ class ArbitrageDataCollector:
 
         RETURN
         ------
-        - arbitrageData (list): information stored in dictionaries in order of appearance in arbitrage cycle
-            Each dictionary has:
-            - 'pair' (str | key) --> (BASE, QUOTE) (tuple of currency codes)
-            - 'position' (str | key) --> 'short' or 'long' (str)
-            - 'availableQuantity' (str | key) --> quantity of base currency available at best bid/ask price in order book (str)
-            - 'price' (str | key) --> best bid/ask price in order book (str)
-            - 'fee' (str | key) --> fee charged per trade (decimal representation of the percentage)
-            - 'basePrecision' (str | key) --> base currency precision (int)
-            - 'notionalMinimumLimit' (str | key) --> notional minimum limit (str)
+        - arbitrageData (list): Leg objects in order of appearance in arbitrage cycle
+            Each Leg has:
+            - pair --> (BASE, QUOTE) (tuple of currency codes)
+            - position --> 'short' or 'long' (str)
+            - availableQuantity --> quantity of base currency available at best bid/ask price in order book (float)
+            - price --> best bid/ask price in order book (float)
+            - fee --> fee charged per trade (decimal representation of the percentage) (float)
+            - basePrecision --> base currency precision (int)
+            - notionalMinimumLimit --> notional minimum limit (float)
+            - depth --> (price, quantity) of every level on the side of the order book that is traded against (tuple)
         """
 
         n = len(self.cycle)  # Get number of nodes in cycle
@@ -42,29 +48,31 @@ class ArbitrageDataCollector:
                 base = currency  # Get base currency
                 quote = self.cycle[(index + 1) % n]  # Get quote currency
 
-                arbitrageData.append(dict([
-                    ('pair', (base, quote)),
-                    ('position', 'short'),
-                    ('availableQuantity', self.orderBooks[(base, quote)]['bids'][0][1]),
-                    ('price', self.orderBooks[(base, quote)]['bids'][0][0]),
-                    ('fee', self.client.getFees(self.tradedVolume)),
-                    ('basePrecision', self.client.getBasePrecision(base, quote)),
-                    ('notionalMinimumLimit', self.client.getNotionalMinLimit(base, quote))
-                ]))
+                arbitrageData.append(Leg(
+                    pair=(base, quote),
+                    position='short',
+                    availableQuantity=self.orderBooks[(base, quote)]['bids'][0][1],
+                    price=self.orderBooks[(base, quote)]['bids'][0][0],
+                    fee=self.client.getFees(self.tradedVolume),
+                    basePrecision=self.client.getBasePrecision(base, quote),
+                    notionalMinimumLimit=self.client.getNotionalMinLimit(base, quote),
+                    depth=self.orderBooks[(base, quote)]['bids']
+                ))
 
             else:
 
                 base = self.cycle[(index + 1) % n]  # Get base currency
                 quote = currency  # Get quote currency
 
-                arbitrageData.append(dict([
-                    ('pair', (base, quote)),
-                    ('position', 'long'),
-                    ('availableQuantity', self.orderBooks[(base, quote)]['asks'][0][1]),
-                    ('price', self.orderBooks[(base, quote)]['asks'][0][0]),
-                    ('fee', self.client.getFees(self.tradedVolume)),
-                    ('basePrecision', self.client.getBasePrecision(base, quote)),
-                    ('notionalMinimumLimit', self.client.getNotionalMinLimit(base, quote))
-                ]))
+                arbitrageData.append(Leg(
+                    pair=(base, quote),
+                    position='long',
+                    availableQuantity=self.orderBooks[(base, quote)]['asks'][0][1],
+                    price=self.orderBooks[(base, quote)]['asks'][0][0],
+                    fee=self.client.getFees(self.tradedVolume),
+                    basePrecision=self.client.getBasePrecision(base, quote),
+                    notionalMinimumLimit=self.client.getNotionalMinLimit(base, quote),
+                    depth=self.orderBooks[(base, quote)]['asks']
+                ))
 
         return arbitrageData
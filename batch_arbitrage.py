@@ -0,0 +1,182 @@
+"""
+Brief: This script contains a class that analyses many arbitrage opportunities at once.
+Description: The legs of all cycles are stored in padded (cycles x legs) NumPy arrays. Every calculation of the Arbitrage class
+             (maximum order sizes, adjustment for base currency precision, notional minimum limit check and profit) is carried
+             out for all cycles simultaneously, looping only over the leg index. The floating point operations are the same
+             as in the Arbitrage class and are performed in the same order, hence the results are identical.
+"""
+
+import numpy as np
+
+
+class BatchArbitrage:
+    """ Analyses many arbitrage opportunities at once. """
+
+    def __init__(self, prices, quantities, fees, shorts, basePrecisions, notionalMinimumLimits, lengths):
+        """
+        All arrays have shape (cycles, legs), where legs is the length of the longest cycle; entries beyond the length of a
+        cycle are ignored.
+
+        PARAMETERS
+        ----------
+        - prices (np.array): best bid/ask price of each leg
+        - quantities (np.array): quantity of base currency available at the best bid/ask price of each leg
+        - fees (np.array): fee charged per trade of each leg
+        - shorts (np.array): True if the position of the leg is short, False if long
+        - basePrecisions (np.array): base currency precision of each leg given as the power of 10
+        - notionalMinimumLimits (np.array): notional minimum limit of each leg
+        - lengths (np.array): number of legs in each cycle
+        """
+        self.prices = np.asarray(prices, dtype=float)
+        self.quantities = np.asarray(quantities, dtype=float)
+        self.fees = np.asarray(fees, dtype=float)
+        self.shorts = np.asarray(shorts, dtype=bool)
+        self.basePrecisions = np.asarray(basePrecisions, dtype=int)
+        self.notionalMinimumLimits = np.asarray(notionalMinimumLimits, dtype=float)
+        self.lengths = np.asarray(lengths, dtype=int)
+        self.active = np.arange(self.prices.shape[1])[np.newaxis, :] < self.lengths[:, np.newaxis]  # Mask of real legs
+        self.baseIncrements = self._powersOfTen(self.basePrecisions)  # 10 ** basePrecision of each leg
+        self.baseScales = self._powersOfTen(-self.basePrecisions)  # 10 ** -basePrecision of each leg
+
+    @staticmethod
+    def _powersOfTen(exponents):
+        """
+        Computes 10 ** exponent with Python arithmetic, as np.power is not correctly rounded for all negative exponents and
+        the results must be identical to those of the Arbitrage class.
+        """
+        unique, inverse = np.unique(exponents, return_inverse=True)
+        return np.array([10 ** int(exponent) for exponent in unique], dtype=float)[inverse].reshape(exponents.shape)
+
+    @classmethod
+    def fromLegs(cls, cycles):
+        """
+        Creates the padded arrays from ragged lists of legs.
+
+        PARAMETERS
+        ----------
+        - cycles (list): [[Leg, ..., Leg], ..., [Leg, ..., Leg]]
+        """
+        lengths = [len(cycle) for cycle in cycles]
+        shape = (len(cycles), max(lengths) if len(lengths) != 0 else 0)
+
+        prices, quantities, fees = np.ones(shape), np.zeros(shape), np.zeros(shape)
+        shorts, basePrecisions, notionalMinimumLimits = np.zeros(shape, dtype=bool), np.zeros(shape, dtype=int), np.zeros(shape)
+
+        for row, cycle in enumerate(cycles):
+            for column, leg in enumerate(cycle):
+                prices[row, column] = leg.price
+                quantities[row, column] = leg.availableQuantity
+                fees[row, column] = leg.fee
+                shorts[row, column] = leg.position == 'short'
+                basePrecisions[row, column] = leg.basePrecision
+                notionalMinimumLimits[row, column] = leg.notionalMinimumLimit
+
+        return cls(prices, quantities, fees, shorts, basePrecisions, notionalMinimumLimits, lengths)
+
+    def calculateMaximumOrderSize(self):
+        """
+        Calculates maximum order sizes of all cycles, see Arbitrage.calculateMaximumOrderSize.
+
+        RETURN
+        ------
+        - sizes (np.array): (cycles, legs) maximum possible order sizes; zero beyond the length of a cycle
+        """
+
+        sizes = np.zeros(self.prices.shape)
+        amountAfterTrade = np.full(self.prices.shape[0], np.inf)  # Funds at the end of the previous trade of each cycle
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            for index in range(self.prices.shape[1]):
+
+                active = self.active[:, index]
+                fee = self.fees[:, index]
+                price = self.prices[:, index]
+                size = self.quantities[:, index]
+                short = self.shorts[:, index]
+
+                # Maximum funds that can be spent on a long position
+                longCapacity = size * price * (1 + fee)
+
+                fits = np.where(short, amountAfterTrade <= size, amountAfterTrade <= longCapacity)
+                capacity = np.where(short, size, longCapacity)
+
+                # Readjust all previous maximum order sizes of cycles in which the funds exceed the available quantity
+                ratio = np.where(active & ~fits, capacity / amountAfterTrade, 1.0)
+                sizes *= ratio[:, np.newaxis]
+
+                orderSize = np.where(fits, np.where(short, amountAfterTrade, amountAfterTrade / (price * (1 + fee))), size)
+                sizes[:, index] = np.where(active, orderSize, 0.0)
+
+                amountAfterShort = np.where(fits, amountAfterTrade, size) * price * (1 - fee)
+                amountAfterTrade = np.where(active, np.where(short, amountAfterShort, orderSize), amountAfterTrade)
+
+        return sizes
+
+    def adjustOrderSizeForBaseTickSize(self, sizes):
+        """
+        Adjusts maximum order sizes of all cycles for base currency precision, see Arbitrage.adjustOrderSizeForBaseTickSize.
+
+        PARAMETERS
+        ----------
+        - sizes (np.array): (cycles, legs) raw maximum order sizes
+
+        RETURN
+        ------
+        - adjustedOrderSizes (np.array): (cycles, legs) maximum order sizes adjusted to the base currency precision
+        """
+
+        adjustedOrderSizes = np.zeros(sizes.shape)
+        sizes = sizes.copy()
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            for index in range(sizes.shape[1]):
+
+                size = sizes[:, index]
+                adjustedOrderSize = np.trunc(size * self.baseScales[:, index]) * self.baseIncrements[:, index]
+
+                # Readjust all the following order sizes
+                ratio = np.where(self.active[:, index] & (adjustedOrderSize != size), adjustedOrderSize / size, 1.0)
+                sizes *= ratio[:, np.newaxis]
+
+                adjustedOrderSizes[:, index] = np.where(self.active[:, index], adjustedOrderSize, 0.0)
+
+        return adjustedOrderSizes
+
+    def checkNotionalMinimumLimit(self, adjustedOrderSizes):
+        """
+        Checks the notional minimum limit of all cycles, see Arbitrage.checkNotionalMinimumLimit.
+
+        PARAMETERS
+        ----------
+        - adjustedOrderSizes (np.array): (cycles, legs) maximum order sizes adjusted to the base currency precision
+
+        RETURN
+        ------
+        - (np.array): True for each cycle whose notional values all pass the requirement else False
+        """
+        failed = (adjustedOrderSizes * self.prices <= self.notionalMinimumLimits) & self.active
+        return ~failed.any(axis=1)
+
+    def calculateProfit(self, adjustedOrderSizes):
+        """
+        Calculates the profit of all cycles, see Arbitrage.calculateProfit.
+
+        PARAMETERS
+        ----------
+        - adjustedOrderSizes (np.array): (cycles, legs) maximum order sizes adjusted to the base currency precision
+
+        RETURN
+        ------
+        - profit (np.array): profit of each cycle
+        """
+        rows = np.arange(adjustedOrderSizes.shape[0])
+        last = self.lengths - 1
+
+        startAmount = np.where(self.shorts[:, 0],
+                               adjustedOrderSizes[:, 0],
+                               adjustedOrderSizes[:, 0] * self.prices[:, 0] * (1 - self.fees[:, 0]))
+        endAmount = np.where(~self.shorts[rows, last],
+                             adjustedOrderSizes[rows, last],
+                             adjustedOrderSizes[rows, last] * self.prices[rows, last] * (1 - self.fees[rows, last]))
+
+        return endAmount - startAmount
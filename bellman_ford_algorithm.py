@@ -3,22 +3,31 @@ Brief: This script contains a class that detects negative cycles in weighted dig
 Description: The Bellman-Ford algorithm computes the shortest path from a single source vertex to all the other vertices in a weighted digraph.
              It can handle negative and positive edge weights. It can determine if a digraph contains a negative cycle.
              We ASSUME that the digraph is a strongly connected component.
+             The graph is a SparseGraph, or a dense matrix in which a weight of 0 signals that there is no edge. Its
+             (source, target, weight) edge arrays are relaxed all at once on every pass using vectorized NumPy operations.
+             Distinct negative cycles can be enumerated: once a negative cycle is found its edges are removed and relaxation
+             continues from the current distances instead of restarting from scratch. A negative cycle that shares an edge
+             with a cycle found before it is therefore skipped.
              Alternatively, there exists a Bellman-Ford algorithm implementation in the scipy.sparse.csgraph library;
              however it raises an error if a negative cycle is found and hence is not applicable for negative cycle retrieval.
 """
 
 import numpy as np
 
+from sparse_graph import asSparseGraph
+
 
 class BellmanFordAlgorithm:
     """ Utilises the Bellman-Ford algorithm to detect existence of a negative cycle in a strongly connected weighted digraph. """
 
-    def __init__(self, matrix):
-        self.matrix = matrix
-        self.vertices = matrix.shape[0]  # Number of vertices in the graph (int)
+    def __init__(self, graph):
+        self.graph = asSparseGraph(graph)  # Graph (SparseGraph)
+        self.vertices = self.graph.vertices  # Number of vertices in the graph (int)
         self.distances = np.full(self.vertices, np.inf)  # Initialize distance to all vertices from source vertex to infinity (np.array)
         self.predecessors = np.full(self.vertices, -1)  # Initialize predecessor vertices store (np.array)
         self.negativeCycle = []  # Default empty list for containment of negative cycle if exists
+        self.negativeCycles = []  # Default empty list for containment of distinct negative cycles if exist (see getAllNegativeCycles)
+        self.sources, self.targets, self.weights = self.graph.sources, self.graph.targets, self.graph.weights  # Edge arrays (np.array)
 
     def initializeSourceVertex(self):
         """
@@ -28,6 +37,31 @@ class BellmanFordAlgorithm:
         # Distance from source vertex to itself is zero
         self.distances[0] = 0
 
+    def _relaxEdges(self):
+        """
+        Relaxes every edge of the graph once, using the distances from the start of the pass.
+
+        RETURN
+        ------
+        - improved (np.array): boolean mask of vertices for which a shorter path has been found
+        """
+
+        frozenDistances = self.distances.copy()
+        candidates = frozenDistances[self.sources] + self.weights  # Distance to each target vertex via each edge
+
+        # Shortest candidate distance per target vertex
+        bestCandidates = np.full(self.vertices, np.inf)
+        np.minimum.at(bestCandidates, self.targets, candidates)
+
+        improved = bestCandidates < frozenDistances
+
+        # Record the predecessor of every improved vertex, i.e. the source of the edge that gives the shortest candidate distance
+        improvingEdges = improved[self.targets] & (candidates == bestCandidates[self.targets])
+        self.predecessors[self.targets[improvingEdges]] = self.sources[improvingEdges]
+        self.distances[improved] = bestCandidates[improved]
+
+        return improved
+
     def implementBellmanFordAlgorithm(self):
         """
         Apply Bellman-Ford algorithm to graph for |vertices|-1 iterations.
@@ -37,18 +71,9 @@ class BellmanFordAlgorithm:
 
         for _ in range(self.vertices - 1):
 
-            frozenDistances = self.distances.copy()
-
-            # Iterate over each row in the input matrix
-            for yValue, row in enumerate(self.matrix):
-
-                # Iterate over each column in the selected row of the input matrix
-                for xValue, column in enumerate(row):
-
-                    # Update distances and predecessor vertices if shorter path is found
-                    if column != 0 and frozenDistances[yValue] + column < frozenDistances[xValue]:
-                        self.distances[xValue] = self.distances[yValue] + column
-                        self.predecessors[xValue] = yValue
+            # Stop early if no distance changed, as further iterations cannot change them either
+            if not self._relaxEdges().any():
+                break
 
     def getANegativeCycle(self):
         """
@@ -58,23 +83,11 @@ class BellmanFordAlgorithm:
 
         self.implementBellmanFordAlgorithm()
 
-        frozenDistances = self.distances.copy()
-
-        # Iterate over each row in the input matrix
-        for yValue, row in enumerate(self.matrix):
-
-            # Iterate over each column in the selected row of the input matrix
-            for xValue, column in enumerate(row):
-
-                # Check if a shorter path exists from source vertex which signals the existence of a negative cycle
-                if column != 0 and frozenDistances[yValue] + column < frozenDistances[xValue]:
-                    self.distances[xValue] = self.distances[yValue] + column
-                    self.predecessors[xValue] = yValue
+        improved = self._relaxEdges()
 
         # If a shorter path is found for any vertex then the negative cycle is calculated
-        if True in (self.distances != frozenDistances):
-            self._findCycle(list(self.distances != frozenDistances).index(True))
-
+        if improved.any():
+            self._findCycle(int(np.flatnonzero(improved)[0]))
 
     def _findCycle(self, endVertex):
         """
@@ -100,3 +113,117 @@ class BellmanFordAlgorithm:
                 self.negativeCycle = self.negativeCycle[index:].copy()  # Truncate cycle
                 self.negativeCycle.reverse()
                 break
+
+    def getAllNegativeCycles(self):
+        """
+        Finds distinct negative cycles in graph. Edges are relaxed until the distances converge. If distances still change
+        after |vertices| passes, the negative cycles in the predecessor graph are traced, their edges are removed from the
+        graph and relaxation continues with the current distances. A negative cycle that shares an edge with a cycle found
+        before it is therefore never reported.
+        Distances may be too small after the removal, i.e. lower bounds of the shortest distances, but relaxation converges
+        from any finite distances: after k passes each distance is the lightest of its starting value and of the walks of at
+        most k edges from any vertex, plus the starting distance of that vertex. Without negative cycles the lightest walks
+        are paths of fewer than |vertices| edges, so the distances stop changing within |vertices| passes, and they keep
+        changing while a negative cycle is left.
+        Cycles are canonicalised by rotation (see canonicaliseCycle) and stored in order of detection.
+        """
+
+        self.implementBellmanFordAlgorithm()
+
+        foundCycles = set()
+        passes = self.vertices - 1  # Passes since the last removal of edges
+
+        while self._relaxEdges().any():
+
+            passes += 1
+            if passes < self.vertices:
+                continue
+
+            # Distances still change after |vertices| passes, so the predecessor graph contains negative cycles
+            weights = dict(zip(zip(self.sources.tolist(), self.targets.tolist()), self.weights.tolist()))
+            newCycles = []
+            for vertex in np.flatnonzero(self.distances < np.inf):
+                cycle = self._traceCycle(vertex, weights)
+                if cycle is not None and cycle not in foundCycles:
+                    foundCycles.add(cycle)
+                    newCycles.append(cycle)
+
+            if len(newCycles) == 0:  # Should not happen; stops relaxation of a cycle that could not be traced
+                break
+
+            self.negativeCycles.extend([list(cycle) for cycle in sorted(newCycles)])
+            self._removeCycleEdges(newCycles)
+            passes = 0
+
+    def _traceCycle(self, vertex, weights):
+        """
+        Follows the predecessor vertices from vertex until a vertex repeats.
+
+        PARAMETERS
+        ----------
+        - vertex (int): vertex from which the predecessor vertices are followed
+        - weights (dict): weight of each remaining edge {(source, target): weight, ...}
+
+        RETURN
+        ------
+        - cycle (tuple/None): canonicalised negative cycle if one is reached, else None
+        """
+
+        # After |vertices| steps the walk is inside a cycle if it has not ended
+        for _ in range(self.vertices):
+            vertex = self.predecessors[vertex]
+            if vertex == -1:
+                return None
+
+        cycle = [int(vertex)]
+        predecessor = int(self.predecessors[vertex])
+        while predecessor != cycle[0]:
+            if predecessor == -1:
+                return None
+            cycle.append(predecessor)
+            predecessor = int(self.predecessors[predecessor])
+        cycle.reverse()
+
+        # Only report cycles that are made of edges that still exist and that are negative
+        edges = [(cycle[i], cycle[(i + 1) % len(cycle)]) for i in range(len(cycle))]
+        if any(edge not in weights for edge in edges) or sum(weights[edge] for edge in edges) >= 0:
+            return None
+
+        return self.canonicaliseCycle(cycle)
+
+    def _removeCycleEdges(self, cycles):
+        """
+        Removes the edges of the given cycles from the edge arrays and resets the predecessor of every vertex that was
+        reached through a removed edge.
+
+        PARAMETERS
+        ----------
+        - cycles (list): cycles whose edges are removed [(v0, v1, ..., vK), ...]
+        """
+
+        removedEdges = set()
+        for cycle in cycles:
+            removedEdges.update((cycle[i], cycle[(i + 1) % len(cycle)]) for i in range(len(cycle)))
+
+        keep = np.array([edge not in removedEdges for edge in zip(self.sources.tolist(), self.targets.tolist())], dtype=bool)
+        self.sources, self.targets, self.weights = self.sources[keep], self.targets[keep], self.weights[keep]
+
+        for source, target in removedEdges:
+            if self.predecessors[target] == source:
+                self.predecessors[target] = -1
+
+    @staticmethod
+    def canonicaliseCycle(cycle):
+        """
+        Rotates a cycle so that it starts at its smallest vertex, so that every rotation of the same cycle compares equal.
+
+        PARAMETERS
+        ----------
+        - cycle (list): vertices in the cycle in order
+
+        RETURN
+        ------
+        - (tuple): the rotated cycle
+        """
+        start = cycle.index(min(cycle))
+        return tuple(int(vertex) for vertex in cycle[start:] + cycle[:start])
@@ -0,0 +1,86 @@
+"""
+Brief: Benchmark of the vectorized Bellman-Ford relaxation engine against the original nested-loop implementation.
+Description: Random complete exchange graphs are generated for 50, 200 and 1000 currencies.
+             The nested-loop implementation relaxes every cell of the matrix in interpreted Python, so for large graphs only
+             a few passes are timed and the total run time is extrapolated to the |vertices| passes it would perform.
+             Run from the repository root with: python -m benchmarks.benchmark_bellman_ford
+"""
+
+import time
+
+import numpy as np
+
+from bellman_ford_algorithm import BellmanFordAlgorithm
+
+
+def randomExchangeGraph(vertices, seed=0):
+    """
+    Generates a complete digraph of linearized exchange rates with a bid/ask spread on every edge.
+
+    PARAMETERS
+    ----------
+    - vertices (int): number of currencies
+    - seed (int): seed of the random number generator
+
+    RETURN
+    ------
+    - graph (np.array): a (vertices, vertices) matrix
+    """
+    generator = np.random.default_rng(seed)
+    logPrices = generator.normal(0, 1, vertices)
+    spreads = generator.uniform(0.0005, 0.005, (vertices, vertices))
+    graph = logPrices[np.newaxis, :] - logPrices[:, np.newaxis] + spreads
+    np.fill_diagonal(graph, 0)
+    return graph
+
+
+def _legacyPass(matrix, distances, predecessors):
+    """ A single pass of the original nested-loop relaxation. """
+    frozenDistances = distances.copy()
+    for yValue, row in enumerate(matrix):
+        for xValue, column in enumerate(row):
+            if column != 0 and frozenDistances[yValue] + column < frozenDistances[xValue]:
+                distances[xValue] = distances[yValue] + column
+                predecessors[xValue] = yValue
+
+
+def timeLegacy(matrix, maximumPasses=3):
+    """
+    Times the original implementation; returns the (possibly extrapolated) run time in seconds and whether it was extrapolated.
+    """
+    vertices = matrix.shape[0]
+    distances = np.full(vertices, np.inf)
+    predecessors = np.full(vertices, -1)
+    distances[0] = 0
+
+    passes = min(vertices, maximumPasses)
+    start = time.perf_counter()
+    for _ in range(passes):
+        _legacyPass(matrix, distances, predecessors)
+    elapsed = time.perf_counter() - start
+
+    return elapsed * vertices / passes, passes < vertices
+
+
+def timeVectorized(matrix, repeats=3):
+    """ Times the vectorized implementation; returns the best run time in seconds. """
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        BellmanFordAlgorithm(matrix).getANegativeCycle()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def run(sizes=(50, 200, 1000)):
+    print('{:>9} {:>14} {:>14} {:>10}'.format('vertices', 'legacy (s)', 'vectorized (s)', 'speedup'))
+    for vertices in sizes:
+        graph = randomExchangeGraph(vertices)
+        legacy, extrapolated = timeLegacy(graph, maximumPasses=vertices if vertices <= 50 else 3)
+        vectorized = timeVectorized(graph)
+        print('{:>9} {:>13.4f}{} {:>14.4f} {:>9.0f}x'.format(vertices, legacy, '*' if extrapolated else ' ', vectorized, legacy / vectorized))
+    print('* extrapolated from 3 passes of the nested-loop implementation')
+
+
+if __name__ == '__main__':
+    run()
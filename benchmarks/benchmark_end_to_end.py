@@ -0,0 +1,111 @@
+"""
+Brief: End-to-end load test of the program against the local stand-in exchange.
+Description: The stand-in server (see stand_in_exchange_server.py) is started with the requested network conditions and the
+             program is pointed at it:
+             - main mode: main_implementation.main is run once per scan with a new CoinbaseClient, as a user would run it,
+               including the product catalog requests
+             - scanner mode: runScanner keeps one client and scans back to back; an error response ends the run
+             The snapshot latency (wall-clock time to fetch the order books of a snapshot) is reported as percentiles, with
+             the number of scans per second and the number of failed scans and of requests the server throttled or failed.
+             The client paces its requests with a token bucket (see RequestScheduler) if --client-rate-limit is given, and
+             retries throttled and failed requests with backoff; the number of retries is reported too.
+             Run from the repository root with: python -m benchmarks.benchmark_end_to_end [--latency 0.02 --jitter 0.01 ...]
+"""
+
+import argparse
+from contextlib import redirect_stdout
+import io
+import time
+
+import numpy as np
+
+from clients.base.request_scheduler import RequestScheduler
+from clients.coinbase.coinbase_client import CoinbaseClient
+from main_implementation import main, runScanner
+from benchmarks.stand_in_exchange_server import StandInExchangeServer
+
+
+def loadTest(server, scans=20, maxWorkers=8, mode='main', detector='bellman-ford', scheduler=None):
+    """
+    Runs the program against a started stand-in server.
+
+    PARAMETERS
+    ----------
+    - server (StandInExchangeServer): started server
+    - scans (int): number of scans
+    - maxWorkers (int/None): worker threads of the client
+    - mode (str): 'main' or 'scanner'
+    - detector (str): negative cycle detector, one of the keys of DETECTORS
+    - scheduler (RequestScheduler/None): rate limit and retry policy shared by the clients, None for no rate limit
+
+    RETURN
+    ------
+    - (dict): 'latencies' (seconds to fetch each snapshot), 'scans', 'failed', 'opportunities', 'elapsed' (seconds)
+    """
+    latencies, opportunities, failed = [], 0, 0
+    scheduler = scheduler if scheduler is not None else RequestScheduler()
+
+    start = time.perf_counter()
+    with redirect_stdout(io.StringIO()):
+        if mode == 'main':
+            for _ in range(scans):
+                client = CoinbaseClient(api_url=server.url, maxWorkers=maxWorkers, scheduler=scheduler)
+                try:
+                    opportunities += len(main(client, server.codes, detector=detector))
+                    latencies.append(client.getBatchLatencies()[-1])
+                except Exception:  # Requests that still fail after the retries raise an HTTPError
+                    failed += 1
+                    client.closeSession()
+        else:
+            try:
+                client = CoinbaseClient(api_url=server.url, maxWorkers=maxWorkers, scheduler=scheduler)
+                timings = runScanner(client, server.codes, detector=detector, interval=None, maxScans=scans)
+            except Exception:
+                timings = []
+                failed += 1
+            latencies = [timing['fetch'] for timing in timings]
+            opportunities = sum(timing['opportunities'] for timing in timings)
+    elapsed = time.perf_counter() - start
+
+    return {'latencies': latencies, 'scans': len(latencies), 'failed': failed, 'opportunities': opportunities, 'elapsed': elapsed}
+
+
+def run(currencies=20, density=1.0, latency=0.02, jitter=0.01, errorRate=0.0, rateLimit=None, mispricingRate=0.01,
+        scans=20, workers=(1, 8, 32), mode='main', clientRateLimit=None, clientBurst=None):
+    print('Stand-in exchange: {} currencies, latency {} ms + up to {} ms jitter, error rate {}, rate limit {}.'.format(
+        currencies, latency * 1000, jitter * 1000, errorRate, rateLimit if rateLimit is not None else 'none'))
+    print('{:>8} {:>6} {:>7} {:>10} {:>10} {:>10} {:>8} {:>10} {:>7} {:>8}'.format(
+        'workers', 'scans', 'failed', 'p50 (ms)', 'p95 (ms)', 'p99 (ms)', 'scans/s', 'throttled', 'errors', 'retried'))
+
+    for maxWorkers in workers:
+        with StandInExchangeServer(currencies, density, latency, jitter, errorRate, rateLimit,
+                                   mispricingRate=mispricingRate) as server:
+            scheduler = RequestScheduler(clientRateLimit, clientBurst)
+            result = loadTest(server, scans, maxWorkers, mode, scheduler=scheduler)
+            stats = dict(server.stats)
+
+        percentiles = np.percentile(np.array(result['latencies']) * 1000, [50, 95, 99]) if result['scans'] else [np.nan] * 3
+        print('{:>8} {:>6} {:>7} {:>10.1f} {:>10.1f} {:>10.1f} {:>8.2f} {:>10} {:>7} {:>8}'.format(
+            str(maxWorkers), result['scans'], result['failed'], *percentiles, result['scans'] / result['elapsed'],
+            stats['throttled'], stats['errors'], scheduler.getStats()['retried']))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='End-to-end load test against the local stand-in exchange.')
+    parser.add_argument('--currencies', type=int, default=20)
+    parser.add_argument('--density', type=float, default=1.0)
+    parser.add_argument('--latency', type=float, default=0.02, help='seconds added to every response')
+    parser.add_argument('--jitter', type=float, default=0.01, help='maximum random seconds added to every response')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='probability of a 500 response')
+    parser.add_argument('--rate-limit', type=float, default=None, help='requests per second before 429 responses')
+    parser.add_argument('--mispricing-rate', type=float, default=0.01, help='probability that a book is quoted off its fair price')
+    parser.add_argument('--scans', type=int, default=20)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 8, 32], help='worker threads of the client to compare')
+    parser.add_argument('--mode', choices=['main', 'scanner'], default='main')
+    parser.add_argument('--client-rate-limit', type=float, default=None, help='requests per second sent by the client')
+    parser.add_argument('--client-burst', type=int, default=None, help='requests the client can send at once')
+    arguments = parser.parse_args()
+
+    run(arguments.currencies, arguments.density, arguments.latency, arguments.jitter, arguments.error_rate, arguments.rate_limit,
+        arguments.mispricing_rate, arguments.scans, arguments.workers, arguments.mode, arguments.client_rate_limit,
+        arguments.client_burst)
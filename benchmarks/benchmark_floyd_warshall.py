@@ -0,0 +1,61 @@
+"""
+Brief: Benchmark of the vectorized Floyd-Warshall detector against the Bellman-Ford and SPFA detectors, by size and density.
+Description: The detectors search the strongly connected components of the graphs of synthetic markets (see synthetic_market.py)
+             with negative cycles of 3, 4 and 5 currencies planted, from baskets of 20 to 300 currencies and from complete
+             markets to markets where each pair of currencies is listed with a probability of 5%. The median detection time of
+             each detector is printed with the detector that autoDetector picks for the graph, which was chosen from this table.
+             Run from the repository root with: python -m benchmarks.benchmark_floyd_warshall
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from bellman_ford_algorithm import BellmanFordAlgorithm
+from floyd_warshall_algorithm import FloydWarshallAlgorithm, autoDetector
+from spfa_algorithm import SPFAAlgorithm
+from graph_constructor import GraphConstructor
+from strongly_connected_components import ConnectedComponents
+from benchmarks.synthetic_market import SyntheticMarket
+
+
+def timeDetector(detectorClass, components, repeats=3):
+    """ Times a detector over every component; returns the median run time in seconds and the number of cycles found. """
+    timings = []
+    for _ in range(repeats):
+        cycles = 0
+        start = time.perf_counter()
+        for component in components:
+            detectorObject = detectorClass(component['subGraph'])
+            detectorObject.getAllNegativeCycles()
+            cycles += len(detectorObject.negativeCycles)
+        timings.append(time.perf_counter() - start)
+    return np.median(timings), cycles
+
+
+def run(sizes=(20, 40, 80, 150, 300), densities=(1.0, 0.5, 0.3, 0.15, 0.05), repeats=3):
+    print('{:>11} {:>8} {:>7} {:>17} {:>7} {:>9} {:>7} {:>19} {:>7}  {}'.format(
+        'currencies', 'density', 'pairs', 'bellman-ford (ms)', 'cycles', 'spfa (ms)', 'cycles', 'floyd-warshall (ms)', 'cycles', 'auto'))
+    for currencies in sizes:
+        for density in densities:
+            market = SyntheticMarket(currencies, density, (3, 4, 5), seed=0)
+            graph = GraphConstructor(market.client(), market.codes, pairs=market.pairs).buildGraph()[0]
+            components = ConnectedComponents(graph).getConnectedComponents()['components']
+
+            bellmanFord, bellmanFordCycles = timeDetector(BellmanFordAlgorithm, components, repeats)
+            spfa, spfaCycles = timeDetector(SPFAAlgorithm, components, repeats)
+            floydWarshall, floydWarshallCycles = timeDetector(FloydWarshallAlgorithm, components, repeats)
+            picked = set(type(autoDetector(component['subGraph'])).__name__ for component in components)
+
+            print('{:>11} {:>8} {:>7} {:>17.1f} {:>7} {:>9.1f} {:>7} {:>19.1f} {:>7}  {}'.format(
+                currencies, density, len(market.pairs), bellmanFord * 1000, bellmanFordCycles, spfa * 1000, spfaCycles,
+                floydWarshall * 1000, floydWarshallCycles, ', '.join(sorted(name.replace('Algorithm', '') for name in picked))))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Floyd-Warshall against Bellman-Ford and SPFA by size and density of the graph.')
+    parser.add_argument('--repeats', type=int, default=3)
+    arguments = parser.parse_args()
+
+    run(repeats=arguments.repeats)
@@ -0,0 +1,69 @@
+"""
+Brief: Benchmark of the memory-mapped columnar order book store.
+Description: Top-of-book updates of every pair of the given number of currencies are appended to a store, one update of a
+             random pair at a time, in batches. The append rate, the size on disk, the time taken to find a time range and
+             the time taken to rebuild the matrix at random timestamps (GraphConstructor.buildGraphAt) are reported. The
+             rebuild only reads the records just before the timestamp, so its time does not grow with the size of the store.
+             Run from the repository root with: python -m benchmarks.benchmark_order_book_store
+"""
+
+import os
+import shutil
+import tempfile
+import time
+
+import numpy as np
+
+from clients.replay.order_book_store import OrderBookStore
+from graph_constructor import GraphConstructor
+
+
+class StorePairsClient:
+    """ Exchange client that only knows the currency pairs of the store. """
+
+    def __init__(self, pairs):
+        self.pairs = pairs
+
+    def getCurrencyPairs(self, currencies):
+        return self.pairs
+
+
+def run(currencies=20, records=5000000, batch=100000, rebuilds=100, seed=0):
+    generator = np.random.default_rng(seed)
+    codes = ['C{}'.format(index) for index in range(currencies)]
+    pairs = [(codes[i], codes[j]) for i in range(currencies) for j in range(i + 1, currencies)]
+    directory = os.path.join(tempfile.mkdtemp(), 'store')
+
+    store = OrderBookStore(directory, 'a')
+    store.appendSnapshot(0.0, dict([(pair, {'bids': [[1.0, 1.0]], 'asks': [[1.001, 1.0]]}) for pair in pairs]))
+    start = time.perf_counter()
+    for first in range(0, records, batch):
+        timestamps = np.arange(first, first + batch) * 0.001 + 0.001
+        chosen = generator.integers(len(pairs), size=batch)
+        bids = np.exp(generator.normal(0, 0.01, batch))
+        quantities = generator.uniform(0.1, 5, batch)
+        store.append(timestamps, [pairs[index] for index in chosen], bids, quantities, bids * 1.001, quantities)
+    store.flush()
+    appending = time.perf_counter() - start
+
+    size = sum(os.path.getsize(os.path.join(directory, name)) for name in os.listdir(directory))
+    print('Appended {} records in {:.2f}s: {:.0f} records per second, {:.1f} MB on disk ({:.0f} bytes per record).'.format(
+        len(store), appending, records / appending, size / 1e6, size / len(store)))
+
+    start = time.perf_counter()
+    for timestamp in generator.uniform(0, records * 0.001, rebuilds):
+        store.view(timestamp, timestamp + 60)
+    print('Time range view: {:.1f} us per lookup.'.format((time.perf_counter() - start) / rebuilds * 1e6))
+
+    graphObject = GraphConstructor(StorePairsClient(pairs), codes)
+    start = time.perf_counter()
+    for timestamp in generator.uniform(0, records * 0.001, rebuilds):
+        graphObject.buildGraphAt(store, timestamp)
+    print('Matrix rebuilt at a random timestamp in {:.2f} ms.'.format((time.perf_counter() - start) / rebuilds * 1e3))
+
+    store.close()
+    shutil.rmtree(os.path.dirname(directory))
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,96 @@
+"""
+Brief: Scaling benchmark of the parallel search of the strongly connected components by number of worker processes.
+Description: A graph is made of disjoint synthetic markets (see synthetic_market.py), so that it has as many strongly connected
+             components, each with planted negative cycles. Every negative cycle is searched for sequentially (see
+             findNegativeCycles) and with ParallelDetector for 1, 2, 4, ... worker processes up to the number of processors.
+             The pool is started before timing, as it is kept across scans by the scanner. The cycles found in parallel are
+             checked to be identical, and in the same order, to those of the sequential search.
+             Run from the repository root with: python -m benchmarks.benchmark_parallel_detection [--components 8 --currencies 60]
+"""
+
+import argparse
+import os
+import time
+
+import numpy as np
+
+from bellman_ford_algorithm import BellmanFordAlgorithm
+from graph_constructor import GraphConstructor
+from main_implementation import findNegativeCycles
+from parallel_detection import ParallelDetector
+from sparse_graph import SparseGraph
+from strongly_connected_components import ConnectedComponents
+from benchmarks.synthetic_market import SyntheticMarket
+
+
+def disjointMarketsGraph(components, currencies, cycleLengths=(3, 4, 5), seed=0):
+    """
+    Generates a block diagonal graph of disjoint synthetic markets.
+
+    PARAMETERS
+    ----------
+    - components (int): number of markets, each a strongly connected component
+    - currencies (int): number of currencies of each market
+    - cycleLengths (tuple): length of each negative cycle planted in every market
+    - seed (int): seed of the random number generator of the first market
+
+    RETURN
+    ------
+    - graph (SparseGraph): graph of components * currencies vertices
+    """
+    sources, targets, weights = [], [], []
+    for component in range(components):
+        market = SyntheticMarket(currencies, 1.0, cycleLengths, seed=seed + component)
+        graph = GraphConstructor(market.client(), market.codes).buildGraph()[0]
+        sources.append(graph.sources + component * currencies)
+        targets.append(graph.targets + component * currencies)
+        weights.append(graph.weights)
+    return SparseGraph(components * currencies, np.concatenate(sources), np.concatenate(targets), np.concatenate(weights))
+
+
+def timeSearch(function, repeats):
+    """ RETURN: (float, object) the minimum run time in seconds and the result of the last run """
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = function()
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+def run(components=8, currencies=60, repeats=3, workers=None):
+    graph = disjointMarketsGraph(components, currencies)
+    connectedComponentsObject = ConnectedComponents(graph)
+    connectedComponentsObject.getConnectedComponents()
+
+    if workers is None:
+        workers = [1]
+        while workers[-1] * 2 <= (os.cpu_count() or 1):
+            workers.append(workers[-1] * 2)
+
+    sequentialTime, sequential = timeSearch(lambda: findNegativeCycles(graph, 'bellman-ford', connectedComponentsObject), repeats)
+
+    print('{} components of {} currencies, {} negative cycles found, {} processor(s).'.format(
+        components, currencies, len(sequential), os.cpu_count()))
+    print('{:>10} {:>12} {:>9} {:>10}'.format('workers', 'time (ms)', 'speedup', 'identical'))
+    print('{:>10} {:>12.1f} {:>9.2f} {:>10}'.format('sequential', sequentialTime * 1000, 1.0, '-'))
+
+    for maxWorkers in workers:
+        with ParallelDetector(maxWorkers) as parallelDetector:
+            parallelDetector.findNegativeCycles(graph, BellmanFordAlgorithm, connectedComponentsObject)  # Starts the processes
+            parallelTime, parallel = timeSearch(
+                lambda: parallelDetector.findNegativeCycles(graph, BellmanFordAlgorithm, connectedComponentsObject), repeats)
+        print('{:>10} {:>12.1f} {:>9.2f} {:>10}'.format(maxWorkers, parallelTime * 1000, sequentialTime / parallelTime,
+                                                       str(parallel == sequential)))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Scaling of the parallel search of the strongly connected components.')
+    parser.add_argument('--components', type=int, default=8)
+    parser.add_argument('--currencies', type=int, default=60, help='currencies of each component')
+    parser.add_argument('--repeats', type=int, default=3)
+    parser.add_argument('--workers', type=int, nargs='+', default=None,
+                        help='worker processes to compare, by default powers of 2 up to the number of processors')
+    arguments = parser.parse_args()
+
+    run(arguments.components, arguments.currencies, arguments.repeats, arguments.workers)
@@ -0,0 +1,99 @@
+"""
+Brief: Records a synthetic market to a snapshot file and replays it through the detection at CPU speed.
+Description: A synthetic exchange lists every pair of the given number of currencies. Log prices follow a random walk and, in
+             some snapshots, one bid is quoted above the fair price so that an arbitrage appears. The snapshots are recorded
+             with RecordingClient and replayed with ReplayClient through runBacktest; the size of the file, the number of
+             arbitrages found per snapshot and the replay throughput in snapshots per second are reported.
+             Run from the repository root with: python -m benchmarks.benchmark_replay
+"""
+
+from contextlib import redirect_stdout
+import io
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from clients.replay.recording_client import RecordingClient
+from clients.replay.replay_client import ReplayClient
+from graph_constructor import GraphConstructor
+from main_implementation import runBacktest
+
+
+class SyntheticMarketClient:
+    """ Exchange client whose prices move every time a batch of order books is fetched. """
+
+    def __init__(self, currencies, levels=5, mispricing=0.3, seed=0):
+        self.generator = np.random.default_rng(seed)
+        self.codes = ['C{}'.format(index) for index in range(currencies)]
+        self.pairs = [(self.codes[i], self.codes[j]) for i in range(currencies) for j in range(i + 1, currencies)]
+        self.logPrices = dict(zip(self.codes, self.generator.normal(0, 1, currencies)))
+        self.levels = levels  # Number of levels on each side of every order book
+        self.mispricing = mispricing  # Probability that a snapshot contains a bid above the fair price
+
+    def checkCurrenciesExistence(self, currencies):
+        pass
+
+    def getCurrencyPairs(self, currencies):
+        return [pair for pair in self.pairs if pair[0] in currencies and pair[1] in currencies]
+
+    def getOrderBooks(self, pairs, level=1):
+        for code in self.codes:
+            self.logPrices[code] += self.generator.normal(0, 0.0005)
+        mispriced = pairs[self.generator.integers(len(pairs))] if self.generator.random() < self.mispricing else None
+
+        orderBooks = {}
+        for base, quote in pairs:
+            mid = np.exp(self.logPrices[base] - self.logPrices[quote])
+            steps = np.arange(self.levels if level > 1 else 1) * 0.0005
+            bid = mid * (1.01 if (base, quote) == mispriced else 0.999)
+            orderBooks[(base, quote)] = {
+                'bids': [['{:.10f}'.format(bid * (1 - step)), '{:.4f}'.format(self.generator.uniform(0.1, 5)), 1] for step in steps],
+                'asks': [['{:.10f}'.format(mid * 1.001 * (1 + step)), '{:.4f}'.format(self.generator.uniform(0.1, 5)), 1] for step in steps]}
+        return orderBooks
+
+    @staticmethod
+    def getBasePrecision(base, quote):
+        return -8
+
+    @staticmethod
+    def getNotionalMinLimit(base, quote):
+        return '0.00001'
+
+    def closeSession(self):
+        pass
+
+
+def run(currencies=20, snapshots=200, level=2):
+    path = os.path.join(tempfile.mkdtemp(), 'synthetic.bin')
+    market = SyntheticMarketClient(currencies)
+    codes = market.codes
+
+    recorder = RecordingClient(market, path)
+    graphObject = GraphConstructor(recorder, codes, level)
+    start = time.perf_counter()
+    for _ in range(snapshots):
+        graphObject.buildGraph()
+    recorder.closeSession()
+    recording = time.perf_counter() - start
+
+    size = os.path.getsize(path)
+    print('Recorded {} snapshot(s) of {} pairs in {:.2f}s: {:.1f} kB, {:.0f} bytes per snapshot.'.format(
+        snapshots, len(graphObject.edges), recording, size / 1000, size / snapshots))
+
+    with redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        results = runBacktest(ReplayClient(path), codes, level=level)
+        elapsed = time.perf_counter() - start
+    os.remove(path)
+
+    counts = np.bincount([result['opportunities'] for result in results])
+    print('Replayed {} snapshot(s) in {:.2f}s: {:.1f} snapshots per second.'.format(len(results), elapsed, len(results) / elapsed))
+    for opportunities, count in enumerate(counts):
+        if count != 0:
+            print('  {:>5} snapshot(s) with {} arbitrage(s)'.format(count, opportunities))
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,59 @@
+"""
+Brief: Benchmark of the hop-bounded short cycle search against the Bellman-Ford and SPFA detectors.
+Description: The detectors search the strongly connected components of the graphs of synthetic markets (see synthetic_market.py)
+             in which negative cycles of 3, 4 and 5 currencies are planted: complete markets of a few dozen currencies and
+             sparse markets of hundreds to thousands, where every currency is quoted against a few others only.
+             For each detector the median detection time is printed with the number of negative cycles found, the number of
+             those with at most maxHops edges, and the longest cycle found.
+             Run from the repository root with: python -m benchmarks.benchmark_short_cycles [--max-hops 4]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from graph_constructor import GraphConstructor
+from main_implementation import DETECTORS
+from strongly_connected_components import ConnectedComponents
+from benchmarks.synthetic_market import SyntheticMarket
+
+
+def timeDetector(detectorClass, components, repeats=3):
+    """ Times a detector over every component; returns the median run time in seconds and the cycles found. """
+    timings = []
+    for _ in range(repeats):
+        cycles = []
+        start = time.perf_counter()
+        for component in components:
+            detectorObject = detectorClass(component['subGraph'])
+            detectorObject.getAllNegativeCycles()
+            cycles.extend(detectorObject.negativeCycles)
+        timings.append(time.perf_counter() - start)
+    return np.median(timings), cycles
+
+
+def run(markets=((20, 1.0), (50, 1.0), (300, 0.02), (1000, 0.006), (3000, 0.002)), maxHops=4, repeats=3):
+    print('{:>11} {:>7} {:>13} {:>15} {:>8} {:>13} {:>8}'.format('currencies', 'pairs', 'detector', 'detection (ms)', 'cycles',
+                                                                 '<= {} hops'.format(maxHops), 'longest'))
+    for currencies, density in markets:
+        market = SyntheticMarket(currencies, density, (3, 4, 5), seed=0)
+        graph = GraphConstructor(market.client(), market.codes, pairs=market.pairs).buildGraph()[0]
+        components = ConnectedComponents(graph).getConnectedComponents()['components']
+
+        detectors = [('bellman-ford', DETECTORS['bellman-ford']), ('spfa', DETECTORS['spfa']),
+                     ('short-cycles', lambda subGraph: DETECTORS['short-cycles'](subGraph, maxHops))]
+        for name, detectorClass in detectors:
+            seconds, cycles = timeDetector(detectorClass, components, repeats)
+            print('{:>11} {:>7} {:>13} {:>15.1f} {:>8} {:>13} {:>8}'.format(
+                currencies, len(market.pairs), name, seconds * 1000, len(cycles),
+                sum(len(cycle) <= maxHops for cycle in cycles), max([len(cycle) for cycle in cycles], default=0)))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Hop-bounded short cycle search against Bellman-Ford and SPFA.')
+    parser.add_argument('--max-hops', type=int, default=4, help='maximum number of edges of a cycle found by the short cycle search')
+    parser.add_argument('--repeats', type=int, default=3)
+    arguments = parser.parse_args()
+
+    run(maxHops=arguments.max_hops, repeats=arguments.repeats)
@@ -0,0 +1,65 @@
+"""
+Brief: Benchmark of the queue-based SPFA detector against the vectorized Bellman-Ford detector.
+Description: Both detectors are timed on random arbitrage-free exchange graphs and on the same graphs with a planted
+             negative cycle, which is the arbitrage-bearing case.
+             Run from the repository root with: python -m benchmarks.benchmark_spfa
+"""
+
+import time
+
+import numpy as np
+
+from bellman_ford_algorithm import BellmanFordAlgorithm
+from spfa_algorithm import SPFAAlgorithm
+from benchmarks.benchmark_bellman_ford import randomExchangeGraph
+
+
+def plantNegativeCycle(graph, length, profit=0.01, seed=0):
+    """
+    Lowers the weights along a random cycle so that the cycle has a total weight of -profit.
+
+    PARAMETERS
+    ----------
+    - graph (np.array): complete digraph of linearized exchange rates
+    - length (int): number of vertices in the planted cycle
+    - profit (float): log-return of the planted cycle
+
+    RETURN
+    ------
+    - graph (np.array): copy of the input graph containing the negative cycle
+    """
+    generator = np.random.default_rng(seed)
+    graph = graph.copy()
+    cycle = generator.choice(graph.shape[0], size=length, replace=False)
+    edges = [(cycle[i], cycle[(i + 1) % length]) for i in range(length)]
+    total = sum(graph[source, target] for source, target in edges)
+    for source, target in edges:
+        graph[source, target] -= (total + profit) / length
+    return graph
+
+
+def timeDetector(detectorClass, graph, repeats=3):
+    """ Times a detector; returns the best run time in seconds and whether a negative cycle was found. """
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        detector = detectorClass(graph)
+        detector.getANegativeCycle()
+        timings.append(time.perf_counter() - start)
+    return min(timings), len(detector.negativeCycle) != 0
+
+
+def run(sizes=(50, 200, 1000)):
+    print('{:>9} {:>16} {:>17} {:>10} {:>7}'.format('vertices', 'graph', 'bellman-ford (s)', 'spfa (s)', 'cycle'))
+    for vertices in sizes:
+        arbitrageFree = randomExchangeGraph(vertices)
+        graphs = [('arbitrage-free', arbitrageFree), ('arbitrage', plantNegativeCycle(arbitrageFree, 4))]
+        for name, graph in graphs:
+            bellmanFord, foundByBellmanFord = timeDetector(BellmanFordAlgorithm, graph)
+            spfa, foundBySPFA = timeDetector(SPFAAlgorithm, graph)
+            assert foundByBellmanFord == foundBySPFA
+            print('{:>9} {:>16} {:>17.4f} {:>10.4f} {:>7}'.format(vertices, name, bellmanFord, spfa, str(foundBySPFA)))
+
+
+if __name__ == '__main__':
+    run()
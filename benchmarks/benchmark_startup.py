@@ -0,0 +1,76 @@
+"""
+Brief: Measures the import time and peak memory of a scan process, with the built-in strongly connected components and with scipy.
+Description: Every measurement runs in a new Python process, as a short-lived scan process or worker does: it imports the
+             pipeline, then builds the graph of a synthetic market, finds its strongly connected components and searches them
+             for negative cycles. The 'scipy' variant also imports scipy.sparse.csgraph and labels the components with it, as
+             the program did before it had its own implementation. The peak resident memory of the process is reported.
+             Run from the repository root with: python -m benchmarks.benchmark_startup [--currencies 300 1000 3000]
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+
+import numpy as np
+
+SCAN_PROCESS = '''
+import json, resource, sys, time
+import numpy as np
+start = time.perf_counter()
+if sys.argv[2] == 'scipy':
+    from scipy.sparse import csr_matrix
+    from scipy.sparse.csgraph import connected_components
+from graph_constructor import GraphConstructor
+from main_implementation import findNegativeCycles
+from strongly_connected_components import ConnectedComponents, findStronglyConnectedComponents
+from benchmarks.synthetic_market import SyntheticMarket
+imports = time.perf_counter() - start
+
+currencies = int(sys.argv[1])
+market = SyntheticMarket(currencies, min(1.0, 6.0 / (currencies - 1)), (3, 4, 5), seed=0)
+graph = GraphConstructor(market.client(), market.codes, pairs=market.pairs).buildGraph()[0]
+
+start = time.perf_counter()
+if sys.argv[2] == 'scipy':
+    connected_components(csr_matrix((np.ones(graph.edgeCount), graph.targets, graph.indptr), shape=graph.shape),
+                         directed=True, connection='strong')
+else:
+    findStronglyConnectedComponents(graph.vertices, graph.targets, graph.indptr)
+scc = time.perf_counter() - start
+
+start = time.perf_counter()
+findNegativeCycles(graph, 'spfa', ConnectedComponents(graph))
+detection = time.perf_counter() - start
+
+print(json.dumps({'imports': imports, 'scc': scc, 'detection': detection,
+                  'peakMemory': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024}))
+'''
+
+
+def measure(currencies, variant, repeats):
+    """ RETURN: (dict) median of every measurement over separate processes """
+    runs = [json.loads(subprocess.run([sys.executable, '-c', SCAN_PROCESS, str(currencies), variant],
+                                      check=True, capture_output=True, text=True).stdout.splitlines()[-1])
+            for _ in range(repeats)]
+    return dict((key, np.median([run[key] for run in runs])) for key in runs[0])
+
+
+def compareStartup(sizes=(300, 1000, 3000), repeats=5):
+    print('{:>11} {:>9} {:>14} {:>10} {:>16} {:>13}'.format('currencies', 'variant', 'imports (ms)', 'scc (ms)',
+                                                           'detection (ms)', 'peak RSS (MB)'))
+    for currencies in sizes:
+        for variant in ('built-in', 'scipy'):
+            result = measure(currencies, variant, repeats)
+            print('{:>11} {:>9} {:>14.1f} {:>10.2f} {:>16.1f} {:>13.1f}'.format(
+                currencies, variant, result['imports'] * 1000, result['scc'] * 1000, result['detection'] * 1000,
+                result['peakMemory']))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Import time and peak memory of a scan process.')
+    parser.add_argument('--currencies', type=int, nargs='+', default=[300, 1000, 3000])
+    parser.add_argument('--repeats', type=int, default=5, help='processes started per measurement')
+    arguments = parser.parse_args()
+
+    compareStartup(arguments.currencies, arguments.repeats)
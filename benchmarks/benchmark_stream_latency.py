@@ -0,0 +1,77 @@
+"""
+Brief: Measures update-to-detection latency of the streaming mode.
+Description: A synthetic level2 feed (snapshots followed by random updates at the top of the book) is replayed by the local
+             stand-in WebSocket server. After every price change the negative cycle detection runs on the updated graph, and
+             the time from receipt of the message to the end of detection is reported as percentiles.
+             Run from the repository root with: python -m benchmarks.benchmark_stream_latency
+"""
+
+import asyncio
+
+import numpy as np
+
+from order_book_stream import OrderBookStream
+from main_implementation import findNegativeCycles
+from sparse_graph import SparseGraph
+from benchmarks.websocket_replay_server import ReplayWebSocketServer
+
+
+def syntheticFeed(currencies, updates, seed=0):
+    """
+    Generates a level2 feed over all pairs of the given number of currencies.
+
+    RETURN
+    ------
+    - nodesKey (dict): currency code to vertex number relation
+    - edges (list): currency pairs
+    - messages (list): snapshot messages followed by l2update messages
+    """
+    generator = np.random.default_rng(seed)
+    codes = ['C{}'.format(index) for index in range(currencies)]
+    nodesKey = dict([(code, index) for index, code in enumerate(codes)])
+    prices = np.exp(generator.normal(0, 1, currencies))
+    edges = [(codes[i], codes[j]) for i in range(currencies) for j in range(i + 1, currencies)]
+
+    messages = []
+    mids = {}
+    for base, quote in edges:
+        mid = prices[nodesKey[base]] / prices[nodesKey[quote]]
+        mids[(base, quote)] = mid
+        messages.append({'type': 'snapshot', 'product_id': base + '-' + quote,
+                         'bids': [['{:.10f}'.format(mid * 0.999), '1']], 'asks': [['{:.10f}'.format(mid * 1.001), '1']]})
+
+    for _ in range(updates):
+        base, quote = edges[generator.integers(len(edges))]
+        price = mids[(base, quote)] * (1 - generator.uniform(0, 0.001))
+        messages.append({'type': 'l2update', 'product_id': base + '-' + quote,
+                         'changes': [['buy', '{:.10f}'.format(price), '1']]})
+
+    return nodesKey, edges, messages
+
+
+async def measure(currencies, updates=500, detector='bellman-ford'):
+    nodesKey, edges, messages = syntheticFeed(currencies, updates)
+    server = ReplayWebSocketServer(messages)
+    await server.start()
+
+    # Initial weights from the snapshots, as buildGraph gives them from the REST order books in the streaming mode
+    bases, quotes = [nodesKey[base] for base, _ in edges], [nodesKey[quote] for _, quote in edges]
+    bids = np.array([float(message['bids'][0][0]) for message in messages[:len(edges)]])
+    asks = np.array([float(message['asks'][0][0]) for message in messages[:len(edges)]])
+    graph = SparseGraph(currencies, bases + quotes, quotes + bases, np.concatenate([-np.log(bids), np.log(asks)]))
+    stream = OrderBookStream(nodesKey, edges, graph)
+    await stream.run(server.url, lambda graph, orderBooks, pair: findNegativeCycles(graph, detector))
+    await server.stop()
+
+    return np.array(stream.latencies)
+
+
+def run(sizes=(10, 30, 60)):
+    print('{:>11} {:>9} {:>10} {:>10} {:>10}'.format('currencies', 'updates', 'p50 (ms)', 'p95 (ms)', 'p99 (ms)'))
+    for currencies in sizes:
+        latencies = asyncio.run(measure(currencies)) * 1000
+        print('{:>11} {:>9} {:>10.3f} {:>10.3f} {:>10.3f}'.format(currencies, len(latencies), *np.percentile(latencies, [50, 95, 99])))
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,190 @@
+"""
+Brief: Micro-benchmark suite of the stages of the detection, on seeded synthetic markets.
+Description: For every configuration (number of currencies, edge density and planted cycle lengths) a synthetic market is
+             generated (see synthetic_market.py) and each stage is timed separately:
+             - buildGraph: GraphConstructor.buildGraph with the synthetic client
+             - connectedComponents: ConnectedComponents.getConnectedComponents
+             - bellmanFord: BellmanFordAlgorithm.getANegativeCycle on the largest strongly connected component
+             - sizing: ArbitrageDataCollector and Arbitrage sizing of every planted cycle
+             - batchSizing: the same sizing with BatchArbitrage
+             The results are written as JSON. Two result files can be compared to detect regressions between versions.
+             Run from the repository root with: python -m benchmarks.benchmark_suite [--output results.json] [--compare old.json]
+"""
+
+import argparse
+import datetime
+import json
+import platform
+import statistics
+import subprocess
+import time
+
+import numpy as np
+
+from arbitrage import Arbitrage
+from arbitrage_data_collector import ArbitrageDataCollector
+from batch_arbitrage import BatchArbitrage
+from bellman_ford_algorithm import BellmanFordAlgorithm
+from graph_constructor import GraphConstructor
+from strongly_connected_components import ConnectedComponents
+from benchmarks.synthetic_market import SyntheticMarket
+
+# (currencies, density, planted cycle lengths)
+CONFIGURATIONS = [(20, 1.0, (3,)), (50, 0.3, (3, 4)), (50, 1.0, (3, 4)), (100, 0.1, (3, 4, 5)), (100, 1.0, (3, 4, 5)),
+                  (200, 0.05, (4,)), (200, 0.5, (4,))]
+QUICK_CONFIGURATIONS = [(20, 1.0, (3,)), (50, 0.3, (3, 4))]
+
+
+def timeStage(function, repeats):
+    """
+    Times a function.
+
+    RETURN
+    ------
+    - (dict): 'min', 'median' and 'mean' run time in seconds, and the number of 'repeats'
+    """
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return {'min': min(timings), 'median': statistics.median(timings), 'mean': statistics.mean(timings), 'repeats': repeats}
+
+
+def benchmarkConfiguration(currencies, density, cycleLengths, repeats=5, seed=0):
+    """
+    Times every stage of the detection on one synthetic market.
+
+    RETURN
+    ------
+    - (dict): the configuration, the size of the market and the timings of each stage (see timeStage)
+    """
+    market = SyntheticMarket(currencies, density, cycleLengths, seed=seed)
+    client = market.client()
+    graphObject = GraphConstructor(client, market.codes)
+    graph, orderBooks = graphObject.buildGraph()
+
+    components = ConnectedComponents(graph).getConnectedComponents()['components']
+    largest = max(components, key=lambda component: component['subGraph'].shape[0])['subGraph']
+
+    # The planted cycles, as vertex numbers, are the cycles that are sized
+    cycles = [[graphObject.nodesKey[code] for code in cycle] for cycle in market.cycles]
+
+    def collect():
+        return [ArbitrageDataCollector(client, graphObject.nodesKey, cycle, graphObject.edges, orderBooks, 0).extractArbitrageData()
+                for cycle in cycles]
+
+    def size():
+        for legs in collect():
+            arbitrage = Arbitrage(legs)
+            adjustedSizes = arbitrage.adjustOrderSizeForBaseTickSize(arbitrage.calculateMaximumOrderSize())
+            arbitrage.checkNotionalMinimumLimit(adjustedSizes)
+            arbitrage.calculateProfit(adjustedSizes)
+
+    def sizeBatch():
+        batch = BatchArbitrage.fromLegs(collect())
+        adjustedSizes = batch.adjustOrderSizeForBaseTickSize(batch.calculateMaximumOrderSize())
+        batch.checkNotionalMinimumLimit(adjustedSizes)
+        batch.calculateProfit(adjustedSizes)
+
+    detector = BellmanFordAlgorithm(largest)
+    detector.getANegativeCycle()
+    if len(cycleLengths) != 0 and len(detector.negativeCycle) == 0:
+        raise AssertionError('No negative cycle found in a market with planted cycles.')
+
+    return {'currencies': currencies, 'density': density, 'cycleLengths': list(cycleLengths), 'pairs': len(market.pairs),
+            'largestComponent': int(largest.shape[0]),
+            'stages': {'buildGraph': timeStage(graphObject.buildGraph, repeats),
+                       'connectedComponents': timeStage(lambda: ConnectedComponents(graph).getConnectedComponents(), repeats),
+                       'bellmanFord': timeStage(lambda: BellmanFordAlgorithm(largest).getANegativeCycle(), repeats),
+                       'sizing': timeStage(size, repeats),
+                       'batchSizing': timeStage(sizeBatch, repeats)}}
+
+
+def _gitCommit():
+    """ Commit of the working tree, None if it is not a git repository. """
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(configurations=CONFIGURATIONS, repeats=5, seed=0, output='benchmark_results.json'):
+    """
+    Runs every configuration, prints the median time of each stage and writes all results as JSON.
+
+    RETURN
+    ------
+    - report (dict): 'metadata' (versions, commit, time, seed) and 'results' (see benchmarkConfiguration)
+    """
+    report = {'metadata': {'python': platform.python_version(), 'numpy': np.__version__, 'platform': platform.platform(),
+                           'commit': _gitCommit(), 'time': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+                           'seed': seed, 'repeats': repeats},
+              'results': []}
+
+    print('{:>10} {:>7} {:>9} {:>6}  {}'.format('currencies', 'density', 'cycles', 'pairs', '  '.join(
+        '{:>19}'.format(stage + ' (ms)') for stage in ('buildGraph', 'connectedComponents', 'bellmanFord', 'sizing', 'batchSizing'))))
+    for currencies, density, cycleLengths in configurations:
+        result = benchmarkConfiguration(currencies, density, cycleLengths, repeats, seed)
+        report['results'].append(result)
+        print('{:>10} {:>7} {:>9} {:>6}  {}'.format(currencies, density, ','.join(map(str, cycleLengths)), result['pairs'], '  '.join(
+            '{:>19.3f}'.format(timing['median'] * 1e3) for timing in result['stages'].values())))
+
+    if output is not None:
+        with open(output, 'w') as file:
+            json.dump(report, file, indent=2)
+        print('Results written to {}.'.format(output))
+
+    return report
+
+
+def compare(baseline, current, threshold=1.2):
+    """
+    Compares the median times of two reports and prints every stage that has become slower than the threshold allows.
+
+    PARAMETERS
+    ----------
+    - baseline (dict): report of the previous version
+    - current (dict): report of the current version
+    - threshold (float): ratio of current to baseline median time above which a stage is reported as a regression
+
+    RETURN
+    ------
+    - regressions (list): (configuration, stage, ratio) of every regression
+    """
+    def key(result):
+        return result['currencies'], result['density'], tuple(result['cycleLengths'])
+
+    baselineResults = dict([(key(result), result) for result in baseline['results']])
+    regressions = []
+
+    for result in current['results']:
+        if key(result) not in baselineResults:
+            continue
+        for stage, timing in result['stages'].items():
+            previous = baselineResults[key(result)]['stages'].get(stage)
+            if previous is not None and timing['median'] > threshold * previous['median']:
+                regressions.append((key(result), stage, timing['median'] / previous['median']))
+
+    for configuration, stage, ratio in regressions:
+        print('Regression: {} on {} currencies, density {}, cycles {} is {:.2f}x slower.'.format(stage, *configuration, ratio))
+    if len(regressions) == 0:
+        print('No regression above {:.0f}%.'.format((threshold - 1) * 100))
+
+    return regressions
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Micro-benchmarks of the detection stages on synthetic markets.')
+    parser.add_argument('--output', default='benchmark_results.json', help='JSON file to write the results to')
+    parser.add_argument('--compare', help='JSON results of a previous version to compare against')
+    parser.add_argument('--threshold', type=float, default=1.2, help='slowdown ratio reported as a regression')
+    parser.add_argument('--repeats', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--quick', action='store_true', help='only run the small configurations')
+    arguments = parser.parse_args()
+
+    report = run(QUICK_CONFIGURATIONS if arguments.quick else CONFIGURATIONS, arguments.repeats, arguments.seed, arguments.output)
+    if arguments.compare is not None:
+        with open(arguments.compare) as file:
+            compare(json.load(file), report, arguments.threshold)
@@ -0,0 +1,79 @@
+"""
+Brief: Scans a whole stand-in exchange of hundreds of currencies and reports every scan against a latency budget.
+Description: The stand-in server (see stand_in_exchange_server.py) lists a sparse synthetic market, as a real exchange does:
+             every currency is quoted against a few others only. The scanner discovers the tradable universe from the product
+             catalog, without a currency list, and scans it back to back. The fetch, detection and total time of every scan are
+             printed against the budget, followed by the detection time alone on larger synthetic markets, where no network
+             is involved.
+             Run from the repository root with: python -m benchmarks.benchmark_universe [--currencies 300 --budget 1.0]
+"""
+
+import argparse
+from contextlib import redirect_stdout
+import io
+import time
+
+import numpy as np
+
+from clients.base.request_scheduler import RequestScheduler
+from clients.coinbase.coinbase_client import CoinbaseClient
+from graph_constructor import GraphConstructor
+from main_implementation import findNegativeCycles, runScanner
+from strongly_connected_components import ConnectedComponents
+from benchmarks.stand_in_exchange_server import StandInExchangeServer
+from benchmarks.synthetic_market import SyntheticMarket
+
+
+def scanUniverse(currencies=300, pairsPerCurrency=3.0, budget=1.0, scans=5, maxWorkers=32, detector='spfa', latency=0.0):
+    density = min(1.0, 2 * pairsPerCurrency / (currencies - 1))
+    with StandInExchangeServer(currencies, density, latency=latency, mispricingRate=0.01) as server:
+        with redirect_stdout(io.StringIO()):
+            client = CoinbaseClient(api_url=server.url, maxWorkers=maxWorkers, scheduler=RequestScheduler())  # The server has no rate limit
+            timings = runScanner(client, None, detector=detector, interval=None,
+                                 maxScans=scans, latencyBudget=budget)
+        pairs = len(server.products)
+
+    print('Whole exchange: {} currencies, {} pairs, {} worker threads, detector {}, budget {:.0f} ms.'.format(
+        currencies, pairs, maxWorkers, detector, budget * 1000))
+    print('{:>5} {:>11} {:>15} {:>11} {:>8} {:>14}'.format('scan', 'fetch (ms)', 'detection (ms)', 'total (ms)', 'budget', 'opportunities'))
+    for timing in timings:
+        print('{:>5} {:>11.1f} {:>15.1f} {:>11.1f} {:>8} {:>14}'.format(
+            timing['scan'], timing['fetch'] * 1000, timing['detection'] * 1000, timing['total'] * 1000,
+            'within' if timing['withinBudget'] else 'OVER', timing['opportunities']))
+
+
+def detectionAtScale(sizes=(300, 1000, 3000), pairsPerCurrency=3.0, detector='spfa', repeats=3):
+    print('{:>11} {:>7} {:>11} {:>15}'.format('currencies', 'pairs', 'scc (ms)', 'detection (ms)'))
+    for currencies in sizes:
+        market = SyntheticMarket(currencies, min(1.0, 2 * pairsPerCurrency / (currencies - 1)), (3, 4, 5), seed=0)
+        client = market.client()
+        graph = GraphConstructor(client, market.codes, pairs=market.pairs).buildGraph()[0]
+
+        start = time.perf_counter()
+        connectedComponentsObject = ConnectedComponents(graph)
+        connectedComponentsObject.getConnectedComponents()
+        scc = time.perf_counter() - start
+
+        timings = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            findNegativeCycles(graph, detector, connectedComponentsObject)
+            timings.append(time.perf_counter() - start)
+        print('{:>11} {:>7} {:>11.1f} {:>15.1f}'.format(currencies, len(market.pairs), scc * 1000, np.median(timings) * 1000))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Whole-exchange scanning against a latency budget.')
+    parser.add_argument('--currencies', type=int, default=300)
+    parser.add_argument('--pairs-per-currency', type=float, default=3.0, help='average number of pairs quoting each currency')
+    parser.add_argument('--budget', type=float, default=1.0, help='latency budget of a scan in seconds')
+    parser.add_argument('--scans', type=int, default=5)
+    parser.add_argument('--workers', type=int, default=32, help='worker threads of the client')
+    parser.add_argument('--detector', choices=['bellman-ford', 'spfa'], default='spfa')
+    parser.add_argument('--latency', type=float, default=0.0, help='seconds added to every response of the server')
+    arguments = parser.parse_args()
+
+    scanUniverse(arguments.currencies, arguments.pairs_per_currency, arguments.budget, arguments.scans, arguments.workers,
+                 arguments.detector, arguments.latency)
+    print()
+    detectionAtScale(pairsPerCurrency=arguments.pairs_per_currency, detector=arguments.detector)
@@ -0,0 +1,79 @@
+"""
+Brief: Measures the time to the first scan of a scanner started cold, warm and with a stale metadata file.
+Description: A cold start fetches the product and currency listings from the stand-in server (see stand_in_exchange_server.py)
+             before the first snapshot. A warm start reads them from the metadata file written by a previous run (see
+             MetadataStore), and a stale start reads a file older than the metadata TTL and fetches newer listings in the
+             background while the first scan runs. The time from the creation of the client to the end of the first scan is
+             reported with the number of requests sent before the first scan was done.
+             Run from the repository root with: python -m benchmarks.benchmark_warm_start [--currencies 300 --latency 0.2]
+"""
+
+import argparse
+from contextlib import redirect_stdout
+import io
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from clients.base.request_scheduler import RequestScheduler
+from clients.coinbase.coinbase_client import CoinbaseClient
+from clients.coinbase.metadata_store import MetadataStore
+from main_implementation import runScanner
+from benchmarks.stand_in_exchange_server import StandInExchangeServer
+
+
+def timeToFirstScan(url, path, maxWorkers, metadataTTL=3600):
+    """
+    RETURN
+    ------
+    - seconds (float): time from the creation of the client to the end of the first scan
+    - requests (int): requests sent until then, including those of a background refresh of the catalog
+    """
+    start = time.perf_counter()
+    with redirect_stdout(io.StringIO()):
+        client = CoinbaseClient(api_url=url, metadataTTL=metadataTTL, maxWorkers=maxWorkers, scheduler=RequestScheduler(),
+                                metadataPath=path)
+        runScanner(client, None, interval=None, maxScans=1)
+    seconds = time.perf_counter() - start
+    requests = client.coinbaseClient.getRequestStats()['requests']
+    client.waitForCatalogRefresh()
+    return seconds, requests
+
+
+def compareStarts(currencies=300, pairsPerCurrency=3.0, latency=0.2, maxWorkers=32, repeats=3):
+    density = min(1.0, 2 * pairsPerCurrency / (currencies - 1))
+    results = dict((start, []) for start in ('cold', 'warm', 'stale'))
+
+    with StandInExchangeServer(currencies, density, latency=latency) as server, tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'metadata.sqlite')
+        store = MetadataStore(path)
+        for _ in range(repeats):
+            if os.path.exists(path):
+                os.remove(path)
+            results['cold'].append(timeToFirstScan(server.url, path, maxWorkers))
+            results['warm'].append(timeToFirstScan(server.url, path, maxWorkers))
+
+            catalog, fetchedAt = store.load(server.url)
+            store.save(catalog, server.url, fetchedAt - 7200)  # Older than the TTL of one hour
+            results['stale'].append(timeToFirstScan(server.url, path, maxWorkers))
+        pairs = len(server.products)
+
+    print('Whole exchange: {} currencies, {} pairs, {:.0f} ms per response, {} worker threads, {} runs.'.format(
+        currencies, pairs, latency * 1000, maxWorkers, repeats))
+    print('{:>6} {:>26} {:>10}'.format('start', 'time to first scan (ms)', 'requests'))
+    for start, runs in results.items():
+        print('{:>6} {:>26.1f} {:>10}'.format(start, np.median([run[0] for run in runs]) * 1000, runs[-1][1]))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Time to the first scan with and without a metadata file.')
+    parser.add_argument('--currencies', type=int, default=300)
+    parser.add_argument('--pairs-per-currency', type=float, default=3.0, help='average number of pairs quoting each currency')
+    parser.add_argument('--latency', type=float, default=0.2, help='seconds added to every response of the server')
+    parser.add_argument('--workers', type=int, default=32, help='worker threads of the client')
+    parser.add_argument('--repeats', type=int, default=3)
+    arguments = parser.parse_args()
+
+    compareStarts(arguments.currencies, arguments.pairs_per_currency, arguments.latency, arguments.workers, arguments.repeats)
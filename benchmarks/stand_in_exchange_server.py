@@ -0,0 +1,201 @@
+"""
+Brief: Local stand-in for the Coinbase Pro REST API, for end-to-end load testing without touching the exchange.
+Description: The server serves /time, /currencies, /currencies/{id}, /products, /products/{id} and /products/{id}/book in
+             the JSON shapes that CoinbaseInterface expects. The listed pairs are those of a seeded synthetic market (see
+             synthetic_market.py). Fair prices follow a random walk in time, and a book can be quoted away from its fair price
+             now and then, which opens short-lived arbitrages.
+             Network conditions are configurable: latency with jitter, a rate of internal server errors and a rate limit
+             (token bucket) answered with 429 responses. The server runs its own event loop in a background thread, so that it
+             can be used by the synchronous clients of the program.
+"""
+
+import asyncio
+import datetime
+import threading
+import time
+
+import numpy as np
+from aiohttp import web
+
+from benchmarks.synthetic_market import SyntheticMarket
+
+
+class StandInExchangeServer:
+    """ Local stand-in for the exchange REST API with configurable network conditions and evolving prices. """
+
+    def __init__(self, currencies=20, density=1.0, latency=0.0, jitter=0.0, errorRate=0.0, rateLimit=None, burst=None,
+                 volatility=0.001, spread=0.001, levels=10, mispricingRate=0.0, mispricing=0.005, seed=0):
+        """
+        PARAMETERS
+        ----------
+        - currencies (int): number of currencies listed
+        - density (float): probability that a pair of currencies is listed
+        - latency (float): seconds added to every response
+        - jitter (float): maximum number of seconds added at random to the latency of every response
+        - errorRate (float): probability that a request is answered with an internal server error (500)
+        - rateLimit (float/None): requests per second allowed, None for no limit; excess requests are answered with 429
+        - burst (int/None): number of requests that can be made at once within the rate limit, by default one second's worth
+        - volatility (float): standard deviation of the log price of every currency over one second
+        - spread (float): relative distance of the best bid and ask from the fair price
+        - levels (int): number of levels on each side of a level 2 order book
+        - mispricingRate (float): probability that an order book is quoted away from the fair price
+        - mispricing (float): relative distance from the fair price of a mispriced order book
+        - seed (int): seed of the random number generator
+        """
+        market = SyntheticMarket(currencies, density, seed=seed)
+        self.codes = market.codes  # Listed currency codes
+        self.products = dict([('{}-{}'.format(*pair), pair) for pair in market.pairs])  # { product id: (BASE, QUOTE) }
+
+        self.latency = latency
+        self.jitter = jitter
+        self.errorRate = errorRate
+        self.rateLimit = rateLimit
+        self.burst = burst if burst is not None else max(1, int(rateLimit or 1))
+        self.volatility = volatility
+        self.spread = spread
+        self.levels = levels
+        self.mispricingRate = mispricingRate
+        self.mispricing = mispricing
+
+        self.generator = np.random.default_rng(seed)
+        self.logPrices = dict(zip(self.codes, self.generator.normal(0, 1, currencies)))  # Fair log price of each currency
+        self.stats = {'requests': 0, 'throttled': 0, 'errors': 0}  # Counters of the requests answered
+        self.url = None  # http:// URL of the server once started
+
+        self._tokens = float(self.burst)
+        self._lastRefill = None
+        self._lastMove = None
+        self._sequence = 0
+        self._loop = None
+        self._runner = None
+        self._thread = None
+
+    # --------------------------------------------------------------------------------------------------------- market state
+
+    def _movePrices(self):
+        """ Moves the fair prices forward to the current time. """
+        now = time.monotonic()
+        if self._lastMove is not None:
+            scale = self.volatility * np.sqrt(now - self._lastMove)
+            for code, move in zip(self.codes, self.generator.normal(0, scale, len(self.codes))):
+                self.logPrices[code] += move
+        self._lastMove = now
+
+    def _orderBook(self, pair, level):
+        """ Quotes an order book around the current fair price. """
+        self._movePrices()
+        mid = np.exp(self.logPrices[pair[0]] - self.logPrices[pair[1]])
+        if self.generator.random() < self.mispricingRate:
+            mid *= 1 + self.mispricing * self.generator.choice([-1, 1])
+
+        depth = self.levels if level == 2 else 1
+        steps = 1 + np.arange(depth) * self.spread
+        sizes = self.generator.uniform(0.1, 5, (2, depth))
+        self._sequence += 1
+
+        return {'bids': [['{:.10g}'.format(mid * (1 - self.spread) / step), '{:.8f}'.format(size), 1]
+                         for step, size in zip(steps, sizes[0])],
+                'asks': [['{:.10g}'.format(mid * (1 + self.spread) * step), '{:.8f}'.format(size), 1]
+                         for step, size in zip(steps, sizes[1])],
+                'sequence': self._sequence}
+
+    @staticmethod
+    def _product(productId, pair):
+        return {'id': productId, 'base_currency': pair[0], 'quote_currency': pair[1], 'base_increment': '0.00000001',
+                'quote_increment': '0.00000001', 'min_market_funds': '0.00001', 'status': 'online', 'trading_disabled': False}
+
+    @staticmethod
+    def _currency(code):
+        return {'id': code, 'name': code, 'min_size': '0.00000001', 'status': 'online', 'details': {}}
+
+    # ------------------------------------------------------------------------------------------------------------- handlers
+
+    async def _handleTime(self, request):
+        now = time.time()
+        return web.json_response({'iso': datetime.datetime.fromtimestamp(now, datetime.timezone.utc).isoformat(), 'epoch': now})
+
+    async def _handleCurrencies(self, request):
+        return web.json_response([self._currency(code) for code in self.codes])
+
+    async def _handleCurrency(self, request):
+        code = request.match_info['currency']
+        if code not in self.logPrices:
+            return web.json_response({'message': 'NotFound'}, status=404)
+        return web.json_response(self._currency(code))
+
+    async def _handleProducts(self, request):
+        return web.json_response([self._product(productId, pair) for productId, pair in self.products.items()])
+
+    async def _handleProduct(self, request):
+        productId = request.match_info['product']
+        if productId not in self.products:
+            return web.json_response({'message': 'NotFound'}, status=404)
+        return web.json_response(self._product(productId, self.products[productId]))
+
+    async def _handleOrderBook(self, request):
+        productId = request.match_info['product']
+        if productId not in self.products:
+            return web.json_response({'message': 'NotFound'}, status=404)
+        return web.json_response(self._orderBook(self.products[productId], int(request.query.get('level', 1))))
+
+    @web.middleware
+    async def _networkConditions(self, request, handler):
+        """ Applies the rate limit, the latency and the error rate to every request. """
+        self.stats['requests'] += 1
+
+        if self.rateLimit is not None:
+            now = time.monotonic()
+            if self._lastRefill is not None:
+                self._tokens = min(self.burst, self._tokens + (now - self._lastRefill) * self.rateLimit)
+            self._lastRefill = now
+            if self._tokens < 1:
+                self.stats['throttled'] += 1
+                return web.json_response({'message': 'Public rate limit exceeded'}, status=429)
+            self._tokens -= 1
+
+        delay = self.latency + (self.generator.uniform(0, self.jitter) if self.jitter else 0)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        if self.errorRate and self.generator.random() < self.errorRate:
+            self.stats['errors'] += 1
+            return web.json_response({'message': 'Internal server error'}, status=500)
+
+        return await handler(request)
+
+    # -------------------------------------------------------------------------------------------------------------- running
+
+    async def _start(self):
+        app = web.Application(middlewares=[self._networkConditions])
+        app.router.add_get('/time', self._handleTime)
+        app.router.add_get('/currencies', self._handleCurrencies)
+        app.router.add_get('/currencies/{currency}', self._handleCurrency)
+        app.router.add_get('/products', self._handleProducts)
+        app.router.add_get('/products/{product}', self._handleProduct)
+        app.router.add_get('/products/{product}/book', self._handleOrderBook)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, '127.0.0.1', 0)
+        await site.start()
+        self.url = 'http://127.0.0.1:{}'.format(self._runner.addresses[0][1])
+
+    def start(self):
+        """ Starts the server in a background thread and returns once it accepts connections. """
+        self._loop = asyncio.new_event_loop()
+        self._loop.run_until_complete(self._start())
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """ Stops the server and its thread. """
+        asyncio.run_coroutine_threadsafe(self._runner.cleanup(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exception):
+        self.stop()
@@ -0,0 +1,122 @@
+"""
+Brief: Seeded generator of synthetic exchange markets for benchmarks.
+Description: Currencies get random fair log prices. Each pair of currencies is listed with the given probability (the edge
+             density) and quoted at its fair price with a bid/ask spread, so the market is free of arbitrage. Negative cycles
+             of chosen lengths are then planted on disjoint sets of currencies by moving the best bid up (or the best ask down)
+             along the cycle until the cycle makes the chosen log-return.
+             The market is served by SyntheticExchangeClient, which implements the parts of the CoinbaseClient interface used
+             by main_implementation without any network access.
+"""
+
+import numpy as np
+
+
+class SyntheticMarket:
+    """ Synthetic exchange with planted arbitrage cycles. """
+
+    def __init__(self, currencies, density=1.0, cycleLengths=(), profit=0.001, spread=0.001, quantity=(0.1, 5.0), seed=0):
+        """
+        PARAMETERS
+        ----------
+        - currencies (int): number of currencies
+        - density (float): probability that a pair of currencies is listed, between 0 and 1
+        - cycleLengths (tuple): length of each planted negative cycle; the cycles use disjoint sets of currencies
+        - profit (float): log-return of each planted cycle; must be below length * spread so that no order book is crossed
+        - spread (float): relative distance of the best bid and ask from the fair price
+        - quantity (tuple): range of the quantities at the best bid and ask
+        - seed (int): seed of the random number generator
+        """
+        if sum(cycleLengths) > currencies:
+            raise ValueError('The planted cycles need {} currencies, but there are only {}.'.format(sum(cycleLengths), currencies))
+        if any(length < 3 or profit >= length * spread for length in cycleLengths):
+            raise ValueError('Planted cycles must have 3 or more currencies and a profit below length * spread.')
+
+        generator = np.random.default_rng(seed)
+        self.codes = ['C{}'.format(index) for index in range(currencies)]  # Currency codes
+        logPrices = generator.normal(0, 1, currencies)
+
+        # Planted cycles, as vertex numbers
+        order = generator.permutation(currencies)
+        cycles = []
+        for length in cycleLengths:
+            cycles.append([int(vertex) for vertex in order[:length]])
+            order = order[length:]
+
+        # Listed pairs; the base of a pair is the currency with the lower vertex number
+        listed = np.triu(generator.random((currencies, currencies)) < density, 1)
+        for cycle in cycles:
+            for index, vertex in enumerate(cycle):
+                following = cycle[(index + 1) % len(cycle)]
+                listed[min(vertex, following), max(vertex, following)] = True
+
+        self.orderBooks = {}  # { (BASE, QUOTE): { 'bids': [[price, size, orders]], 'asks': [[price, size, orders]] } }
+        bids, asks = {}, {}
+        for base, quote in zip(*np.nonzero(listed)):
+            mid = np.exp(logPrices[base] - logPrices[quote])
+            bids[(base, quote)], asks[(base, quote)] = mid * (1 - spread), mid * (1 + spread)
+
+        for cycle in cycles:
+            # Trading along the cycle sells at the bid (base --> quote) or buys at the ask (quote --> base)
+            legs = [(vertex, cycle[(index + 1) % len(cycle)]) for index, vertex in enumerate(cycle)]
+            logReturn = sum(np.log(bids[leg]) if leg in bids else -np.log(asks[leg[::-1]]) for leg in legs)
+            shift = (profit - logReturn) / len(legs)
+            for leg in legs:
+                if leg in bids:
+                    bids[leg] *= np.exp(shift)
+                else:
+                    asks[leg[::-1]] /= np.exp(shift)
+
+        for pair in bids:
+            sizes = generator.uniform(quantity[0], quantity[1], 2)
+            self.orderBooks[(self.codes[pair[0]], self.codes[pair[1]])] = {
+                'bids': [['{:.12g}'.format(bids[pair]), '{:.8f}'.format(sizes[0]), 1]],
+                'asks': [['{:.12g}'.format(asks[pair]), '{:.8f}'.format(sizes[1]), 1]]}
+
+        self.pairs = list(self.orderBooks)  # [(BASE, QUOTE), ..., (BASE, QUOTE)]
+        self.cycles = [[self.codes[vertex] for vertex in cycle] for cycle in cycles]  # Planted cycles as currency codes
+
+    def client(self):
+        """
+        RETURN
+        ------
+        - (SyntheticExchangeClient): client serving the order books of the market
+        """
+        return SyntheticExchangeClient(self)
+
+
+class SyntheticExchangeClient:
+    """ Exchange client serving the order books of a synthetic market. """
+
+    def __init__(self, market):
+        self.market = market
+
+    def checkCurrenciesExistence(self, currencies):
+        pass
+
+    def getCurrencyPairs(self, currencies):
+        currencies = set(currencies)
+        return [pair for pair in self.market.pairs if pair[0] in currencies and pair[1] in currencies]
+
+    def getTradableUniverse(self):
+        return list(self.market.codes), list(self.market.pairs)
+
+    def getOrderBook(self, base, quote, level=1):
+        return self.market.orderBooks[(base, quote)]
+
+    def getOrderBooks(self, pairs, level=1):
+        return dict([(pair, self.market.orderBooks[pair]) for pair in pairs])
+
+    @staticmethod
+    def getFees(tradedVolume):
+        return '0'
+
+    @staticmethod
+    def getBasePrecision(base, quote):
+        return -8
+
+    @staticmethod
+    def getNotionalMinLimit(base, quote):
+        return '0.00001'
+
+    def closeSession(self):
+        pass
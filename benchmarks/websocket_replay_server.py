@@ -0,0 +1,54 @@
+"""
+Brief: Local stand-in for the Coinbase Pro WebSocket feed that replays recorded messages.
+Description: Recorded messages are stored one JSON object per line. After a client subscribes, every message of a subscribed
+             product is sent in order, optionally spaced by a fixed interval, and the connection is closed.
+"""
+
+import asyncio
+import json
+
+from aiohttp import web
+
+
+def loadMessages(path):
+    """ Reads recorded feed messages from a JSON lines file. """
+    with open(path) as file:
+        return [json.loads(line) for line in file if line.strip()]
+
+
+class ReplayWebSocketServer:
+    """ Replays recorded feed messages to every client that subscribes. """
+
+    def __init__(self, messages, interval=0):
+        self.messages = messages  # Recorded feed messages (list of dict)
+        self.interval = interval  # Seconds between two messages (float)
+        self.url = None  # ws:// URL of the server once started
+        self._runner = None
+
+    async def _handle(self, request):
+        websocket = web.WebSocketResponse()
+        await websocket.prepare(request)
+
+        subscription = json.loads((await websocket.receive()).data)
+        productIds = set(subscription['product_ids'])
+
+        for message in self.messages:
+            if message.get('product_id') in productIds:
+                await websocket.send_str(json.dumps(message))
+                if self.interval:
+                    await asyncio.sleep(self.interval)
+
+        await websocket.close()
+        return websocket
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_get('/', self._handle)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, '127.0.0.1', 0)
+        await site.start()
+        self.url = 'ws://127.0.0.1:{}/'.format(self._runner.addresses[0][1])
+
+    async def stop(self):
+        await self._runner.cleanup()
@@ -0,0 +1,44 @@
+import asyncio
+
+import aiohttp
+
+from metrics import METRICS, endpointTemplate
+
+
+class AsyncBaseClient(object):
+    """ Base asyncio client class. At most `concurrency` requests are in flight at any time. """
+
+    def __init__(self, api_url, concurrency=10):
+        self.url = api_url
+        self.concurrency = concurrency
+        self.session = None  # aiohttp.ClientSession, created inside the running event loop on first request
+        self._semaphore = None
+
+    def _getSession(self):
+        if self.session is None:
+            self.session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30))
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        return self.session
+
+    async def _send_message(self, method, endpoint, params=None, data=None):
+        """Send API request. Returns a dict/list - JSON response. The request is timed into the metrics """
+
+        session = self._getSession()
+        url = self.url + endpoint
+        async with self._semaphore:
+            with METRICS.timer('http_request_seconds', method=method.upper(), endpoint=endpointTemplate(endpoint)):
+                try:
+                    async with session.request(method, url, params=params, data=data) as r:
+                        METRICS.increment('http_requests', status=r.status)
+                        return await r.json(content_type=None)
+                except aiohttp.ClientError:
+                    METRICS.increment('http_requests', status='error')
+                    raise
+
+    async def send_message(self, method, endpoint, params=None, data=None):
+        return await self._send_message(method, endpoint, params, data)
+
+    async def close(self):
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
@@ -1,22 +1,90 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import time
+
 import requests
+from requests.adapters import HTTPAdapter
+
+from clients.base.request_scheduler import METADATA, RequestScheduler
+from metrics import METRICS, endpointTemplate
 
 
 class BaseClient(object):
     """ Base client class. """
 
-    def __init__(self, api_url):
+    def __init__(self, api_url, maxWorkers=None, scheduler=None):
         self.url = api_url
         self.session = requests.Session()
+        self.scheduler = scheduler if scheduler is not None else RequestScheduler()  # Rate limit and retries of the requests
+        self.maxWorkers = maxWorkers  # Number of threads used by send_messages, None to send batches sequentially
+        self.batchLatencies = deque(maxlen=1000)  # Wall-clock seconds taken by the most recent batches
+        self._executor = None
+
+        if maxWorkers is not None:
+            # One keep-alive connection per worker thread, so that connections are reused under concurrency
+            adapter = HTTPAdapter(pool_connections=maxWorkers, pool_maxsize=maxWorkers)
+            self.session.mount('https://', adapter)
+            self.session.mount('http://', adapter)
+            self._executor = ThreadPoolExecutor(max_workers=maxWorkers)
 
-    def _send_message(self, method, endpoint, params=None, data=None):
-        """Send API request. Returns a dict/list - JSON response """
+    def _send_message(self, method, endpoint, params=None, data=None, priority=METADATA):
+        """Send API request. Returns a dict/list - JSON response. The request is paced by the scheduler, and retried with
+        backoff on 429 and 5xx responses; an HTTPError is raised once the retries are exhausted. Other error responses, e.g.
+        404, are returned as JSON. Every attempt is timed into the metrics """
 
         url = self.url + endpoint
-        r = self.session.request(method, url, params=params, data=data, timeout=30)
-        return r.json()
+        for attempt in range(self.scheduler.maxRetries + 1):
+
+            self.scheduler.acquire(priority)
+            with METRICS.timer('http_request_seconds', method=method.upper(), endpoint=endpointTemplate(endpoint)):
+                try:
+                    r = self.session.request(method, url, params=params, data=data, timeout=30)
+                except requests.RequestException:
+                    METRICS.increment('http_requests', status='error')
+                    raise
+            METRICS.increment('http_requests', status=r.status_code)
+
+            if not self.scheduler.isRetryable(r.status_code):
+                return r.json()
+
+            retryAfter = self._getRetryAfter(r)
+            if r.status_code == 429:
+                self.scheduler.recordThrottled(retryAfter)
+                METRICS.increment('http_throttled')
+
+            if attempt < self.scheduler.maxRetries:
+                self.scheduler.recordRetry()
+                METRICS.increment('http_retries')
+                time.sleep(self.scheduler.backoff(attempt, retryAfter))
+
+        self.scheduler.recordFailure()
+        r.raise_for_status()
+
+    @staticmethod
+    def _getRetryAfter(response):
+        """ RETURN: (float/None) seconds given by the Retry-After header of a response, None if absent or not in seconds """
+        try:
+            return float(response.headers['Retry-After'])
+        except (KeyError, ValueError):
+            return None
+
+    def send_message(self, method, endpoint, params=None, data=None, priority=METADATA):
+        return self._send_message(method, endpoint, params, data, priority)
+
+    def send_messages(self, messages, priority=METADATA):
+        """Send a batch of API requests, concurrently if the client has worker threads.
+        Takes a list of (method, endpoint, params) tuples. Returns a list of JSON responses in the same order """
 
-    def send_message(self, method, endpoint, params=None, data=None):
-        return self._send_message(method, endpoint, params, data)
+        start = time.perf_counter()
+        if self._executor is None:
+            responses = [self._send_message(method, endpoint, params, priority=priority) for method, endpoint, params in messages]
+        else:
+            responses = list(self._executor.map(lambda message: self._send_message(*message, priority=priority), messages))
+        self.batchLatencies.append(time.perf_counter() - start)
+        return responses
 
     def close(self):
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
         self.session.close()
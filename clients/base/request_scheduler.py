@@ -0,0 +1,138 @@
+"""
+Brief: This script contains a scheduler that paces the requests sent to an exchange and retries the failed ones.
+Description: A token bucket allows `rate` requests per second on average with bursts of up to `burst` requests, matching the
+             public rate limit of the exchange. Requests waiting for a token are served by priority lane, then in order of
+             arrival, so that order books go ahead of metadata requests when the bucket is empty.
+             Responses 429 (rate limit exceeded) and 5xx (server errors) are retried after a jittered exponential backoff
+             ('full jitter': a random delay between 0 and base * 2^attempt seconds, capped), or after the Retry-After delay of
+             the response if longer. A 429 also empties the bucket, so that the other threads slow down too.
+             https://docs.cloud.coinbase.com/exchange/docs/rate-limits
+"""
+
+import heapq
+import itertools
+import random
+import threading
+import time
+
+# Priority lanes; a lower number is served first
+ORDER_BOOK = 0
+METADATA = 1
+
+
+class RequestScheduler:
+    """ Token bucket with priority lanes, and retry policy for throttled and failed requests. """
+
+    def __init__(self, rate=None, burst=None, maxRetries=3, backoffBase=0.25, backoffCap=8.0, seed=None):
+        """
+        PARAMETERS
+        ----------
+        - rate (float/None): requests per second allowed on average, None for no limit
+        - burst (int/None): number of requests that can be sent at once, by default one second's worth
+        - maxRetries (int): number of times a throttled or failed request is sent again before giving up
+        - backoffBase (float): seconds of the backoff before the first retry, doubled at every attempt
+        - backoffCap (float): maximum seconds of a backoff
+        - seed (int/None): seed of the random number generator of the jitter
+        """
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1, int(rate or 1))
+        self.maxRetries = maxRetries
+        self.backoffBase = backoffBase
+        self.backoffCap = backoffCap
+        self.stats = {'requests': 0, 'delayed': 0, 'throttled': 0, 'retried': 0, 'failed': 0}  # Counters of the requests
+
+        self._tokens = float(self.burst)
+        self._lastRefill = time.monotonic()
+        self._waiting = []  # Heap of the requests waiting for a token [(priority, ticket), ...]
+        self._tickets = itertools.count()
+        self._condition = threading.Condition()
+        self._random = random.Random(seed)
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._lastRefill) * self.rate)
+        self._lastRefill = now
+
+    def acquire(self, priority=METADATA):
+        """
+        Blocks until a request may be sent: a token is available and no request of a higher priority lane, or of the same
+        lane but queued earlier, is waiting.
+
+        PARAMETERS
+        ----------
+        - priority (int): priority lane of the request, ORDER_BOOK or METADATA
+        """
+        with self._condition:
+            self.stats['requests'] += 1
+            if self.rate is None:
+                return
+
+            entry = (priority, next(self._tickets))
+            heapq.heappush(self._waiting, entry)
+            delayed = False
+
+            while True:
+                self._refill()
+                if self._waiting[0] == entry and self._tokens >= 1:
+                    break
+                delayed = True
+                # The first request in line waits for its token, the others until they are first in line
+                self._condition.wait((1 - self._tokens) / self.rate if self._waiting[0] == entry else None)
+
+            heapq.heappop(self._waiting)
+            self._tokens -= 1
+            if delayed:
+                self.stats['delayed'] += 1
+            self._condition.notify_all()
+
+    @staticmethod
+    def isRetryable(status):
+        """ RETURN: (bool) True for the status codes of throttled requests (429) and server errors (5xx) """
+        return status == 429 or 500 <= status < 600
+
+    def recordThrottled(self, retryAfter=None):
+        """
+        Records a 429 response and empties the bucket, for at least the Retry-After delay if the exchange gave one.
+
+        PARAMETERS
+        ----------
+        - retryAfter (float/None): seconds the exchange asked to wait
+        """
+        with self._condition:
+            self.stats['throttled'] += 1
+            if self.rate is not None:
+                self._refill()
+                self._tokens = min(self._tokens, 0.0, -(retryAfter or 0) * self.rate)
+
+    def recordRetry(self):
+        with self._condition:
+            self.stats['retried'] += 1
+
+    def recordFailure(self):
+        """ Records a request that was given up after maxRetries retries. """
+        with self._condition:
+            self.stats['failed'] += 1
+
+    def backoff(self, attempt, retryAfter=None):
+        """
+        PARAMETERS
+        ----------
+        - attempt (int): number of retries already made for the request
+        - retryAfter (float/None): seconds the exchange asked to wait
+
+        RETURN
+        ------
+        - (float): seconds to wait before the next retry
+        """
+        delay = self._random.uniform(0, min(self.backoffCap, self.backoffBase * 2 ** attempt))
+        return max(delay, retryAfter or 0)
+
+    def getStats(self):
+        """
+        RETURN
+        ------
+        - (dict): { 'requests', 'delayed', 'throttled', 'retried', 'failed' } numbers of requests scheduled, delayed by the
+          token bucket, answered with 429, sent again, and given up
+        """
+        with self._condition:
+            return dict(self.stats)
@@ -0,0 +1,82 @@
+"""
+Brief: This script contains a bounded least-recently-used cache whose entries expire after a time-to-live.
+"""
+
+from collections import OrderedDict
+import time
+
+
+class TTLCache:
+    """ LRU cache with a time-to-live per entry and hit/miss counters. """
+
+    def __init__(self, ttl, maxSize, clock=time.monotonic):
+        self.ttl = ttl  # Seconds after which an entry expires (float/int)
+        self.maxSize = maxSize  # Maximum number of entries; the least recently used entry is evicted first (int)
+        self.clock = clock  # Function returning the current time in seconds
+        self.hits = 0  # Number of lookups served from the cache (int)
+        self.misses = 0  # Number of lookups of missing or expired entries (int)
+        self._entries = OrderedDict()  # { key: (expiry time, value), ... } ordered from least to most recently used
+
+    def get(self, key, default=None):
+        """
+        Get a cached value.
+
+        PARAMETERS
+        ----------
+        - key (hashable): key of the entry
+        - default (object): value returned if the entry is missing or has expired
+
+        RETURN
+        ------
+        - (object): cached value or default
+        """
+        entry = self._entries.get(key)
+
+        if entry is None or entry[0] <= self.clock():
+            if entry is not None:
+                del self._entries[key]  # Drop expired entry
+            self.misses += 1
+            return default
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, key, value):
+        """
+        Store a value, evicting the least recently used entry if the cache is full.
+
+        PARAMETERS
+        ----------
+        - key (hashable): key of the entry
+        - value (object): value to be cached
+        """
+        self._entries[key] = (self.clock() + self.ttl, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.maxSize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key=None):
+        """
+        Remove an entry, or all entries if no key is given.
+
+        PARAMETERS
+        ----------
+        - key (hashable/None): key of the entry
+        """
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+    def getStats(self):
+        """
+        RETURN
+        ------
+        - (dict): { 'hits': int, 'misses': int, 'size': int }
+        """
+        return {'hits': self.hits, 'misses': self.misses, 'size': len(self._entries)}
+
+    def __len__(self):
+        return len(self._entries)
@@ -0,0 +1,138 @@
+"""
+Brief: asyncio counterpart of coinbase_client.py.
+Description: Requests to the exchange are coroutines, so that many order books can be fetched concurrently.
+             Product metadata lookups are answered from the product catalog, which is loaded once with loadCatalog.
+"""
+
+import asyncio
+import time
+
+from clients.base.async_base_client import AsyncBaseClient
+from clients.coinbase.coinbase_client import CoinbaseClient
+from clients.coinbase.product_catalog import ProductCatalog
+
+
+class AsyncCoinbaseInterface:
+    # https://docs.cloud.coinbase.com/exchange/docs
+
+    def __init__(self, api_url="https://api.pro.coinbase.com", concurrency=10):
+        self._publicClient = AsyncBaseClient(api_url, concurrency)
+
+    async def getTime(self):
+        return await self._publicClient.send_message('get', '/time')
+
+    # https://api.exchange.coinbase.com/currencies
+    async def getCurrencies(self):
+        return await self._publicClient.send_message('get', '/currencies')
+
+    # https://api.exchange.coinbase.com/currencies/{currency_id}
+    async def getCurrency(self, currency_id):
+        return await self._publicClient.send_message('get', '/currencies/{}'.format(currency_id))
+
+    # https://api.exchange.coinbase.com/products
+    async def getProducts(self):
+        return await self._publicClient.send_message('get', '/products')
+
+    #  https://api.exchange.coinbase.com/products/{product_id}
+    async def getProduct(self, product_id):
+        return await self._publicClient.send_message('get', '/products/{}'.format(product_id))
+
+    # https://api.exchange.coinbase.com/products/{product_id}/book
+    async def getOrderBook(self, product_id, level=1):
+        return await self._publicClient.send_message('get', '/products/{}/book'.format(product_id), params={'level': level})
+
+    async def closeSession(self):
+        await self._publicClient.close()
+
+
+class AsyncCoinbaseClient(CoinbaseClient):
+    """ An asyncio Coinbase Pro client. Requests to the exchange are coroutines; metadata lookups are synchronous. """
+
+    def __init__(self, api_url="https://api.pro.coinbase.com", concurrency=10, metadataTTL=3600, metadataCacheSize=1024):
+        """
+        PARAMETERS
+        ----------
+        - api_url (str): base URL of the exchange REST API
+        - concurrency (int): maximum number of requests in flight at any time
+        - metadataTTL (float/int): seconds after which the product catalog and cached product metadata are refreshed
+        - metadataCacheSize (int): maximum number of products whose metadata is cached
+        """
+        super().__init__(metadataTTL, metadataCacheSize, api_url=api_url, maxWorkers=concurrency)
+
+    @staticmethod
+    def _createInterface(api_url, concurrency, scheduler=None):
+        return AsyncCoinbaseInterface(api_url, concurrency)
+
+    async def loadCatalog(self):
+        """
+        Fetches the product and currency listings concurrently and builds the product catalog, if it is missing or older than
+        the metadata time-to-live. Must be awaited before any metadata lookup.
+        """
+        if self._catalog is None or time.time() - self._catalogTime >= self.metadataTTL:
+            products, currencies = await asyncio.gather(self.coinbaseClient.getProducts(), self.coinbaseClient.getCurrencies())
+            self._catalog = ProductCatalog(products, currencies)
+            self._catalogTime = time.time()
+            self.metadataCache.invalidate()
+
+    def getCatalog(self):
+        """
+        Get the index of all products and currencies listed on the exchange, as loaded by loadCatalog.
+
+        RETURN
+        ------
+        - (ProductCatalog): product catalog
+        """
+        if self._catalog is None:
+            raise RuntimeError('The product catalog has not been loaded; await loadCatalog() first.')
+        return self._catalog
+
+    def getTradableUniverse(self):
+        """
+        Finds every online currency pair on the exchange, between online currencies, from the product catalog.
+
+        RETURN
+        ------
+        - currencies (list): currency codes in alphabetical order
+        - pairs (list): [(BASE, QUOTE), (BASE, QUOTE), ..., (BASE, QUOTE)]
+        """
+        return self.getCatalog().getTradableUniverse()
+
+    async def getTime(self):
+        """ Get server time. """
+        return await self.coinbaseClient.getTime()
+
+    async def getOrderBook(self, base, quote, level=1):
+        """ Get order book w.r.t. specified currency pair.
+
+        PARAMETERS
+        ----------
+        - base (str): base currency
+        - quote (str): quote currency
+        - level (int): 1 for the best bid/ask only, 2 for the aggregated depth of the book
+
+        RETURN
+        ------
+        - (dict): contains bid/ask levels - price, size and number of orders
+        """
+        return await self.coinbaseClient.getOrderBook(base + '-' + quote, level)
+
+    async def getOrderBooks(self, pairs, level=1):
+        """ Get order books w.r.t. several currency pairs concurrently.
+
+        PARAMETERS
+        ----------
+        - pairs (list): [(BASE, QUOTE), (BASE, QUOTE), ..., (BASE, QUOTE)]
+        - level (int): 1 for the best bid/ask only, 2 for the aggregated depth of the book
+
+        RETURN
+        ------
+        - (dict): { (BASE, QUOTE): { order book information }, ..., (BASE, QUOTE): { order book information } }
+        """
+        books = await asyncio.gather(*[self.getOrderBook(base, quote, level) for base, quote in pairs])
+        return dict(zip(pairs, books))
+
+    async def closeSession(self):
+        """
+        Closes session, or in other words, closes connection to the exchange.
+        """
+        await self.coinbaseClient.closeSession()
@@ -4,30 +4,67 @@ Website: https://exchange.coinbase.com/markets contains all relevant information
 """
 
 from clients.base.base_client import BaseClient
+from clients.base.request_scheduler import ORDER_BOOK, RequestScheduler
+from clients.base.ttl_cache import TTLCache
+from clients.coinbase.metadata_store import MetadataStore
+from clients.coinbase.product_catalog import ProductCatalog
+
+import threading
+import time
 
 import numpy as np
 
 
+# Public endpoints are limited to 10 requests per second per IP address, with bursts of up to 15 requests
+# https://docs.cloud.coinbase.com/exchange/docs/rate-limits
+PUBLIC_RATE_LIMIT = 10
+PUBLIC_BURST = 15
+
+
 class CoinbaseInterface:
     # https://docs.cloud.coinbase.com/exchange/docs
 
-    def __init__(self, api_url="https://api.pro.coinbase.com"):
-        self._publicClient = BaseClient(api_url)
+    def __init__(self, api_url="https://api.pro.coinbase.com", maxWorkers=None, scheduler=None):
+        if scheduler is None:
+            scheduler = RequestScheduler(PUBLIC_RATE_LIMIT, PUBLIC_BURST)
+        self._publicClient = BaseClient(api_url, maxWorkers, scheduler)
 
     def getTime(self):
         return self._publicClient.send_message('get', '/time')
 
+    # https://api.exchange.coinbase.com/currencies
+    def getCurrencies(self):
+        return self._publicClient.send_message('get', '/currencies')
+
     # https://api.exchange.coinbase.com/currencies/{currency_id}
     def getCurrency(self, currency_id):
         return self._publicClient.send_message('get', '/currencies/{}'.format(currency_id))
 
+    # https://api.exchange.coinbase.com/products
+    def getProducts(self):
+        return self._publicClient.send_message('get', '/products')
+
     #  https://api.exchange.coinbase.com/products/{product_id}
     def getProduct(self, product_id):
         return self._publicClient.send_message('get', '/products/{}'.format(product_id))
 
+    def getProductsById(self, product_ids):
+        return self._publicClient.send_messages([('get', '/products/{}'.format(product_id), None) for product_id in product_ids])
+
     # https://api.exchange.coinbase.com/products/{product_id}/book
     def getOrderBook(self, product_id, level=1):
-        return self._publicClient.send_message('get', '/products/{}/book'.format(product_id), params={'level': level})
+        return self._publicClient.send_message('get', '/products/{}/book'.format(product_id), params={'level': level},
+                                               priority=ORDER_BOOK)
+
+    def getOrderBooks(self, product_ids, level=1):
+        return self._publicClient.send_messages([('get', '/products/{}/book'.format(product_id), {'level': level})
+                                                 for product_id in product_ids], priority=ORDER_BOOK)
+
+    def getBatchLatencies(self):
+        return list(self._publicClient.batchLatencies)
+
+    def getRequestStats(self):
+        return self._publicClient.scheduler.getStats()
 
     def closeSession(self):
         self._publicClient.close()
@@ -36,26 +73,229 @@ class CoinbaseInterface:
 class CoinbaseClient:
     """ A Coinbase Pro client. """
 
-    def __init__(self):
-        self.coinbaseClient = CoinbaseInterface()
+    def __init__(self, metadataTTL=3600, metadataCacheSize=1024, api_url="https://api.pro.coinbase.com", maxWorkers=None,
+                 scheduler=None, metadataPath=None, metadataMaxAge=7 * 24 * 3600):
+        """
+        PARAMETERS
+        ----------
+        - metadataTTL (float/int): seconds after which the product catalog and cached product metadata are refreshed
+        - metadataCacheSize (int): maximum number of products whose metadata is cached
+        - api_url (str): base URL of the exchange REST API
+        - maxWorkers (int/None): number of threads used to fetch batches of order books, None to fetch them sequentially
+        - scheduler (RequestScheduler/None): rate limit and retry policy of the requests, by default the public rate limit of
+          the exchange; RequestScheduler() sends requests without a rate limit, e.g. to a local stand-in server
+        - metadataPath (str/None): SQLite file in which the product catalog is kept between runs (see MetadataStore), None to
+          fetch it from the exchange on every start. With a file, a catalog older than metadataTTL is used while a newer one
+          is fetched in a background thread
+        - metadataMaxAge (float/int): seconds after which a catalog read from the file is too old to be used at all
+        """
+        self.apiUrl = api_url
+        self.coinbaseClient = self._createInterface(api_url, maxWorkers, scheduler)
+        self.metadataTTL = metadataTTL
+        self.metadataMaxAge = metadataMaxAge
+        self.metadataCache = TTLCache(metadataTTL, metadataCacheSize)  # { (BASE, QUOTE): { product metadata } }
+        self.metadataStore = MetadataStore(metadataPath) if metadataPath is not None else None
+        self.catalogSource = None  # Where the product catalog in use comes from: 'exchange' or 'file'
+        self._catalog = None  # Product catalog, built on first use
+        self._catalogTime = None  # Time since the epoch at which the listings of the product catalog were fetched
+        self._storeChecked = False  # Whether the metadata file has been read
+        self._refreshThread = None  # Thread fetching a newer product catalog in the background
+        self._refreshLock = threading.Lock()
+
+    @staticmethod
+    def _createInterface(api_url, maxWorkers, scheduler=None):
+        return CoinbaseInterface(api_url, maxWorkers, scheduler)
 
     def getTime(self):
         """ Get server time. """
         return self.coinbaseClient.getTime()
 
-    def getOrderBook(self, base, quote):
+    def getCatalog(self):
+        """
+        Get the index of all products and currencies listed on the exchange. It is built from two bulk requests on first use.
+
+        RETURN
+        ------
+        - (ProductCatalog): product catalog
+        """
+        if self._catalog is None and self.metadataStore is not None and not self._storeChecked:
+            self._loadStoredCatalog()
+
+        if self._catalog is None or (self.metadataStore is None and time.time() - self._catalogTime >= self.metadataTTL):
+            self._setCatalog(*self._fetchCatalog())
+        elif time.time() - self._catalogTime >= self.metadataTTL:
+            self._startCatalogRefresh()  # The current catalog is used until the new one has been fetched
+
+        return self._catalog
+
+    def _fetchCatalog(self):
+        """
+        Builds the product catalog from the exchange listings and saves it to the metadata file if there is one.
+
+        RETURN
+        ------
+        - catalog (ProductCatalog): product catalog
+        - fetchedAt (float): seconds since the epoch at which the listings were fetched
+        """
+        catalog = ProductCatalog(self.coinbaseClient.getProducts(), self.coinbaseClient.getCurrencies())
+        fetchedAt = time.time()
+        if self.metadataStore is not None:
+            self.metadataStore.save(catalog, self.apiUrl, fetchedAt)
+        return catalog, fetchedAt
+
+    def _setCatalog(self, catalog, fetchedAt, source='exchange'):
+        self._catalog, self._catalogTime, self.catalogSource = catalog, fetchedAt, source
+
+    def _loadStoredCatalog(self):
+        """ Uses the catalog of the metadata file, unless it is missing, of another version or exchange, or too old. """
+        self._storeChecked = True
+        stored = self.metadataStore.load(self.apiUrl)
+        if stored is not None and time.time() - stored[1] < self.metadataMaxAge:
+            self._setCatalog(*stored, source='file')
+
+    def _startCatalogRefresh(self):
+        """ Fetches a newer catalog in a background thread, unless one is already being fetched. """
+        with self._refreshLock:
+            if self._refreshThread is None or not self._refreshThread.is_alive():
+                self._refreshThread = threading.Thread(target=self._refreshCatalog, daemon=True)
+                self._refreshThread.start()
+
+    def _refreshCatalog(self):
+        """ Replaces the catalog in use with a newly fetched one; if the fetch fails, it is attempted again on next use. """
+        try:
+            catalog, fetchedAt = self._fetchCatalog()
+        except Exception:
+            return
+        self._setCatalog(catalog, fetchedAt)
+        self.metadataCache.invalidate()  # Metadata derived from the previous catalog
+
+    def waitForCatalogRefresh(self, timeout=None):
+        """ Blocks until the background fetch of the catalog, if any, has finished. """
+        thread = self._refreshThread
+        if thread is not None:
+            thread.join(timeout)
+
+    def getProductMetadata(self, base, quote):
+        """
+        Get the metadata required to size orders for a currency pair. It is served from the metadata cache when possible.
+
+        PARAMETERS
+        ----------
+        - base (str): base currency
+        - quote (str): quote currency
+
+        RETURN
+        ------
+        - metadata (dict):
+            - 'basePrecision' (str | key) --> base currency precision given as the power of 10 (int | value)
+            - 'notionalMinimumLimit' (str | key) --> notional minimum limit (str | value)
+        """
+        metadata = self.metadataCache.get((base, quote))
+
+        if metadata is None:
+            product = self.getCatalog().getProduct(base, quote)
+            metadata = {'basePrecision': self._getPrecision(float(product['base_increment'])),
+                        'notionalMinimumLimit': product['min_market_funds']}
+            self.metadataCache.set((base, quote), metadata)
+
+        return metadata
+
+    def invalidateMetadata(self, base=None, quote=None):
+        """
+        Removes the cached metadata of a currency pair. If no currency pair is given, all cached metadata and the product
+        catalog are discarded, so that they are fetched again on next use.
+
+        PARAMETERS
+        ----------
+        - base (str/None): base currency
+        - quote (str/None): quote currency
+        """
+        if base is None or quote is None:
+            self.metadataCache.invalidate()
+            self._catalog = None
+            self._storeChecked = True  # Fetched again from the exchange, not read from the metadata file
+        else:
+            self.metadataCache.invalidate((base, quote))
+
+    def getMetadataCacheStats(self):
+        """
+        RETURN
+        ------
+        - (dict): { 'hits': int, 'misses': int, 'size': int } of the metadata cache
+        """
+        return self.metadataCache.getStats()
+
+    def getCurrencyPairs(self, currencies):
+        """
+        Finds all currency pairs traded on the exchange given the currency codes.
+
+        PARAMETERS
+        ----------
+        - currencies (list): currency codes
+
+        RETURN
+        ------
+        - (list): [(BASE, QUOTE), (BASE, QUOTE), ..., (BASE, QUOTE)]
+        """
+        return self.getCatalog().getCurrencyPairs(currencies)
+
+    def getTradableUniverse(self):
+        """
+        Finds every online currency pair on the exchange, between online currencies, from the product catalog.
+
+        RETURN
+        ------
+        - currencies (list): currency codes in alphabetical order
+        - pairs (list): [(BASE, QUOTE), (BASE, QUOTE), ..., (BASE, QUOTE)]
+        """
+        return self.getCatalog().getTradableUniverse()
+
+    def getOrderBook(self, base, quote, level=1):
         """ Get order book w.r.t. specified currency pair.
 
         PARAMETERS
         ----------
         - base (str): base currency
         - quote (str): quote currency
+        - level (int): 1 for the best bid/ask only, 2 for the aggregated depth of the book
+
+        RETURN
+        ------
+        - (dict): contains bid/ask levels - price, size and number of orders
+        """
+        return self.coinbaseClient.getOrderBook(base + '-' + quote, level)
+
+    def getOrderBooks(self, pairs, level=1):
+        """ Get order books w.r.t. several currency pairs in one batch, using the worker threads of the client.
+
+        PARAMETERS
+        ----------
+        - pairs (list): [(BASE, QUOTE), (BASE, QUOTE), ..., (BASE, QUOTE)]
+        - level (int): 1 for the best bid/ask only, 2 for the aggregated depth of the book
+
+        RETURN
+        ------
+        - (dict): { (BASE, QUOTE): { order book information }, ..., (BASE, QUOTE): { order book information } }
+        """
+        books = self.coinbaseClient.getOrderBooks([base + '-' + quote for base, quote in pairs], level)
+        return dict(zip(pairs, books))
 
+    def getBatchLatencies(self):
+        """
         RETURN
         ------
-        - (dict): contains best bid/ask - price, size and number of orders
+        - (list): wall-clock seconds taken by each of the most recent batches of requests
         """
-        return self.coinbaseClient.getOrderBook(base + '-' + quote)
+        return self.coinbaseClient.getBatchLatencies()
+
+    def getRequestStats(self):
+        """
+        RETURN
+        ------
+        - (dict): numbers of requests scheduled, delayed by the rate limit, throttled by the exchange (429), retried and
+          given up, see RequestScheduler.getStats
+        """
+        return self.coinbaseClient.getRequestStats()
 
     def getNotionalMinLimit(self, base, quote):
         """
@@ -70,7 +310,7 @@ class CoinbaseClient:
         ------
         - (str): notional minimum limit
         """
-        return self.coinbaseClient.getProduct(base + '-' + quote)['min_market_funds']
+        return self.getProductMetadata(base, quote)['notionalMinimumLimit']
 
     @staticmethod
     def getFees(tradedVolume):
@@ -112,7 +352,7 @@ class CoinbaseClient:
         ------
         - (int): precision given as the power of 10
         """
-        return self._getPrecision(eval(self.coinbaseClient.getProduct(base + '-' + quote)['base_increment']))
+        return self.getProductMetadata(base, quote)['basePrecision']
 
     @staticmethod
     def _getPrecision(decimal):
@@ -130,15 +370,8 @@ class CoinbaseClient:
         ----------
         - currencies (list/tuples): currency codes to be checked
         """
-        currenciesNotFound = []
-
-        for ccy in currencies:
-            currencyInfo = self.coinbaseClient.getCurrency(ccy)
-
-            if currencyInfo['message'] == 'NotFound':
-                currenciesNotFound.append(ccy)
-            elif currencyInfo['message'] == '' and currencyInfo['status'] != 'online':
-                currenciesNotFound.append(ccy)
+        catalog = self.getCatalog()
+        currenciesNotFound = [ccy for ccy in currencies if not catalog.hasCurrency(ccy)]
 
         if len(currenciesNotFound) != 0:
             raise CurrencyNotFound(currenciesNotFound)
@@ -156,16 +389,13 @@ class CoinbaseClient:
         ------
         - True or False (Boolean): True if currency pair exists on exchange else False
         """
-        try:
-            if self.coinbaseClient.getProduct(base + '-' + quote)['message'] == 'NotFound':
-                return False
-        except KeyError:
-            return True
+        return self.getCatalog().hasProduct(base, quote)
 
     def closeSession(self):
         """
-        Closes session, or in other words, closes connection to the exchange.
+        Closes session, or in other words, closes connection to the exchange, once the catalog refresh if any has finished.
         """
+        self.waitForCatalogRefresh()
         self.coinbaseClient.closeSession()
 
 
@@ -0,0 +1,109 @@
+"""
+Brief: This script contains a persistent on-disk store of the product catalog, so that a restarted program starts warm.
+Description: The currency and product listings the catalog is built from (currency status, currency pairs, base increments
+             and min market funds) are kept in a SQLite database, with the time at which they were fetched and the URL of the
+             exchange they were fetched from. The file records the version of its schema: a file written with another version,
+             or for another exchange URL, is ignored and overwritten on the next save.
+             Every operation opens its own connection, so that the catalog can be saved from a background thread.
+"""
+
+import sqlite3
+import time
+
+from clients.coinbase.product_catalog import ProductCatalog
+
+SCHEMA_VERSION = 1
+
+
+class MetadataStore:
+    """ SQLite store of the product and currency listings of an exchange. """
+
+    def __init__(self, path):
+        """
+        PARAMETERS
+        ----------
+        - path (str): path of the SQLite database file, created if missing
+        """
+        self.path = path
+
+    def _connect(self):
+        connection = sqlite3.connect(self.path, timeout=30)
+        connection.execute('CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)')
+        return connection
+
+    @staticmethod
+    def _createTables(connection):
+        """ Drops and recreates the listing tables with the current schema. """
+        connection.execute('DROP TABLE IF EXISTS currencies')
+        connection.execute('DROP TABLE IF EXISTS products')
+        connection.execute('CREATE TABLE currencies (id TEXT PRIMARY KEY, status TEXT)')
+        connection.execute('CREATE TABLE products (base TEXT NOT NULL, quote TEXT NOT NULL, id TEXT NOT NULL, '
+                           'base_increment TEXT NOT NULL, min_market_funds TEXT NOT NULL, status TEXT, '
+                           'trading_disabled INTEGER NOT NULL, PRIMARY KEY (base, quote))')
+
+    def save(self, catalog, source, fetchedAt=None):
+        """
+        Replaces the stored listings with those of a catalog, in one transaction.
+
+        PARAMETERS
+        ----------
+        - catalog (ProductCatalog): product catalog
+        - source (str): URL of the exchange the listings were fetched from
+        - fetchedAt (float/None): seconds since the epoch at which the listings were fetched, by default now
+        """
+        fetchedAt = time.time() if fetchedAt is None else fetchedAt
+
+        connection = self._connect()
+        connection.isolation_level = None  # Transaction managed explicitly, so that the tables are recreated atomically too
+        try:
+            connection.execute('BEGIN IMMEDIATE')
+            self._createTables(connection)
+            connection.executemany('INSERT INTO currencies VALUES (?, ?)',
+                                   [(code, currency.get('status')) for code, currency in catalog.currencies.items()])
+            connection.executemany('INSERT INTO products VALUES (?, ?, ?, ?, ?, ?, ?)',
+                                   [(base, quote, product['id'], product['base_increment'], product['min_market_funds'],
+                                     product['status'], int(bool(product['trading_disabled'])))
+                                    for (base, quote), product in catalog.products.items()])
+            connection.executemany('INSERT OR REPLACE INTO meta VALUES (?, ?)',
+                                   [('schema_version', str(SCHEMA_VERSION)), ('source', source), ('fetched_at', repr(fetchedAt))])
+            connection.execute('COMMIT')
+        except BaseException:
+            connection.execute('ROLLBACK')
+            raise
+        finally:
+            connection.close()
+
+    def load(self, source):
+        """
+        Reads the stored listings.
+
+        PARAMETERS
+        ----------
+        - source (str): URL of the exchange the listings must have been fetched from
+
+        RETURN
+        ------
+        - (tuple/None): (ProductCatalog, seconds since the epoch at which the listings were fetched), None if the file holds no
+          listings of that exchange with the current schema version
+        """
+        try:
+            connection = self._connect()
+        except sqlite3.DatabaseError:  # Not a SQLite file
+            return None
+        try:
+            meta = dict(connection.execute('SELECT key, value FROM meta').fetchall())
+            if meta.get('schema_version') != str(SCHEMA_VERSION) or meta.get('source') != source:
+                return None
+
+            currencies = [{'id': code, 'status': status} for code, status in connection.execute('SELECT id, status FROM currencies')]
+            products = [{'id': productId, 'base_currency': base, 'quote_currency': quote, 'base_increment': baseIncrement,
+                         'min_market_funds': minMarketFunds, 'status': status, 'trading_disabled': bool(tradingDisabled)}
+                        for base, quote, productId, baseIncrement, minMarketFunds, status, tradingDisabled
+                        in connection.execute('SELECT base, quote, id, base_increment, min_market_funds, status, '
+                                              'trading_disabled FROM products')]
+        except sqlite3.DatabaseError:  # Missing tables or a corrupted file are treated as an empty store
+            return None
+        finally:
+            connection.close()
+
+        return ProductCatalog(products, currencies), float(meta['fetched_at'])
@@ -0,0 +1,149 @@
+"""
+Brief: This script contains a class that indexes the products and currencies listed on Coinbase Pro.
+Description: The catalog is built from one bulk /products listing and one bulk /currencies listing, so that existence checks,
+             currency pair discovery and product metadata lookups need no further requests to the exchange.
+             The tradable universe, i.e. every online product between two online currencies, can be listed to scan the whole
+             exchange.
+"""
+
+
+class ProductCatalog:
+    """ Index of the products and currencies listed on the exchange. """
+
+    def __init__(self, products, currencies):
+        self.products = self._indexProducts(products)  # { (BASE, QUOTE): { product information }, ..., (BASE, QUOTE): { product information } }
+        self.currencies = dict([(currency['id'], currency) for currency in currencies])  # { ccy: { currency information }, ... }
+        self.productsByCurrency = self._indexProductsByCurrency()  # { ccy: [(BASE, QUOTE), ..., (BASE, QUOTE)], ... }
+
+    @staticmethod
+    def _indexProducts(products):
+        """
+        Indexes products by currency pair, keeping the fields used by the program.
+
+        PARAMETERS
+        ----------
+        - products (list): response of the /products endpoint
+
+        RETURN
+        ------
+        - index (dict): { (BASE, QUOTE): { 'id', 'base_increment', 'min_market_funds', 'status', 'trading_disabled' }, ... }
+        """
+        index = {}
+        for product in products:
+            index[(product['base_currency'], product['quote_currency'])] = {
+                'id': product['id'],
+                'base_increment': product['base_increment'],
+                'min_market_funds': product['min_market_funds'],
+                'status': product.get('status'),
+                'trading_disabled': product.get('trading_disabled', False)
+            }
+        return index
+
+    def _indexProductsByCurrency(self):
+        """
+        Indexes currency pairs by the currencies they contain.
+
+        RETURN
+        ------
+        - index (dict): { ccy: [(BASE, QUOTE), ..., (BASE, QUOTE)], ... }
+        """
+        index = {}
+        for base, quote in self.products:
+            index.setdefault(base, []).append((base, quote))
+            index.setdefault(quote, []).append((base, quote))
+        return index
+
+    def hasCurrency(self, currency, status='online'):
+        """
+        Checks if currency is listed on the exchange with the given status.
+
+        PARAMETERS
+        ----------
+        - currency (str): currency code
+        - status (str/None): required status of the currency, None if any status is accepted
+
+        RETURN
+        ------
+        - True or False (Boolean): True if currency is listed with the given status else False
+        """
+        return currency in self.currencies and (status is None or self.currencies[currency].get('status') == status)
+
+    def hasProduct(self, base, quote):
+        """
+        Checks if currency pair is listed on the exchange.
+
+        PARAMETERS
+        ----------
+        - base (str): base currency
+        - quote (str): quote currency
+
+        RETURN
+        ------
+        - True or False (Boolean): True if currency pair is listed else False
+        """
+        return (base, quote) in self.products
+
+    def getProduct(self, base, quote):
+        """
+        Get product information for currency pair. Raises a KeyError if the currency pair is not listed.
+
+        PARAMETERS
+        ----------
+        - base (str): base currency
+        - quote (str): quote currency
+
+        RETURN
+        ------
+        - (dict): { 'id', 'base_increment', 'min_market_funds', 'status', 'trading_disabled' }
+        """
+        return self.products[(base, quote)]
+
+    def getCurrencyPairs(self, currencies):
+        """
+        Finds all listed currency pairs given the currency codes.
+
+        PARAMETERS
+        ----------
+        - currencies (list): currency codes
+
+        RETURN
+        ------
+        - pairs (list): [(BASE, QUOTE), (BASE, QUOTE), ..., (BASE, QUOTE)]
+        """
+        currencySet = set(currencies)
+        pairs = []
+        for currency in currencies:
+            for base, quote in self.productsByCurrency.get(currency, []):
+                if base == currency and quote in currencySet:
+                    pairs.append((base, quote))
+        return pairs
+
+    def isTradable(self, base, quote):
+        """
+        Checks if currency pair is online, open for trading and between two online currencies.
+
+        PARAMETERS
+        ----------
+        - base (str): base currency
+        - quote (str): quote currency
+
+        RETURN
+        ------
+        - True or False (Boolean): True if currency pair can be traded else False
+        """
+        product = self.products.get((base, quote))
+        return (product is not None and product['status'] == 'online' and not product['trading_disabled']
+                and self.hasCurrency(base) and self.hasCurrency(quote))
+
+    def getTradableUniverse(self):
+        """
+        Finds every tradable currency pair on the exchange and the currencies they contain.
+
+        RETURN
+        ------
+        - currencies (list): currency codes in alphabetical order
+        - pairs (list): [(BASE, QUOTE), (BASE, QUOTE), ..., (BASE, QUOTE)] in alphabetical order
+        """
+        pairs = sorted(pair for pair in self.products if self.isTradable(*pair))
+        currencies = sorted(set(ccy for pair in pairs for ccy in pair))
+        return currencies, pairs
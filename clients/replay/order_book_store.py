@@ -0,0 +1,232 @@
+"""
+Brief: This script contains an append-only, memory-mapped columnar store of top-of-book history.
+Description: Every record is (timestamp, pair id, bid, bid quantity, ask, ask quantity). Each column is a fixed-width array in
+             its own file of the store directory, and a pair dictionary file maps pair ids to (BASE, QUOTE). Records are
+             appended in time order, so the timestamp column is sorted and serves as the time-range index: a time range is found
+             by binary search on the memory-mapped column, without reading the rest of the file.
+             Readers get zero-copy NumPy views of the memory-mapped columns.
+"""
+
+import os
+
+import numpy as np
+
+# Column name to little-endian fixed-width type, in record order
+COLUMNS = (('timestamp', '<f8'), ('pairId', '<u4'), ('bid', '<f8'), ('bidQty', '<f8'), ('ask', '<f8'), ('askQty', '<f8'))
+
+PAIRS_FILE = 'pairs.txt'
+
+
+class OrderBookStore:
+    """ Append-only columnar store of top-of-book history. """
+
+    def __init__(self, directory, mode='r', searchWindow=4096):
+        """
+        PARAMETERS
+        ----------
+        - directory (str): directory of the store; created in append mode if it does not exist
+        - mode (str): 'r' to read, 'a' to read and append
+        - searchWindow (int): number of records read at a time when searching backwards for the latest quotes
+        """
+        if mode not in ('r', 'a'):
+            raise ValueError("The mode must be 'r' or 'a', not {!r}.".format(mode))
+
+        self.directory = directory
+        self.mode = mode
+        self.searchWindow = searchWindow
+        self.pairs = []  # Pair of each pair id [(BASE, QUOTE), ..., (BASE, QUOTE)]
+        self.pairIds = {}  # { (BASE, QUOTE): pair id }
+
+        if mode == 'a':
+            os.makedirs(directory, exist_ok=True)
+
+        pairsPath = os.path.join(directory, PAIRS_FILE)
+        if os.path.exists(pairsPath):
+            with open(pairsPath) as file:
+                for line in file.read().splitlines():
+                    self.pairIds[tuple(line.split('\t'))] = len(self.pairs)
+                    self.pairs.append(tuple(line.split('\t')))
+
+        # A partially written append leaves columns of different lengths; only complete records are kept
+        self._length = min(self._fileLength(name, dtype) for name, dtype in COLUMNS)
+        self._views = None  # Memory-mapped columns, opened on first read
+
+        self._files = {}
+        self._pairsFile = None
+        if mode == 'a':
+            for name, dtype in COLUMNS:
+                self._files[name] = open(self._columnPath(name), 'ab')
+                self._files[name].truncate(self._length * np.dtype(dtype).itemsize)
+            self._pairsFile = open(pairsPath, 'a')
+
+        self._lastTimestamp = float(self.columns['timestamp'][-1]) if self._length != 0 else -np.inf
+
+    def _columnPath(self, name):
+        return os.path.join(self.directory, name + '.bin')
+
+    def _fileLength(self, name, dtype):
+        """ Number of complete values in the file of a column. """
+        path = self._columnPath(name)
+        return os.path.getsize(path) // np.dtype(dtype).itemsize if os.path.exists(path) else 0
+
+    def __len__(self):
+        return self._length
+
+    def getPairId(self, pair):
+        """
+        Get the id of a currency pair; in append mode, a new pair is added to the pair dictionary.
+
+        PARAMETERS
+        ----------
+        - pair (tuple): (BASE, QUOTE)
+
+        RETURN
+        ------
+        - (int): pair id
+        """
+        pair = tuple(pair)
+        if pair not in self.pairIds:
+            if self.mode != 'a':
+                raise KeyError('The pair {} is not in the store.'.format(pair))
+            self._pairsFile.write('{}\t{}\n'.format(*pair))
+            self.pairIds[pair] = len(self.pairs)
+            self.pairs.append(pair)
+        return self.pairIds[pair]
+
+    def append(self, timestamps, pairs, bids, bidQtys, asks, askQtys):
+        """
+        Appends records. Records must be appended in time order.
+
+        PARAMETERS
+        ----------
+        - timestamps (list/np.array): seconds since the epoch
+        - pairs (list): (BASE, QUOTE) of each record
+        - bids, bidQtys, asks, askQtys (list/np.array): best bid, quantity at the best bid, best ask and quantity at the best ask
+        """
+        timestamps = np.asarray(timestamps, dtype='<f8')
+        if len(timestamps) == 0:
+            return
+        if timestamps[0] < self._lastTimestamp or (np.diff(timestamps) < 0).any():
+            raise ValueError('Records must be appended in time order.')
+
+        values = {'timestamp': timestamps, 'pairId': [self.getPairId(pair) for pair in pairs], 'bid': bids, 'bidQty': bidQtys,
+                  'ask': asks, 'askQty': askQtys}
+        for name, dtype in COLUMNS:
+            column = np.asarray(values[name], dtype=dtype)
+            if len(column) != len(timestamps):
+                raise ValueError('All columns must have the same number of records.')
+            self._files[name].write(column.tobytes())
+
+        self._length += len(timestamps)
+        self._lastTimestamp = float(timestamps[-1])
+        self._views = None
+
+    def appendSnapshot(self, timestamp, orderBooks):
+        """
+        Appends the top of the order books of a snapshot, all with the same timestamp.
+
+        PARAMETERS
+        ----------
+        - timestamp (float): seconds since the epoch at which the snapshot was taken
+        - orderBooks (dict): { (BASE, QUOTE): { order book information }, ..., (BASE, QUOTE): { order book information } }
+        """
+        pairs = list(orderBooks)
+        self.append([timestamp] * len(pairs), pairs,
+                    [orderBooks[pair]['bids'][0][0] for pair in pairs], [orderBooks[pair]['bids'][0][1] for pair in pairs],
+                    [orderBooks[pair]['asks'][0][0] for pair in pairs], [orderBooks[pair]['asks'][0][1] for pair in pairs])
+
+    def flush(self):
+        """ Writes the appended records to disk, so that they can be read. """
+        for file in self._files.values():
+            file.flush()
+        if self._pairsFile is not None:
+            self._pairsFile.flush()
+
+    @property
+    def columns(self):
+        """
+        RETURN
+        ------
+        - (dict): { column name: read-only memory-mapped np.array } of all records
+        """
+        if self._views is None:
+            self.flush()
+            self._views = {}
+            for name, dtype in COLUMNS:
+                if self._length == 0:
+                    self._views[name] = np.empty(0, dtype)
+                else:
+                    self._views[name] = np.memmap(self._columnPath(name), dtype, 'r', shape=(self._length,))
+        return self._views
+
+    def timeRange(self, start=None, end=None):
+        """
+        Finds the records in a time range by binary search on the timestamp column.
+
+        PARAMETERS
+        ----------
+        - start (float/None): first timestamp included, None for the first record
+        - end (float/None): last timestamp included, None for the last record
+
+        RETURN
+        ------
+        - (slice): indices of the records
+        """
+        timestamps = self.columns['timestamp']
+        first = 0 if start is None else int(np.searchsorted(timestamps, start, 'left'))
+        last = self._length if end is None else int(np.searchsorted(timestamps, end, 'right'))
+        return slice(first, last)
+
+    def view(self, start=None, end=None):
+        """
+        Get zero-copy views of all columns over a time range (see timeRange).
+
+        RETURN
+        ------
+        - (dict): { column name: np.array view }
+        """
+        indices = self.timeRange(start, end)
+        return dict([(name, column[indices]) for name, column in self.columns.items()])
+
+    def getLatestQuotes(self, timestamp, pairs):
+        """
+        Finds the latest record at or before a timestamp for each currency pair. The records are searched backwards from the
+        timestamp, one window at a time, until every pair has been found; the rest of the file is not read.
+
+        PARAMETERS
+        ----------
+        - timestamp (float): seconds since the epoch
+        - pairs (list): [(BASE, QUOTE), ..., (BASE, QUOTE)]
+
+        RETURN
+        ------
+        - quotes (dict): { (BASE, QUOTE): (bid, bid quantity, ask, ask quantity) }; pairs without a record are left out
+        """
+        columns = self.columns
+        wanted = dict([(self.pairIds[tuple(pair)], tuple(pair)) for pair in pairs if tuple(pair) in self.pairIds])
+        quotes = {}
+
+        end = self.timeRange(end=timestamp).stop
+        while end > 0 and len(wanted) != 0:
+            start = max(0, end - self.searchWindow)
+            pairIds = columns['pairId'][start:end][::-1]  # Most recent first
+
+            # Index of the most recent record of each pair in the window
+            found, indices = np.unique(pairIds, return_index=True)
+            for pairId, index in zip(found.tolist(), indices.tolist()):
+                if pairId in wanted:
+                    record = end - 1 - index
+                    quotes[wanted.pop(pairId)] = (float(columns['bid'][record]), float(columns['bidQty'][record]),
+                                                  float(columns['ask'][record]), float(columns['askQty'][record]))
+            end = start
+
+        return quotes
+
+    def close(self):
+        for file in self._files.values():
+            file.close()
+        if self._pairsFile is not None:
+            self._pairsFile.close()
+        self._files = {}
+        self._pairsFile = None
+        self._views = None
@@ -0,0 +1,70 @@
+"""
+Brief: This script contains a client that records the market snapshots taken through another exchange client.
+Description: The recording client forwards every call to the wrapped client. Each batch of order books requested by
+             GraphConstructor.buildGraph is written to a snapshot file (see snapshot_file.py) together with the time at which
+             it was taken and, the first time a pair is seen, the product metadata of the pair.
+             The file can be replayed with ReplayClient. The top of the order books can also be appended to an OrderBookStore.
+"""
+
+import time
+
+from clients.replay.snapshot_file import SnapshotWriter
+
+
+class RecordingClient:
+    """ Records the order book snapshots taken through an exchange client. """
+
+    def __init__(self, client, path, store=None):
+        """
+        PARAMETERS
+        ----------
+        - client (object): exchange client whose snapshots are recorded
+        - path (str): path of the snapshot file; an existing file is overwritten
+        - store (OrderBookStore/None): store, opened in append mode, to which the top of every order book is also appended
+        """
+        self.client = client
+        self.writer = SnapshotWriter(path)
+        self.store = store
+
+    def __getattr__(self, name):
+        # Everything that is not recorded is answered by the wrapped client
+        return getattr(self.client, name)
+
+    def getOrderBooks(self, pairs, level=1):
+        """ Get order books w.r.t. several currency pairs and record them as one snapshot.
+
+        PARAMETERS
+        ----------
+        - pairs (list): [(BASE, QUOTE), (BASE, QUOTE), ..., (BASE, QUOTE)]
+        - level (int): 1 for the best bid/ask only, 2 for the aggregated depth of the book
+
+        RETURN
+        ------
+        - orderBooks (dict): { (BASE, QUOTE): { order book information }, ..., (BASE, QUOTE): { order book information } }
+        """
+        extraArguments = () if level == 1 else (level,)
+        timestamp = time.time()
+
+        if hasattr(self.client, 'getOrderBooks'):
+            orderBooks = self.client.getOrderBooks(pairs, *extraArguments)
+        else:
+            orderBooks = dict([(pair, self.client.getOrderBook(pair[0], pair[1], *extraArguments)) for pair in pairs])
+
+        for pair in pairs:
+            if tuple(pair) not in self.writer.pairIds:
+                self.writer.writeProduct(pair, self.client.getBasePrecision(*pair), self.client.getNotionalMinLimit(*pair))
+
+        self.writer.writeSnapshot(timestamp, orderBooks, level)
+        if self.store is not None:
+            self.store.appendSnapshot(timestamp, orderBooks)
+
+        return orderBooks
+
+    def closeSession(self):
+        """
+        Closes the snapshot file, the store and the session of the wrapped client.
+        """
+        self.writer.close()
+        if self.store is not None:
+            self.store.close()
+        self.client.closeSession()
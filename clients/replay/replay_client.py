@@ -0,0 +1,147 @@
+"""
+Brief: This script contains an exchange client that replays recorded market snapshots.
+Description: The replay client implements the CoinbaseClient interface from a snapshot file (see snapshot_file.py), so that
+             the detection can be run over recorded data at CPU speed, without connecting to the exchange.
+             Every call to getOrderBooks moves on to the next snapshot; getOrderBook and getTime answer from the current one.
+             Only the currencies and pairs that have been recorded exist on the replayed exchange.
+"""
+
+import datetime
+
+from clients.coinbase.coinbase_client import CoinbaseClient, CurrencyNotFound
+from clients.replay.snapshot_file import SnapshotReader
+
+
+class ReplayClient:
+    """ Exchange client serving recorded market snapshots. """
+
+    def __init__(self, path):
+        """
+        PARAMETERS
+        ----------
+        - path (str): path of a snapshot file written by RecordingClient
+        """
+        self.reader = SnapshotReader(path)
+        self.products = dict([(product['pair'], product) for product in self.reader.products.values()])  # { (BASE, QUOTE): metadata }
+        self.currencies = set([ccy for pair in self.products for ccy in pair])  # Currency codes of the recorded pairs
+        self.snapshotCount = len(self.reader)  # Number of recorded snapshots (int)
+        self.position = -1  # Index of the current snapshot, -1 before the first one
+        self._timestamp = self.reader.timestamps[0] if self.snapshotCount != 0 else 0.0
+        self._level = None
+        self._orderBooks = {}
+
+    def nextSnapshot(self):
+        """
+        Moves on to the next recorded snapshot. Raises a ReplayFinished exception if all snapshots have been replayed.
+        """
+        if self.position + 1 >= self.snapshotCount:
+            raise ReplayFinished(self.snapshotCount)
+        self.position += 1
+        self._timestamp, self._level, self._orderBooks = self.reader.readSnapshot(self.position)
+
+    def getTime(self):
+        """ Get the time at which the current snapshot was recorded, in the format of the exchange. """
+        return {'iso': datetime.datetime.fromtimestamp(self._timestamp, datetime.timezone.utc).isoformat(),
+                'epoch': self._timestamp}
+
+    def getCurrencyPairs(self, currencies):
+        """
+        Finds all recorded currency pairs given the currency codes.
+
+        PARAMETERS
+        ----------
+        - currencies (list): currency codes
+
+        RETURN
+        ------
+        - (list): [(BASE, QUOTE), (BASE, QUOTE), ..., (BASE, QUOTE)]
+        """
+        return [(base, quote) for base in currencies for quote in currencies if (base, quote) in self.products]
+
+    def getTradableUniverse(self):
+        """
+        RETURN
+        ------
+        - currencies (list): recorded currency codes in alphabetical order
+        - pairs (list): [(BASE, QUOTE), (BASE, QUOTE), ..., (BASE, QUOTE)] recorded currency pairs in alphabetical order
+        """
+        return sorted(self.currencies), sorted(self.products)
+
+    def getOrderBook(self, base, quote, level=1):
+        """ Get order book w.r.t. specified currency pair from the current snapshot.
+
+        PARAMETERS
+        ----------
+        - base (str): base currency
+        - quote (str): quote currency
+        - level (int): 1 for the best bid/ask only, 2 for every recorded level
+
+        RETURN
+        ------
+        - (dict): contains bid/ask levels - price, size and number of orders
+        """
+        if self._level is None:
+            raise ValueError('No snapshot has been loaded yet: call nextSnapshot or getOrderBooks first.')
+        if level > self._level:
+            raise ValueError('Level {} order books have been requested, but level {} order books were recorded.'.format(level, self._level))
+
+        book = self._orderBooks[(base, quote)]
+        if level == 1:
+            return {'bids': book['bids'][:1], 'asks': book['asks'][:1]}
+        return book
+
+    def getOrderBooks(self, pairs, level=1):
+        """ Moves on to the next snapshot and gets its order books w.r.t. several currency pairs.
+
+        PARAMETERS
+        ----------
+        - pairs (list): [(BASE, QUOTE), (BASE, QUOTE), ..., (BASE, QUOTE)]
+        - level (int): 1 for the best bid/ask only, 2 for every recorded level
+
+        RETURN
+        ------
+        - (dict): { (BASE, QUOTE): { order book information }, ..., (BASE, QUOTE): { order book information } }
+        """
+        self.nextSnapshot()
+        return dict([(pair, self.getOrderBook(pair[0], pair[1], level)) for pair in pairs])
+
+    def getNotionalMinLimit(self, base, quote):
+        """ Get the recorded notional minimum limit (str) for currency pair. """
+        return self.products[(base, quote)]['notionalMinimumLimit']
+
+    def getBasePrecision(self, base, quote):
+        """ Get the recorded base currency increment precision (int), given as the power of 10. """
+        return self.products[(base, quote)]['basePrecision']
+
+    getFees = staticmethod(CoinbaseClient.getFees)  # The fee schedule does not depend on the market
+
+    def checkCurrenciesExistence(self, currencies):
+        """
+        Check if all given currency codes have been recorded. Raises a CurrencyNotFound exception if not.
+
+        PARAMETERS
+        ----------
+        - currencies (list/tuples): currency codes to be checked
+        """
+        currenciesNotFound = [ccy for ccy in currencies if ccy not in self.currencies]
+
+        if len(currenciesNotFound) != 0:
+            raise CurrencyNotFound(currenciesNotFound)
+
+    def checkCurrencyPairExistence(self, base, quote):
+        """ Checks if given currency pair has been recorded. """
+        return (base, quote) in self.products
+
+    def closeSession(self):
+        """
+        Nothing to close; the snapshot file is read in full when the client is created.
+        """
+
+
+class ReplayFinished(Exception):
+
+    def __init__(self, snapshots):
+        self.snapshots = snapshots
+
+    def __str__(self):
+        return "All {} recorded snapshot(s) have been replayed.".format(self.snapshots)
@@ -0,0 +1,179 @@
+"""
+Brief: This script contains the compact binary file format in which market snapshots are recorded.
+Description: A file starts with a magic number and a version, followed by records. Each record starts with one type byte:
+             - b'P' (product): pair id, base and quote currency codes, base currency precision and notional minimum limit.
+               Written once, before the first snapshot that contains the pair.
+             - b'S' (snapshot): timestamp, order book level and the order books of the snapshot. Every order book is stored as
+               the pair id, the number of bids and asks and then the levels as (price, size, number of orders) packed records.
+             All numbers are little-endian. Prices and sizes are stored as 64-bit floats, so an order book that is read back is
+             equal to the original one once its strings are parsed.
+"""
+
+import struct
+
+import numpy as np
+
+MAGIC = b'ARBSNAP'
+VERSION = 1
+
+PRODUCT = b'P'
+SNAPSHOT = b'S'
+
+LEVEL_DTYPE = np.dtype([('price', '<f8'), ('size', '<f8'), ('orders', '<u4')])  # One price level of an order book
+
+_HEADER = struct.Struct('<7sB')  # magic, version
+_PRODUCT = struct.Struct('<HbH')  # pair id, base precision, length of the notional minimum limit
+_SNAPSHOT = struct.Struct('<dBH')  # timestamp, order book level, number of order books
+_BOOK = struct.Struct('<HHH')  # pair id, number of bids, number of asks
+
+
+class SnapshotWriter:
+    """ Appends market snapshots to a file. """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'wb')
+        self._file.write(_HEADER.pack(MAGIC, VERSION))
+        self.pairIds = {}  # { (BASE, QUOTE): pair id } of the products written so far
+        self.snapshots = 0  # Number of snapshots written (int)
+
+    def writeProduct(self, pair, basePrecision, notionalMinimumLimit):
+        """
+        Writes the metadata of a currency pair; it is given the next pair id.
+
+        PARAMETERS
+        ----------
+        - pair (tuple): (BASE, QUOTE)
+        - basePrecision (int): base currency precision given as the power of 10
+        - notionalMinimumLimit (str): notional minimum limit, as returned by the exchange
+
+        RETURN
+        ------
+        - pairId (int): id of the pair in the snapshots
+        """
+        pairId = len(self.pairIds)
+        notional = str(notionalMinimumLimit).encode('ascii')
+        self._file.write(PRODUCT + _PRODUCT.pack(pairId, basePrecision, len(notional)) + notional)
+        self._file.write(_encodeText(pair[0]) + _encodeText(pair[1]))
+        self.pairIds[tuple(pair)] = pairId
+        return pairId
+
+    def writeSnapshot(self, timestamp, orderBooks, level=1):
+        """
+        Writes the order books of a snapshot. The products of all pairs must have been written before.
+
+        PARAMETERS
+        ----------
+        - timestamp (float): seconds since the epoch at which the snapshot was taken
+        - orderBooks (dict): { (BASE, QUOTE): { order book information }, ..., (BASE, QUOTE): { order book information } }
+        - level (int): order book level, 1 or 2
+        """
+        if level not in (1, 2):
+            raise ValueError('Only level 1 and level 2 order books can be recorded, not level {}.'.format(level))
+
+        chunks = [SNAPSHOT, _SNAPSHOT.pack(timestamp, level, len(orderBooks))]
+        for pair, book in orderBooks.items():
+            chunks.append(_BOOK.pack(self.pairIds[tuple(pair)], len(book['bids']), len(book['asks'])))
+            chunks.append(_encodeLevels(book['bids']))
+            chunks.append(_encodeLevels(book['asks']))
+
+        self._file.write(b''.join(chunks))
+        self.snapshots += 1
+
+    def close(self):
+        self._file.close()
+
+
+class SnapshotReader:
+    """ Reads a file of market snapshots. The whole file is indexed on opening; snapshots are decoded on access. """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as file:
+            self._data = file.read()
+
+        magic, version = _HEADER.unpack_from(self._data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError('{} is not a version {} snapshot file.'.format(path, VERSION))
+
+        self.products = {}  # { pair id: {'pair': (BASE, QUOTE), 'basePrecision': int, 'notionalMinimumLimit': str} }
+        self.offsets = []  # Offset in the file of each snapshot record
+        self.timestamps = []  # Timestamp of each snapshot
+        self._index(_HEADER.size)
+
+    def _index(self, offset):
+        """ Reads all products and finds the offset of every snapshot, skipping over the order books. """
+        while offset < len(self._data):
+            recordType = self._data[offset:offset + 1]
+            offset += 1
+
+            if recordType == PRODUCT:
+                pairId, basePrecision, length = _PRODUCT.unpack_from(self._data, offset)
+                offset += _PRODUCT.size
+                notional = self._data[offset:offset + length].decode('ascii')
+                base, offset = _decodeText(self._data, offset + length)
+                quote, offset = _decodeText(self._data, offset)
+                self.products[pairId] = {'pair': (base, quote), 'basePrecision': basePrecision, 'notionalMinimumLimit': notional}
+
+            elif recordType == SNAPSHOT:
+                self.offsets.append(offset)
+                timestamp, level, books = _SNAPSHOT.unpack_from(self._data, offset)
+                self.timestamps.append(timestamp)
+                offset += _SNAPSHOT.size
+                for _ in range(books):
+                    _, bids, asks = _BOOK.unpack_from(self._data, offset)
+                    offset += _BOOK.size + (bids + asks) * LEVEL_DTYPE.itemsize
+
+            else:
+                raise ValueError('Corrupt snapshot file {}: unknown record type {!r} at offset {}.'.format(self.path, recordType, offset - 1))
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def readSnapshot(self, index):
+        """
+        Decodes a snapshot.
+
+        PARAMETERS
+        ----------
+        - index (int): number of the snapshot, starting at 0
+
+        RETURN
+        ------
+        - timestamp (float): seconds since the epoch at which the snapshot was taken
+        - level (int): order book level
+        - orderBooks (dict): { (BASE, QUOTE): {'bids': [(price, size, orders), ...], 'asks': [...]}, ... }
+        """
+        offset = self.offsets[index]
+        timestamp, level, books = _SNAPSHOT.unpack_from(self._data, offset)
+        offset += _SNAPSHOT.size
+
+        orderBooks = {}
+        for _ in range(books):
+            pairId, bids, asks = _BOOK.unpack_from(self._data, offset)
+            offset += _BOOK.size
+            levels = np.frombuffer(self._data, LEVEL_DTYPE, bids + asks, offset).tolist()
+            offset += (bids + asks) * LEVEL_DTYPE.itemsize
+            orderBooks[self.products[pairId]['pair']] = {'bids': levels[:bids], 'asks': levels[bids:]}
+
+        return timestamp, level, orderBooks
+
+
+def _encodeText(text):
+    """ Encodes a currency code as its length followed by its ASCII characters. """
+    encoded = text.encode('ascii')
+    return struct.pack('<B', len(encoded)) + encoded
+
+
+def _decodeText(data, offset):
+    """ Decodes a currency code; returns it and the offset after it. """
+    length = data[offset]
+    return data[offset + 1:offset + 1 + length].decode('ascii'), offset + 1 + length
+
+
+def _encodeLevels(levels):
+    """ Packs the [price, size, number of orders] levels of one side of an order book. """
+    packed = np.zeros(len(levels), LEVEL_DTYPE)
+    for index, level in enumerate(levels):
+        packed[index] = (float(level[0]), float(level[1]), int(level[2]) if len(level) > 2 else 0)
+    return packed.tobytes()
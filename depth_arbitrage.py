@@ -0,0 +1,240 @@
+"""
+Brief: This script contains a class that analyses an arbitrage opportunity using the depth of the order books.
+Description: The Arbitrage class caps each leg at the quantity resting at the best price. Here every leg walks the price levels
+             of its order book side. For each leg, cumulative-depth arrays give the amount received as a function of the amount
+             traded (after fees). These functions are increasing, piecewise linear and concave, because every level is priced
+             worse than the previous one. Their composition is also concave, so the profit of the cycle as a function of the
+             starting volume is concave. Its maximum lies on one of the breakpoints of the composition, and it is found by
+             bisection over the sorted breakpoints.
+             The order sizes are then adjusted to the base currency precision and checked against the notional minimum limits.
+"""
+
+import numpy as np
+
+from arbitrage import Arbitrage
+
+
+class DepthArbitrage(Arbitrage):
+    """ Analyses arbitrage opportunity across several order book levels. """
+
+    def __init__(self, arbitrageData):
+        super().__init__(arbitrageData)
+
+        self.baseDepths = []  # Cumulative base currency quantity of each leg, starting at 0
+        self.quoteDepths = []  # Cumulative quote currency value (before fees) of each leg, starting at 0
+        self.inputs = []  # Cumulative amount given on each leg (base if short, quote including fees if long)
+        self.outputs = []  # Cumulative amount received on each leg (quote net of fees if short, base if long)
+
+        for order in self.arbitrage:
+
+            # Legs without depth only know the best price
+            depth = order.depth if order.depth is not None else ((order.price, order.availableQuantity),)
+            levels = np.array([level for level in depth if level[1] > 0], dtype=float).reshape(-1, 2)
+
+            baseDepth = np.concatenate(([0.0], np.cumsum(levels[:, 1])))
+            quoteDepth = np.concatenate(([0.0], np.cumsum(levels[:, 0] * levels[:, 1])))
+            self.baseDepths.append(baseDepth)
+            self.quoteDepths.append(quoteDepth)
+
+            if order.position == 'short':
+                self.inputs.append(baseDepth)
+                self.outputs.append(quoteDepth * (1 - order.fee))
+            else:  # order.position == 'long'
+                self.inputs.append(quoteDepth * (1 + order.fee))
+                self.outputs.append(baseDepth)
+
+        self.volume = None  # Profit-maximising starting volume, set by calculateMaximumOrderSize
+
+    def _traverse(self, volume):
+        """
+        Trades a starting volume through every leg of the cycle.
+
+        PARAMETERS
+        ----------
+        - volume (float): amount of the starting currency given on the first leg
+
+        RETURN
+        ------
+        - amounts (list): amount given on each leg followed by the amount received on the last leg
+        """
+        amounts = [volume]
+        for inputs, outputs in zip(self.inputs, self.outputs):
+            amounts.append(float(np.interp(amounts[-1], inputs, outputs)))
+        return amounts
+
+    def _toStartingVolume(self, amounts, index):
+        """
+        Maps amounts given on a leg back to the starting volumes that lead to them.
+
+        PARAMETERS
+        ----------
+        - amounts (np.array): amounts given on the leg
+        - index (int): index of the leg
+
+        RETURN
+        ------
+        - (np.array): starting volumes
+        """
+        for previous in reversed(range(index)):
+            amounts = np.interp(amounts, self.outputs[previous], self.inputs[previous])
+        return amounts
+
+    def calculateMaximumOrderSize(self):
+        """
+        Calculates the order sizes that maximise the profit of the arbitrage, taking into account every level of the order
+        books and the fees.
+
+        RETURN
+        ------
+        - sizes (np.array): order sizes (in base currency) at the profit-maximising volume
+        """
+
+        # Largest starting volume for which every leg can be filled
+        capacity = float(self._toStartingVolume(self.inputs[-1][-1], len(self.arbitrage) - 1))
+
+        # The profit is linear between breakpoints, where a leg moves on to the next price level
+        breakpoints = np.concatenate([self._toStartingVolume(inputs, index) for index, inputs in enumerate(self.inputs)])
+        breakpoints = np.unique(np.clip(np.append(breakpoints, capacity), 0, capacity))
+
+        def profit(volume):
+            return self._traverse(volume)[-1] - volume
+
+        # The profit is concave, so its values on the breakpoints increase up to the maximum and decrease afterwards
+        low, high = 0, len(breakpoints) - 1
+        while low < high:
+            middle = (low + high) // 2
+            if profit(breakpoints[middle + 1]) > profit(breakpoints[middle]):
+                low = middle + 1
+            else:
+                high = middle
+
+        self.volume = float(breakpoints[low])
+        amounts = self._traverse(self.volume)
+
+        sizes = np.zeros(len(self.arbitrage))
+        for index, order in enumerate(self.arbitrage):
+            # The size of a short order is the base given, the size of a long order is the base received
+            sizes[index] = amounts[index] if order.position == 'short' else amounts[index + 1]
+
+        return sizes
+
+    def adjustOrderSizeForBaseTickSize(self, sizes):
+        """
+        Adjusts all order sizes to take into account maximum base currency precision. Once an order size is rounded down,
+        the amount available to the following legs is recalculated through their order books.
+
+        PARAMETERS
+        ----------
+        - sizes (np.array): order sizes (don't take into account base currency precision)
+
+        RETURN
+        ------
+        - adjustedOrderSizes (list): order sizes that have been adjusted to the base currency precision
+        """
+
+        adjustedOrderSizes = []  # Initialize data store for adjusted order sizes
+        amount = None  # Amount available from the previous leg
+
+        for index, order in enumerate(self.arbitrage):
+
+            if amount is None:
+                size = sizes[index]
+            elif order.position == 'short':
+                size = min(sizes[index], amount)
+            else:  # order.position == 'long'
+                size = min(sizes[index], float(np.interp(amount, self.inputs[index], self.outputs[index])))
+
+            precision = order.basePrecision
+            adjustedOrderSize = int(size * (10 ** -precision)) * (10 ** precision)
+            adjustedOrderSizes.append(adjustedOrderSize)
+
+            if order.position == 'short':
+                amount = float(np.interp(adjustedOrderSize, self.inputs[index], self.outputs[index]))
+            else:
+                amount = adjustedOrderSize
+
+        return adjustedOrderSizes
+
+    def _notional(self, index, size):
+        """ Value in quote currency (before fees) of an order of the given size on a leg. """
+        return float(np.interp(size, self.baseDepths[index], self.quoteDepths[index]))
+
+    def checkNotionalMinimumLimit(self, adjustedOrderSizes):
+        """
+        Checks if the notional value exceeds the notional minimum limit for all currency pairs.
+
+        PARAMETERS
+        ----------
+        - adjustedOrderSizes (list): order sizes that have been adjusted to the base currency precision
+
+        RETURN
+        ------
+        - True or False (Boolean): True if all notional values pass the requirement else False
+        """
+
+        for index in range(len(adjustedOrderSizes)):
+            if self._notional(index, adjustedOrderSizes[index]) <= self.arbitrage[index].notionalMinimumLimit:
+                return False
+
+        return True
+
+    def calculateProfit(self, adjustedSizes):
+        """
+        Calculates profit of the arbitrage.
+
+        PARAMETERS
+        ----------
+        - adjustedOrderSizes (list): order sizes that have been adjusted to the base currency precision
+
+        RETURN
+        ------
+        - profit (float): profit at the end of the arbitrage set of trades
+        """
+
+        first, last = self.arbitrage[0], self.arbitrage[-1]
+
+        # Get initial amount
+        if first.position == 'short':
+            startAmount = adjustedSizes[0]
+        else:
+            startAmount = self._notional(0, adjustedSizes[0]) * (1 + first.fee)
+
+        # Get final amount
+        if last.position == 'long':
+            endAmount = adjustedSizes[-1]
+        else:
+            endAmount = self._notional(len(adjustedSizes) - 1, adjustedSizes[-1]) * (1 - last.fee)
+
+        profit = endAmount - startAmount
+
+        return profit
+
+    def printOrderSequence(self, adjustedSizes):
+        """
+        Should only be called if a valid and profitable arbitrage is found. Prints order sequence, at the average price of
+        each order, and profit to the console.
+
+        PARAMETERS
+        ----------
+        - adjustedOrderSizes (list): order sizes that have been adjusted to the base currency precision
+        """
+
+        for index, order in enumerate(self.arbitrage):
+
+            notional = self._notional(index, adjustedSizes[index])
+
+            print('Order {orderNumber}: {side} {size} {base} for {quote} at an average price of {price} {quote} '
+                  'over the order book.\n   --> {flow} {amount} {quote} and a fee of {fee} {quote}.'.format(
+                    orderNumber=str(index + 1),
+                    side='Sell' if order.position == 'short' else 'Buy',
+                    size=adjustedSizes[index],
+                    base=order.pair[0],
+                    quote=order.pair[1],
+                    price=notional / adjustedSizes[index] if adjustedSizes[index] != 0 else order.price,
+                    flow='Get' if order.position == 'short' else 'Pay',
+                    amount=notional * (1 - order.fee) if order.position == 'short' else notional,
+                    fee=notional * order.fee
+                    ))
+
+        ccy = self.arbitrage[0].pair[0] if self.arbitrage[0].position == 'short' else self.arbitrage[0].pair[1]
+        print("\nA profit of {profit} {ccy} can be made via arbitrage.".format(profit=self.calculateProfit(adjustedSizes), ccy=ccy))
@@ -0,0 +1,199 @@
+"""
+Brief: This script contains a class that detects negative cycles in weighted digraphs using the Floyd-Warshall algorithm.
+Description: The Floyd-Warshall algorithm computes the shortest paths between all pairs of vertices. Each of its |vertices| steps
+             allows one more vertex k as an intermediate vertex of the paths: D[i, j] = min(D[i, j], D[i, k] + D[k, j]), done for
+             every pair (i, j) at once as a broadcasted NumPy update. A next-hop matrix records the first vertex after i on the
+             shortest path from i to j, so paths can be rebuilt from the result.
+             At the end, D[v, v] < 0 for every vertex v on a negative cycle, as the cycle is a path from v to itself; and
+             D[v, v] < 0 only if v lies on a negative closed walk, i.e. in a strongly connected component that contains a
+             negative cycle. A negative cycle is rebuilt from every such vertex by following the next hops towards it.
+             Deciding whether a vertex lies on a negative cycle is as hard as finding a Hamiltonian cycle, so neither set of
+             vertices reported is exact: the vertices on negative closed walks may include vertices on no negative cycle, and
+             the vertices of the cycles rebuilt may miss vertices whose negative cycles share an edge with a cycle found first.
+             It costs O(|vertices|^3) whatever the number of edges, and gives the shortest paths between all pairs of currencies
+             (getPath); to find negative cycles only, autoDetector picks the faster SPFA detector.
+             The graph is a SparseGraph, or a dense matrix in which a weight of 0 signals that there is no edge.
+"""
+
+import numpy as np
+
+from bellman_ford_algorithm import BellmanFordAlgorithm
+from spfa_algorithm import SPFAAlgorithm
+from sparse_graph import asSparseGraph
+
+# Distances below this bound are clamped; they are only reached around negative cycles, whose distances double at every step
+DISTANCE_FLOOR = -1e100
+
+
+class FloydWarshallAlgorithm:
+    """
+    Utilises the Floyd-Warshall algorithm to find the vertices on negative closed walks and negative cycles of a weighted digraph.
+    negativeWalkVertices contains every vertex on a negative cycle but may include others; negativeCycleVertices contains only
+    vertices on negative cycles but may miss some (see getAllNegativeCycles).
+    """
+
+    def __init__(self, graph):
+        self.graph = asSparseGraph(graph)  # Graph (SparseGraph)
+        self.vertices = self.graph.vertices  # Number of vertices in the graph (int)
+        self.distances = None  # Shortest distance between every pair of vertices (np.array)
+        self.nextHops = None  # Vertex after i on the shortest path from i to j, -1 if j cannot be reached from i (np.array)
+        self.negativeWalkVertices = []  # Vertices v with D[v, v] < 0, i.e. on a negative closed walk but not always on a negative cycle
+        self.negativeCycleVertices = []  # Vertices of the negative cycles found, in increasing order; may miss some vertices on negative cycles
+        self.negativeCycle = []  # Default empty list for containment of the most profitable negative cycle if exists
+        self.negativeCycles = []  # Default empty list for containment of all distinct negative cycles if exist
+        self.cycleWeights = []  # Sum of the edge weights of each negative cycle, i.e. minus its log-return (float)
+
+    def implementFloydWarshallAlgorithm(self):
+        """
+        Computes the shortest distance and the next hop between every pair of vertices, and the vertices on negative closed walks.
+        """
+
+        self.distances, self.nextHops = self._getShortestPaths(*self.graph.toDense(missing=np.inf))
+        self.negativeWalkVertices = np.flatnonzero(np.diagonal(self.distances) < 0).tolist()
+
+    def _getShortestPaths(self, distances, mask):
+        """
+        PARAMETERS
+        ----------
+        - distances (np.array): a (N, N) matrix of edge weights, infinity where there is no edge
+        - mask (np.array): boolean (N, N) matrix of the edges
+
+        RETURN
+        ------
+        - distances (np.array): shortest distance between every pair of vertices
+        - nextHops (np.array): vertex after i on the shortest path from i to j, -1 if j cannot be reached from i
+        """
+        nextHops = np.where(mask, np.arange(self.vertices)[None, :], -1)
+
+        # An empty path leads from every vertex to itself, unless a negative self-loop is shorter
+        diagonal = np.arange(self.vertices)
+        nextHops[diagonal, diagonal] = diagonal
+        distances[diagonal, diagonal] = np.minimum(distances[diagonal, diagonal], 0)
+
+        for k in range(self.vertices):
+            throughK = distances[:, k, None] + distances[None, k, :]  # Paths i --> k --> j
+            shorter = throughK < distances
+            distances = np.where(shorter, throughK, distances)
+            nextHops = np.where(shorter, nextHops[:, k, None], nextHops)
+            np.maximum(distances, DISTANCE_FLOOR, out=distances)
+
+        return distances, nextHops
+
+    def getPath(self, source, target):
+        """
+        Rebuilds a shortest path from the next-hop matrix. Shortest paths are only defined between vertices that are not on a
+        negative closed walk.
+
+        PARAMETERS
+        ----------
+        - source (int): first vertex of the path
+        - target (int): last vertex of the path
+
+        RETURN
+        ------
+        - path (list/None): vertices of the path in order, None if target cannot be reached from source
+        """
+        if self.nextHops[source, target] == -1:
+            return None
+
+        path = [source]
+        while path[-1] != target and len(path) <= self.vertices:
+            path.append(int(self.nextHops[path[-1], target]))
+        return path
+
+    def rebuildCycle(self, vertex, nextHops=None):
+        """
+        Follows the next hops towards a vertex, starting from it, until a vertex is visited twice.
+
+        PARAMETERS
+        ----------
+        - vertex (int): vertex v with D[v, v] < 0
+        - nextHops (np.array/None): next-hop matrix, by default that of the graph (see implementFloydWarshallAlgorithm)
+
+        RETURN
+        ------
+        - cycle (tuple/None): vertices of the cycle closed by the next hops in order (see BellmanFordAlgorithm.canonicaliseCycle),
+          None if it is not a negative cycle
+        """
+        nextHops = self.nextHops if nextHops is None else nextHops
+
+        order = {}  # Position of each visited vertex on the walk
+        walk = []
+        current = vertex
+        while current not in order and current != -1:
+            order[current] = len(walk)
+            walk.append(current)
+            current = int(nextHops[current, vertex])
+
+        if current == -1:
+            return None
+
+        cycle = walk[order[current]:]
+        if self._getCycleWeight(cycle) >= 0:
+            return None
+        return BellmanFordAlgorithm.canonicaliseCycle(cycle)
+
+    def _getCycleWeight(self, cycle):
+        return sum(float(self.graph[cycle[i], cycle[(i + 1) % len(cycle)]]) for i in range(len(cycle)))
+
+    def getAllNegativeCycles(self):
+        """
+        Finds distinct negative cycles in graph, stored from the most to the least profitable. The negative cycles rebuilt
+        from the vertices with D[v, v] < 0 are collected, and as shortest paths lead to the most negative cycles only, their
+        edges are removed and the distances computed again until no negative cycle is left. A negative cycle that shares an
+        edge with a cycle found before it is therefore not found, and its other vertices may be missing from
+        negativeCycleVertices.
+        """
+
+        self.implementFloydWarshallAlgorithm()
+
+        weights, mask = self.graph.toDense(missing=np.inf)
+        nextHops, vertices = self.nextHops, self.negativeWalkVertices
+        found = set()
+        while True:
+
+            cycles = set(self.rebuildCycle(vertex, nextHops) for vertex in vertices) - {None}
+            if len(cycles) == 0:
+                break
+            found |= cycles
+
+            # Remove the edges of the cycles
+            for cycle in cycles:
+                for index, source in enumerate(cycle):
+                    target = cycle[(index + 1) % len(cycle)]
+                    weights[source, target], mask[source, target] = np.inf, False
+
+            distances, nextHops = self._getShortestPaths(weights.copy(), mask)
+            vertices = np.flatnonzero(np.diagonal(distances) < 0).tolist()
+
+        ranked = sorted((self._getCycleWeight(cycle), cycle) for cycle in found)  # By increasing weight, i.e. decreasing log-return
+        self.negativeCycles = [list(cycle) for weight, cycle in ranked]
+        self.cycleWeights = [weight for weight, cycle in ranked]
+        self.negativeCycleVertices = sorted(set(vertex for cycle in found for vertex in cycle))
+
+    def getANegativeCycle(self):
+        """
+        Finds the most profitable of the negative cycles rebuilt from the vertices on negative closed walks if exists.
+        """
+
+        self.getAllNegativeCycles()
+        if len(self.negativeCycles) > 0:
+            self.negativeCycle = self.negativeCycles[0]
+
+
+def autoDetector(graph):
+    """
+    Creates the detector expected to be the fastest for a graph. In benchmarks/benchmark_floyd_warshall.py the SPFA detector is
+    faster than both the Floyd-Warshall and the Bellman-Ford algorithms at every size and density, from complete baskets of 20
+    currencies to sparse markets of 300, so it is picked for every graph; the Floyd-Warshall algorithm remains available for
+    the shortest paths between all pairs of currencies.
+
+    PARAMETERS
+    ----------
+    - graph (SparseGraph/np.array): graph, or matrix representing the graph
+
+    RETURN
+    ------
+    - (SPFAAlgorithm): detector of the graph
+    """
+    return SPFAAlgorithm(graph)
@@ -1,20 +1,36 @@
 """
-Brief: This script contains a class that builds a digraph matrix.
-Description: The matrix represents a graph where nodes are currencies and weighted edges are the exchange rates.
+Brief: This script contains a class that builds a digraph.
+Description: The graph has currencies as nodes and the exchange rates as weighted edges. It is stored sparsely (see SparseGraph),
+             so its size grows with the number of currency pairs, and an exchange rate of exactly 1 is a valid edge of weight 0.
              Exchange rates are calculated using the best bid and best ask in the order book.
+             With an asyncio client, buildGraphAsync fetches all order books concurrently.
+             Level 2 order books can be requested so that the depth of each book is available for sizing the arbitrages.
+             buildGraphAt rebuilds the graph at any past timestamp from a store of top-of-book history (see OrderBookStore).
 """
 
 import numpy as np
 
+from metrics import METRICS
+from sparse_graph import SparseGraph
+
 
 class GraphConstructor:
-    """ Constructs a digraph matrix. """
+    """ Constructs a digraph. """
 
-    def __init__(self, client, currencies):
+    def __init__(self, client, currencies, level=1, pairs=None):
+        """
+        PARAMETERS
+        ----------
+        - client (object): exchange client
+        - currencies (list): distinct currency codes
+        - level (int): order book level
+        - pairs (list/None): currency pairs between the currencies, e.g. from client.getTradableUniverse(); None to discover them
+        """
         self.client = client  # Exchange client
+        self.level = level  # Order book level; 1 for the best bid/ask only, 2 for the aggregated depth of the book
         self.nodes = currencies  # Distinct currency codes [ccy0, ccy1, ..., ccyN]
         self.nodesKey = self._createCurrencyKeys()  # Record currency code to vertex number relation {ccy0: 0, ccy1: 1, ..., ccyN: N}
-        self.edges = self._getCurrencyPairs()  # Record currency pairs [(BASE, QUOTE), (BASE, QUOTE), ..., (BASE, QUOTE)]
+        self.edges = list(pairs) if pairs is not None else self._getCurrencyPairs()  # Record currency pairs [(BASE, QUOTE), ..., (BASE, QUOTE)]
 
     def _createCurrencyKeys(self):
         """
@@ -31,12 +47,16 @@ class GraphConstructor:
 
     def _getCurrencyPairs(self):
         """
-        Finds all currency pairs given the currency codes.
+        Finds all currency pairs given the currency codes. Clients that index all products on the exchange provide the pairs
+        directly, otherwise the existence of every ordered pair of currencies is checked.
 
          RETURN
          ------
          - graphEdges (list): [(BASE, QUOTE), (BASE, QUOTE), ..., (BASE, QUOTE)]
          """
+        if hasattr(self.client, 'getCurrencyPairs'):
+            return self.client.getCurrencyPairs(self.nodes)
+
         graphEdges = []
 
         for base in self.nodes:
@@ -48,37 +68,99 @@ class GraphConstructor:
 
     def buildGraph(self):
         """
-        Constructs matrix representing graph where currency codes are nodes and exchange rates are weighted edges.
+        Constructs the graph where currency codes are nodes and exchange rates are weighted edges.
 
         RETURN
          ------
-        - graph (np.array): a (N+1, N+1) matrix
+        - graph (SparseGraph): graph of N+1 vertices with two edges per currency pair
         - orderBooks (dict): { (BASE, QUOTE): { order book information }, ..., (BASE, QUOTE): { order book information } }
         """
 
-        n = len(self.nodes)  # Number of nodes in graph
-        orderBooks = {}  # Create store for order books
-        graph = np.zeros((n, n))  # Create matrix to represent the digraph
-
-        # Get all relevant order books
-        for pair in self.edges:
+        # Get all relevant order books, in one batch if the client supports it
+        with METRICS.timer('stage_seconds', stage='order_book_fetch'):
+            if hasattr(self.client, 'getOrderBooks'):
+                orderBooks = self.client.getOrderBooks(self.edges, *self._levelArgument())
+            else:
+                orderBooks = {}  # Create store for order books
+                for pair in self.edges:
 
-            # pair[0] is base/volume currency code, pair[1] is quote/price currency code
-            orderBooks[pair] = self.client.getOrderBook(pair[0], pair[1])
+                    # pair[0] is base/volume currency code, pair[1] is quote/price currency code
+                    orderBooks[pair] = self.client.getOrderBook(pair[0], pair[1], *self._levelArgument())
 
         # Processing is done separately from retrieval of order books so that they are retrieved almost simultaneously
-        for pair in self.edges:
+        with METRICS.timer('stage_seconds', stage='build_graph'):
+            return self._weighEdges(orderBooks), orderBooks
+
+    async def buildGraphAsync(self):
+        """
+        Constructs the same graph as buildGraph using an asyncio client. All order books are requested concurrently,
+        subject to the concurrency limit of the client.
+
+        RETURN
+         ------
+        - graph (SparseGraph): graph of N+1 vertices with two edges per currency pair
+        - orderBooks (dict): { (BASE, QUOTE): { order book information }, ..., (BASE, QUOTE): { order book information } }
+        """
+
+        with METRICS.timer('stage_seconds', stage='order_book_fetch'):
+            orderBooks = await self.client.getOrderBooks(self.edges, *self._levelArgument())
+
+        with METRICS.timer('stage_seconds', stage='build_graph'):
+            return self._weighEdges(orderBooks), orderBooks
+
+    def buildGraphAt(self, store, timestamp):
+        """
+        Rebuilds the graph as it was at a timestamp, from the latest top of book of every currency pair recorded in a store at
+        or before that time. Only the records needed are read from the store.
+
+        PARAMETERS
+        ----------
+        - store (OrderBookStore): store of top-of-book history
+        - timestamp (float): seconds since the epoch
 
-            # Get vertex number that each currency code corresponds to
-            baseNode = self.nodesKey[pair[0]]
-            quoteNode = self.nodesKey[pair[1]]
+        RETURN
+         ------
+        - graph (SparseGraph): graph of N+1 vertices with two edges per currency pair
+        - orderBooks (dict): { (BASE, QUOTE): {'bids': [[bid, quantity]], 'asks': [[ask, quantity]]}, ..., }
+        """
+
+        quotes = store.getLatestQuotes(timestamp, self.edges)
+
+        missingPairs = [pair for pair in self.edges if pair not in quotes]
+        if len(missingPairs) != 0:
+            raise ValueError('No order book has been recorded at or before {} for: {}'.format(
+                timestamp, ', '.join(base + '-' + quote for base, quote in missingPairs)))
+
+        orderBooks = dict([(pair, {'bids': [[bid, bidQty]], 'asks': [[ask, askQty]]})
+                           for pair, (bid, bidQty, ask, askQty) in quotes.items()])
+
+        return self._weighEdges(orderBooks), orderBooks
+
+    def _levelArgument(self):
+        """ The level is only passed to the client if it is not the default, so that clients without depth support still work. """
+        return () if self.level == 1 else (self.level,)
+
+    def _weighEdges(self, orderBooks):
+        """
+        Calculates the weight of every edge in the graph from the order books.
+
+        PARAMETERS
+        ----------
+        - orderBooks (dict): { (BASE, QUOTE): { order book information }, ..., (BASE, QUOTE): { order book information } }
+
+        RETURN
+        ------
+        - graph (SparseGraph): graph of N+1 vertices with two edges per currency pair
+        """
 
-            # Calculate exchange rate for BASE --> QUOTE; this is equal to the best BID price
-            bestBid = orderBooks[pair]['bids'][0][0]  # Get best bid (str)
-            graph[baseNode, quoteNode] = -1 * np.log(eval(bestBid))  # Linearize and assign weight to edge
+        # Get vertex number that each currency code corresponds to; pair[0] is the base, pair[1] the quote currency code
+        baseNodes = np.array([self.nodesKey[pair[0]] for pair in self.edges], dtype=np.intp)
+        quoteNodes = np.array([self.nodesKey[pair[1]] for pair in self.edges], dtype=np.intp)
 
-            # Calculate exchange rate for QUOTE --> BASE; this is equal to 1/(best ASK price)
-            bestAsk = orderBooks[pair]['asks'][0][0]  # Get best ask (str)
-            graph[quoteNode, baseNode] = -1 * np.log(1 / eval(bestAsk))  # Linearize and assign weight to edge
+        # Exchange rate for BASE --> QUOTE is equal to the best BID price, for QUOTE --> BASE to 1/(best ASK price)
+        bestBids = np.array([float(orderBooks[pair]['bids'][0][0]) for pair in self.edges])
+        bestAsks = np.array([float(orderBooks[pair]['asks'][0][0]) for pair in self.edges])
 
-        return graph, orderBooks
+        # Linearize the exchange rates into edge weights
+        return SparseGraph(len(self.nodes), np.concatenate([baseNodes, quoteNodes]), np.concatenate([quoteNodes, baseNodes]),
+                           np.concatenate([-1 * np.log(bestBids), -1 * np.log(1 / bestAsks)]))
@@ -0,0 +1,49 @@
+"""
+Brief: This script contains a class that represents a single order (leg) of an arbitrage cycle.
+Description: Prices, quantities, fees and limits arrive from the exchange as strings. They are parsed once, when the leg is
+             created, so that the analysis of the arbitrage works on floats and ints only.
+             A leg can also carry the depth of the order book side it trades against, for depth-aware sizing.
+"""
+
+
+class Leg:
+    """ Typed representation of one order in an arbitrage cycle. """
+
+    __slots__ = ('pair', 'position', 'availableQuantity', 'price', 'fee', 'basePrecision', 'notionalMinimumLimit', 'depth')
+
+    def __init__(self, pair, position, availableQuantity, price, fee, basePrecision, notionalMinimumLimit, depth=None):
+        """
+        PARAMETERS
+        ----------
+        - pair (tuple): (BASE, QUOTE) currency codes
+        - position (str): 'short' (sell base currency) or 'long' (buy base currency)
+        - availableQuantity (str/float): quantity of base currency available at the best bid/ask price
+        - price (str/float): best bid/ask price
+        - fee (str/float): fee charged per trade (decimal representation of the percentage)
+        - basePrecision (int): base currency precision given as the power of 10
+        - notionalMinimumLimit (str/float): notional minimum limit
+        - depth (list/None): [[price, size, ...], ..., [price, size, ...]] levels of the bids (short) or asks (long) from the
+          best price outwards, None if only the best price is known
+        """
+        self.pair = tuple(pair)
+        self.position = position
+        self.availableQuantity = float(availableQuantity)
+        self.price = float(price)
+        self.fee = float(fee)
+        self.basePrecision = int(basePrecision)
+        self.notionalMinimumLimit = float(notionalMinimumLimit)
+        self.depth = None if depth is None else tuple((float(level[0]), float(level[1])) for level in depth)
+
+    @classmethod
+    def fromDict(cls, data):
+        """
+        Creates a leg from a dictionary with the keys 'pair', 'position', 'availableQuantity', 'price', 'fee', 'basePrecision',
+        'notionalMinimumLimit' and optionally 'depth'. Other keys are ignored.
+        """
+        return cls(*[data[attribute] for attribute in cls.__slots__ if attribute != 'depth'], depth=data.get('depth'))
+
+    def __eq__(self, other):
+        return isinstance(other, Leg) and all(getattr(self, attribute) == getattr(other, attribute) for attribute in self.__slots__)
+
+    def __repr__(self):
+        return 'Leg({})'.format(', '.join('{}={!r}'.format(attribute, getattr(self, attribute)) for attribute in self.__slots__))
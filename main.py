@@ -1,8 +1,16 @@
-from main_implementation import main
+import sys
+
+from main_implementation import main, runScanner
 from clients.coinbase.coinbase_client import CoinbaseClient
 
 client = CoinbaseClient()
 currencies = ['ETH', 'BTC', 'USD', 'EUR', 'ALGO', 'BADGER']
 tradedVolume = 100000000000000
 
-main(client, currencies, tradedVolume)
+# Run with --all to scan every tradable currency pair on the exchange continuously, within a latency budget of 1 second per scan.
+# The product catalog is kept in a metadata file, so that a restarted scanner detects from the first snapshot.
+if '--all' in sys.argv[1:]:
+    client = CoinbaseClient(metadataPath='coinbase_metadata.sqlite')
+    runScanner(client, None, tradedVolume, detector='spfa', latencyBudget=1.0)
+else:
+    main(client, currencies, tradedVolume)
@@ -2,20 +2,120 @@
 Brief: This script contains the main function linking all of the components in the arbitrage detection project.
 """
 
+import signal
+import threading
+import time
+
 from graph_constructor import GraphConstructor
 from strongly_connected_components import ConnectedComponents
 from bellman_ford_algorithm import BellmanFordAlgorithm
+from spfa_algorithm import SPFAAlgorithm
+from short_cycle_algorithm import ShortCycleAlgorithm
+from floyd_warshall_algorithm import FloydWarshallAlgorithm, autoDetector
 from arbitrage_data_collector import ArbitrageDataCollector
 from arbitrage import Arbitrage
+from batch_arbitrage import BatchArbitrage
+from depth_arbitrage import DepthArbitrage
+from order_book_stream import OrderBookStream
+from parallel_detection import ParallelDetector
+from metrics import METRICS
+
+# Negative cycle detectors that can be selected in main; each exposes getAllNegativeCycles() and negativeCycles
+DETECTORS = {'bellman-ford': BellmanFordAlgorithm, 'spfa': SPFAAlgorithm, 'short-cycles': ShortCycleAlgorithm,
+             'floyd-warshall': FloydWarshallAlgorithm, 'auto': autoDetector}
+
+
+def main(client, currencies, tradedVolume=1000000000000, detector='bellman-ford', level=1, metricsPath=None, processes=None):
+    """
+     Each stage is timed into METRICS (see metrics.py).
+
+     PARAMETERS
+     ----------
+     - client (object): exchange client object
+     - currencies (list/None): distinct currency codes, None for every tradable currency on the exchange
+     - tradedVolume (int/float): 30-day USD trading volume required for fee calculation
+     - detector (str): negative cycle detector, one of the keys of DETECTORS
+     - level (int): order book level; with level 2 the arbitrages are sized over the depth of the books (see DepthArbitrage)
+     - metricsPath (str/None): file to which the metrics are written in the Prometheus text format at the end
+     - processes (int/None): number of processes searching the strongly connected components in parallel (see
+       ParallelDetector), None to search them one at a time
+
+     RETURN
+     ------
+     - opportunities (list): every arbitrage found in the snapshot, see analyseArbitrage
+     """
+
+    graphObject = _createGraphConstructor(client, currencies, level)
+    graph, orderBooks = graphObject.buildGraph()
+
+    if processes is None:
+        opportunities = detectArbitrage(client, graphObject, graph, orderBooks, tradedVolume, detector, depthAware=level > 1)
+    else:
+        with ParallelDetector(processes) as parallelDetector:
+            opportunities = detectArbitrage(client, graphObject, graph, orderBooks, tradedVolume, detector, depthAware=level > 1,
+                                            parallelDetector=parallelDetector)
+
+    client.closeSession()
+
+    if metricsPath is not None:
+        METRICS.writePrometheus(metricsPath)
+
+    return opportunities
 
 
-def main(client, currencies, tradedVolume=1000000000000):
+async def mainAsync(client, currencies, tradedVolume=1000000000000, detector='bellman-ford'):
     """
+     Same as main for an asyncio client (see AsyncCoinbaseClient); all order books are fetched concurrently.
+
+     PARAMETERS
+     ----------
+     - client (object): asyncio exchange client object
+     - currencies (list): distinct currency codes
+     - tradedVolume (int/float): 30-day USD trading volume required for fee calculation
+     - detector (str): negative cycle detector, one of the keys of DETECTORS
+
+     RETURN
+     ------
+     - opportunities (list): every arbitrage found in the snapshot, see analyseArbitrage
+     """
+
+    with METRICS.timer('stage_seconds', stage='catalog_load'):
+        await client.loadCatalog()
+
+    # Check if all input currencies are available on the exchange; raises an error if not
+    with METRICS.timer('stage_seconds', stage='currency_check'):
+        client.checkCurrenciesExistence(currencies)
+
+    with METRICS.timer('stage_seconds', stage='pair_discovery'):
+        graphObject = GraphConstructor(client, currencies)
+    graph, orderBooks = await graphObject.buildGraphAsync()
+
+    opportunities = detectArbitrage(client, graphObject, graph, orderBooks, tradedVolume, detector)
+
+    await client.closeSession()
+
+    return opportunities
+
+
+async def mainStreaming(client, currencies, tradedVolume=1000000000000, detector='bellman-ford',
+                        feedUrl='wss://ws-feed.exchange.coinbase.com', channels=('level2_batch',), maxMessages=None):
+    """
+     Builds the graph once from the REST order books and then keeps it up to date from the WebSocket feed.
+     Detection runs after every price change and only arbitrages that are found are printed to the console.
+
      PARAMETERS
      ----------
      - client (object): exchange client object
      - currencies (list): distinct currency codes
      - tradedVolume (int/float): 30-day USD trading volume required for fee calculation
+     - detector (str): negative cycle detector, one of the keys of DETECTORS
+     - feedUrl (str): WebSocket feed URL
+     - channels (tuple): feed channels to subscribe to
+     - maxMessages (int/None): stop after this number of messages, None to run until the connection closes
+
+     RETURN
+     ------
+     - stream (OrderBookStream): the stream, holding the final graph and the update-to-detection latencies
      """
 
     # Check if all input currencies are available on the exchange; raises an error if not
@@ -24,62 +124,403 @@ def main(client, currencies, tradedVolume=1000000000000):
     graphObject = GraphConstructor(client, currencies)
     graph, orderBooks = graphObject.buildGraph()
 
-    # Get information regarding the strongly connected components in the graph
-    connectedComponentsObject = ConnectedComponents(graph)
-    connectedComponents = connectedComponentsObject.getConnectedComponents()
+    # The streamed currency pairs do not change, hence neither do the strongly connected components
+    with METRICS.timer('stage_seconds', stage='scc_build'):
+        connectedComponentsObject = ConnectedComponents(graph)
 
-    # Check if there are any strongly connected components with 3 or more vertices
-    if len(connectedComponents['components']) != 0:
+    def onUpdate(graph, orderBooks, pair):
+        cycles = findNegativeCycles(graph, detector, connectedComponentsObject) or []
+        analyseArbitrages(client, graphObject, cycles, orderBooks, tradedVolume)
+
+    stream = OrderBookStream(graphObject.nodesKey, graphObject.edges, graph, orderBooks)
+    try:
+        await stream.run(feedUrl, onUpdate, channels, maxMessages)
+    finally:
+        client.closeSession()
+
+    return stream
+
+
+def runScanner(client, currencies, tradedVolume=1000000000000, detector='bellman-ford', interval=1.0, maxScans=None, level=1,
+               metricsPath=None, processes=None, latencyBudget=None):
+    """
+     Scans the exchange continuously. The session, the currency pairs and the strongly connected components are kept alive
+     across scans, so that each scan only fetches the order books and runs detection. Stops after maxScans scans or on
+     SIGINT/SIGTERM, finishing the current scan first.
+     Sending SIGUSR1 switches the profiler (see METRICS.enableProfiling) on, and sending it again switches it off and prints
+     the report, so that a slow scanner can be profiled without restarting it.
+
+     PARAMETERS
+     ----------
+     - client (object): exchange client object
+     - currencies (list/None): distinct currency codes, None for every tradable currency on the exchange (see
+       getTradableUniverse of the client); the universe is discovered once, when the scanner starts
+     - tradedVolume (int/float): 30-day USD trading volume required for fee calculation
+     - detector (str): negative cycle detector, one of the keys of DETECTORS
+     - interval (float/None): seconds between the starts of two scans, None to scan as fast as possible
+     - maxScans (int/None): number of scans after which to stop, None to run until a signal is received
+     - level (int): order book level; with level 2 the arbitrages are sized over the depth of the books (see DepthArbitrage)
+     - metricsPath (str/None): file to which the metrics are written in the Prometheus text format after every scan
+     - processes (int/None): number of processes searching the strongly connected components in parallel (see
+       ParallelDetector), None to search them one at a time; the pool is kept across scans
+     - latencyBudget (float/None): target duration of a scan in seconds; every scan is reported against it
+
+     RETURN
+     ------
+     - timings (list): per scan dictionaries with 'scan', 'fetch', 'detection', 'total' (seconds) and 'opportunities' (int),
+       and with a latency budget 'budget' (seconds) and 'withinBudget' (bool)
+     """
+
+    stopEvent = threading.Event()
+    previousHandlers = {}
+
+    # Signal handlers can only be installed from the main thread
+    if threading.current_thread() is threading.main_thread():
+        for signalNumber in (signal.SIGINT, signal.SIGTERM):
+            previousHandlers[signalNumber] = signal.signal(signalNumber, lambda number, frame: stopEvent.set())
+        if hasattr(signal, 'SIGUSR1'):  # Not available on Windows
+            previousHandlers[signal.SIGUSR1] = signal.signal(signal.SIGUSR1, lambda number, frame: _toggleProfiling())
+
+    timings = []
+    parallelDetector = None
+
+    try:
+        if processes is not None:
+            parallelDetector = ParallelDetector(processes)
+        graphObject = _createGraphConstructor(client, currencies, level)
+        connectedComponentsObject = None
+
+        while not stopEvent.is_set() and (maxScans is None or len(timings) < maxScans):
+
+            start = time.perf_counter()
+            graph, orderBooks = graphObject.buildGraph()
+            fetched = time.perf_counter()
+
+            # The currency pairs do not change between scans, hence neither do the strongly connected components
+            if connectedComponentsObject is None:
+                with METRICS.timer('stage_seconds', stage='scc_build'):
+                    connectedComponentsObject = ConnectedComponents(graph)
+
+            opportunities = detectArbitrage(client, graphObject, graph, orderBooks, tradedVolume, detector,
+                                            connectedComponentsObject, depthAware=level > 1, parallelDetector=parallelDetector)
+            end = time.perf_counter()
+            METRICS.observe('stage_seconds', end - start, stage='scan')
+
+            timings.append({'scan': len(timings) + 1, 'fetch': fetched - start, 'detection': end - fetched,
+                            'total': end - start, 'opportunities': len(opportunities)})
+            report = 'Scan {scan}: fetch {fetch:.4f}s, detection {detection:.4f}s, total {total:.4f}s'.format(**timings[-1])
+
+            if latencyBudget is not None:
+                timings[-1].update({'budget': latencyBudget, 'withinBudget': end - start <= latencyBudget})
+                if not timings[-1]['withinBudget']:
+                    METRICS.increment('scans_over_budget')
+                report += ' ({} budget of {:.4f}s)'.format('within' if timings[-1]['withinBudget'] else 'OVER', latencyBudget)
+
+            print(report + ', {} arbitrage(s) found.'.format(len(opportunities)))
+
+            if metricsPath is not None:
+                METRICS.writePrometheus(metricsPath)
+
+            if interval is not None:
+                stopEvent.wait(max(0, interval - (end - start)))
+
+    finally:
+        for signalNumber, handler in previousHandlers.items():
+            signal.signal(signalNumber, handler)
+        if parallelDetector is not None:
+            parallelDetector.close()
+        client.closeSession()
+
+    if METRICS.profiler is not None:
+        print(METRICS.disableProfiling())
+
+    if len(timings) != 0:
+        busy = sum(timing['total'] for timing in timings)
+        print('{scans} scan(s), {rate:.2f} scans per second of scanning time.'.format(scans=len(timings), rate=len(timings) / busy))
+        if latencyBudget is not None:
+            print('{within} of {scans} scan(s) within the latency budget of {budget:.4f}s, slowest {slowest:.4f}s.'.format(
+                within=sum(timing['withinBudget'] for timing in timings), scans=len(timings), budget=latencyBudget,
+                slowest=max(timing['total'] for timing in timings)))
+
+    return timings
+
+
+def runBacktest(client, currencies, tradedVolume=1000000000000, detector='bellman-ford', level=1):
+    """
+     Runs the detection over every snapshot of a replay client (see ReplayClient) at CPU speed. The currency pairs and the
+     strongly connected components are kept across snapshots, as in runScanner.
+
+     PARAMETERS
+     ----------
+     - client (ReplayClient): client replaying recorded snapshots
+     - currencies (list): distinct currency codes
+     - tradedVolume (int/float): 30-day USD trading volume required for fee calculation
+     - detector (str): negative cycle detector, one of the keys of DETECTORS
+     - level (int): order book level; with level 2 the arbitrages are sized over the depth of the books (see DepthArbitrage)
+
+     RETURN
+     ------
+     - results (list): per snapshot dictionaries with 'snapshot' (int), 'timestamp' (float), 'opportunities' (int) and
+       'profitable' (int, number of valid and profitable arbitrages)
+     """
 
-        arbTemp = False  # Keep track if arbitrage has been detected or not
+    # Check if all input currencies have been recorded; raises an error if not
+    client.checkCurrenciesExistence(currencies)
 
-        # Iterate through the connected components
-        for index, component in enumerate(connectedComponents['components']):
+    graphObject = GraphConstructor(client, currencies, level)
+    connectedComponentsObject = None
+    results = []
 
-            BFObject = BellmanFordAlgorithm(component['subGraph'])
-            BFObject.getANegativeCycle()
-            negativeCycle = BFObject.negativeCycle  # Get negative cycle
+    start = time.perf_counter()
 
-            if len(negativeCycle) != 0:
+    while client.position + 1 < client.snapshotCount:
 
-                arbTemp = True  # Arbitrage has been found so set to True
+        graph, orderBooks = graphObject.buildGraph()  # Moves the client on to the next snapshot
 
-                # Decode the cycle
-                vertexDict = dict(component['componentVerticesMap'])
-                arbitrageCycle = [vertexDict[v] for v in negativeCycle]  # Arbitrage cycle with original vertex numbers
+        if connectedComponentsObject is None:
+            connectedComponentsObject = ConnectedComponents(graph)
 
-                arbDataObject = ArbitrageDataCollector(
-                    client=client,
-                    nodesKey=graphObject.nodesKey,
-                    cycle=arbitrageCycle,
-                    edges=graphObject.edges,
-                    orderBooks=orderBooks,
-                    tradedVolume=tradedVolume
-                )
-                arbData = arbDataObject.extractArbitrageData()
-                arbitrage = Arbitrage(arbData)
+        opportunities = detectArbitrage(client, graphObject, graph, orderBooks, tradedVolume, detector,
+                                        connectedComponentsObject, depthAware=level > 1)
 
-                sizes = arbitrage.calculateMaximumOrderSize()
-                adjustedSizes = arbitrage.adjustOrderSizeForBaseTickSize(sizes)  # Adjust maximum order size for base currency precision
+        results.append({'snapshot': client.position + 1, 'timestamp': client.getTime()['epoch'],
+                        'opportunities': len(opportunities),
+                        'profitable': sum(1 for opportunity in opportunities if opportunity['valid'] and opportunity['profit'] > 0)})
+        print('Snapshot {snapshot} ({timestamp:.3f}): {opportunities} arbitrage(s) found, {profitable} profitable.'.format(**results[-1]))
 
-                # Check notional minimum limit requirement is passed
-                if arbitrage.checkNotionalMinimumLimit(adjustedSizes):  # If True
+    elapsed = time.perf_counter() - start
 
-                    # Calculate profit
-                    if arbitrage.calculateProfit(adjustedSizes) > 0:
-                        print("A profitable arbitrage has been found.\n")
-                        arbitrage.printOrderSequence(adjustedSizes)  # Prints order sequence and profit to console
-                    else:
-                        print('An arbitrage has been found. It satisfies the notional minimum limit requirements. It makes NO profit.')
-                else:
-                    print('An arbitrage has been found. It does NOT satisfy the notional minimum limit requirements.')
+    if len(results) != 0:
+        print('{snapshots} snapshot(s) replayed at {rate:.2f} snapshots per second.'.format(snapshots=len(results), rate=len(results) / elapsed))
 
-                break
+    client.closeSession()
 
-            if not arbTemp:
-                print('No arbitrage has been found.')
+    return results
 
+
+def _toggleProfiling():
+    """ Switches the profiler on, or off printing its report. Installed as the SIGUSR1 handler of runScanner. """
+    if METRICS.profiler is None:
+        METRICS.enableProfiling()
+        print('Profiling enabled; send SIGUSR1 again to print the report.')
     else:
+        print(METRICS.disableProfiling())
+
+
+def _createGraphConstructor(client, currencies, level=1):
+    """
+     Checks that the currencies are available on the exchange, raising an error if not, and finds their currency pairs.
+     If currencies is None, every tradable currency pair on the exchange is used instead.
+
+     RETURN
+     ------
+     - graphObject (GraphConstructor): constructor of the graph
+     """
+
+    if currencies is None:
+        with METRICS.timer('stage_seconds', stage='pair_discovery'):
+            currencies, pairs = client.getTradableUniverse()
+            graphObject = GraphConstructor(client, currencies, level, pairs)
+        print('Scanning the whole exchange: {} currencies, {} currency pairs.'.format(len(currencies), len(pairs)))
+        return graphObject
+
+    with METRICS.timer('stage_seconds', stage='currency_check'):
+        client.checkCurrenciesExistence(currencies)
+
+    with METRICS.timer('stage_seconds', stage='pair_discovery'):
+        return GraphConstructor(client, currencies, level)
+
+
+def detectArbitrage(client, graphObject, graph, orderBooks, tradedVolume, detector='bellman-ford', connectedComponentsObject=None,
+                    depthAware=False, parallelDetector=None):
+    """
+     Finds every negative cycle in the graph, sizes it and prints the result to the console.
+
+     PARAMETERS
+     ----------
+     - client (object): exchange client object
+     - graphObject (GraphConstructor): constructor of the graph
+     - graph (SparseGraph/np.array): graph, or matrix representing the graph
+     - orderBooks (dict): order books used to build the graph
+     - tradedVolume (int/float): 30-day USD trading volume required for fee calculation
+     - detector (str): negative cycle detector, one of the keys of DETECTORS
+     - connectedComponentsObject (ConnectedComponents/None): components of a graph with the same edges, to be reused
+     - depthAware (bool): size the arbitrages over every level of the order books, see analyseArbitrages
+     - parallelDetector (ParallelDetector/None): process pool searching the components in parallel, see findNegativeCycles
+
+     RETURN
+     ------
+     - opportunities (list): every arbitrage found in the graph, see analyseArbitrage
+     """
+
+    arbitrageCycles = findNegativeCycles(graph, detector, connectedComponentsObject, parallelDetector)
+
+    if arbitrageCycles is None:
+        METRICS.increment('scans')
         print('Given the currencies and the client, it is not possible to get an arbitrage.')
+        return []
 
-    client.closeSession()
+    opportunities = analyseArbitrages(client, graphObject, arbitrageCycles, orderBooks, tradedVolume, depthAware)
+    METRICS.increment('scans')
+    METRICS.increment('opportunities', len(opportunities))
+
+    if len(opportunities) == 0:
+        print('No arbitrage has been found.')
+
+    return opportunities
+
+
+def findNegativeCycles(graph, detector='bellman-ford', connectedComponentsObject=None, parallelDetector=None):
+    """
+     Finds distinct negative cycles in the strongly connected components of the graph. The detectors remove the edges of
+     every cycle they find, so a cycle that shares an edge with a cycle found before it is skipped.
+
+     PARAMETERS
+     ----------
+     - graph (SparseGraph/np.array): graph, or matrix representing the graph
+     - detector (str): negative cycle detector, one of the keys of DETECTORS
+     - connectedComponentsObject (ConnectedComponents/None): components of a graph with the same edges, to be reused
+     - parallelDetector (ParallelDetector/None): process pool searching the components in parallel; the cycles are the same
+       and in the same order as those of the sequential search
+
+     RETURN
+     ------
+     - arbitrageCycles (list/None): negative cycles with original vertex numbers, None if there is no strongly connected
+       component with 3 or more vertices
+     """
+
+    detectorClass = DETECTORS[detector]
+
+    if parallelDetector is not None:
+        with METRICS.timer('stage_seconds', stage='scc'):
+            if connectedComponentsObject is None:
+                connectedComponentsObject = ConnectedComponents(graph)
+                connectedComponentsObject.getConnectedComponents()
+        with METRICS.timer('stage_seconds', stage=detector):
+            return parallelDetector.findNegativeCycles(graph, detectorClass, connectedComponentsObject)
+
+    # Get information regarding the strongly connected components in the graph
+    with METRICS.timer('stage_seconds', stage='scc'):
+        if connectedComponentsObject is None:
+            connectedComponents = ConnectedComponents(graph).getConnectedComponents()
+        else:
+            connectedComponents = connectedComponentsObject.getConnectedComponentsOf(graph)
+
+    # Check if there are any strongly connected components with 3 or more vertices
+    if len(connectedComponents['components']) == 0:
+        return None
+
+    arbitrageCycles = []
+
+    # Iterate through the connected components
+    for component in connectedComponents['components']:
+
+        with METRICS.timer('stage_seconds', stage=detector):
+            detectorObject = detectorClass(component['subGraph'])
+            detectorObject.getAllNegativeCycles()
+
+        # Iterate through every distinct negative cycle in the component
+        for negativeCycle in detectorObject.negativeCycles:
+
+            # Decode the cycle
+            vertexDict = dict(component['componentVerticesMap'])
+            arbitrageCycles.append([vertexDict[v] for v in negativeCycle])  # Arbitrage cycle with original vertex numbers
+
+    return arbitrageCycles
+
+
+def analyseArbitrage(client, graphObject, arbitrageCycle, orderBooks, tradedVolume):
+    """
+    Sizes an arbitrage cycle and prints the result to the console.
+
+     PARAMETERS
+     ----------
+     - client (object): exchange client object
+     - graphObject (GraphConstructor): constructor of the graph in which the cycle has been found
+     - arbitrageCycle (list): vertices of the arbitrage cycle in order
+     - orderBooks (dict): order books used to build the graph
+     - tradedVolume (int/float): 30-day USD trading volume required for fee calculation
+
+     RETURN
+     ------
+     - opportunity (dict):
+        - 'cycle' (str | key) --> currency codes in the arbitrage cycle in order (list | value)
+        - 'sizes' (str | key) --> maximum order sizes adjusted to the base currency precision (list | value)
+        - 'valid' (str | key) --> True if the notional minimum limit requirements are satisfied (Boolean | value)
+        - 'profit' (str | key) --> profit of the arbitrage, None if it is not valid (float | value)
+     """
+
+    return analyseArbitrages(client, graphObject, [arbitrageCycle], orderBooks, tradedVolume)[0]
+
+
+def analyseArbitrages(client, graphObject, arbitrageCycles, orderBooks, tradedVolume, depthAware=False):
+    """
+    Sizes several arbitrage cycles at once (see BatchArbitrage) and prints the result of each to the console.
+    Depth-aware sizing (see DepthArbitrage) finds the profit-maximising volume of each cycle over every level of the order
+    books instead, using the levels already held in orderBooks.
+
+     PARAMETERS
+     ----------
+     - client (object): exchange client object
+     - graphObject (GraphConstructor): constructor of the graph in which the cycles have been found
+     - arbitrageCycles (list): vertices of each arbitrage cycle in order
+     - orderBooks (dict): order books used to build the graph
+     - tradedVolume (int/float): 30-day USD trading volume required for fee calculation
+     - depthAware (bool): size the arbitrages over every level of the order books
+
+     RETURN
+     ------
+     - opportunities (list): one dictionary per cycle, see analyseArbitrage
+     """
+
+    if len(arbitrageCycles) == 0:
+        return []
+
+    with METRICS.timer('stage_seconds', stage='sizing'):
+        arbDataObjects = [ArbitrageDataCollector(
+            client=client,
+            nodesKey=graphObject.nodesKey,
+            cycle=arbitrageCycle,
+            edges=graphObject.edges,
+            orderBooks=orderBooks,
+            tradedVolume=tradedVolume
+        ) for arbitrageCycle in arbitrageCycles]
+        arbData = [arbDataObject.extractArbitrageData() for arbDataObject in arbDataObjects]
+
+        if depthAware:
+            arbitrageObjects = [DepthArbitrage(data) for data in arbData]
+            adjustedSizes = [arbitrageObject.adjustOrderSizeForBaseTickSize(arbitrageObject.calculateMaximumOrderSize())
+                             for arbitrageObject in arbitrageObjects]
+            valid = [arbitrageObject.checkNotionalMinimumLimit(sizes) for arbitrageObject, sizes in zip(arbitrageObjects, adjustedSizes)]
+            profits = [arbitrageObject.calculateProfit(sizes) for arbitrageObject, sizes in zip(arbitrageObjects, adjustedSizes)]
+        else:
+            arbitrageObjects = [Arbitrage(data) for data in arbData]
+            batch = BatchArbitrage.fromLegs(arbData)
+            adjustedSizes = batch.adjustOrderSizeForBaseTickSize(batch.calculateMaximumOrderSize())  # Adjust for base currency precision
+            valid = batch.checkNotionalMinimumLimit(adjustedSizes)
+            profits = batch.calculateProfit(adjustedSizes)
+
+    opportunities = []
+
+    for index, arbDataObject in enumerate(arbDataObjects):
+
+        cycleSizes = [float(size) for size in adjustedSizes[index][:len(arbData[index])]]
+        opportunity = {'cycle': arbDataObject.cycle, 'sizes': cycleSizes, 'valid': bool(valid[index]), 'profit': None}
+
+        # Check notional minimum limit requirement is passed
+        if opportunity['valid']:
+
+            opportunity['profit'] = float(profits[index])
+
+            # Calculate profit
+            if opportunity['profit'] > 0:
+                print("A profitable arbitrage has been found.\n")
+                arbitrageObjects[index].printOrderSequence(cycleSizes)  # Prints order sequence and profit to console
+            else:
+                print('An arbitrage has been found. It satisfies the notional minimum limit requirements. It makes NO profit.')
+        else:
+            print('An arbitrage has been found. It does NOT satisfy the notional minimum limit requirements.')
+
+        opportunities.append(opportunity)
+
+    return opportunities
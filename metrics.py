@@ -0,0 +1,270 @@
+"""
+Brief: This script contains the timing instrumentation and metrics of the program.
+Description: A registry keeps counters and latency histograms, labelled by name and label values. The stages of
+             main_implementation and every HTTP request sent by the base clients are timed into the default registry METRICS.
+             Histograms keep the most recent observations to give p50/p95/p99, as well as the total count and sum of all
+             observations. Metrics are exported in the Prometheus text format, to a file or from a local HTTP endpoint.
+             A cProfile profiler can be switched on and off at runtime to find where the time goes within a stage.
+"""
+
+from collections import deque
+from contextlib import contextmanager
+import cProfile
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import io
+import os
+import pstats
+import threading
+import time
+
+import numpy as np
+
+QUANTILES = (0.5, 0.95, 0.99)
+
+
+class Histogram:
+    """ Latency histogram keeping the most recent observations, the count and the sum of all observations. """
+
+    def __init__(self, window=10000):
+        self.samples = deque(maxlen=window)  # Most recent observations
+        self.count = 0  # Number of observations (int)
+        self.sum = 0.0  # Sum of all observations (float)
+
+    def observe(self, value):
+        self.samples.append(value)
+        self.count += 1
+        self.sum += value
+
+    def getQuantiles(self, quantiles=QUANTILES):
+        """
+        RETURN
+        ------
+        - (dict): { quantile: value } over the most recent observations, NaN if there are none
+        """
+        if len(self.samples) == 0:
+            return dict([(quantile, float('nan')) for quantile in quantiles])
+        values = np.quantile(np.fromiter(self.samples, float, len(self.samples)), quantiles)
+        return dict(zip(quantiles, values.tolist()))
+
+
+class MetricsRegistry:
+    """ Counters and histograms, with Prometheus export and an optional profiler. """
+
+    def __init__(self, namespace='arbitrage', window=10000):
+        """
+        PARAMETERS
+        ----------
+        - namespace (str): prefix of the exported metric names
+        - window (int): number of recent observations kept by each histogram
+        """
+        self.namespace = namespace
+        self.window = window
+        self.enabled = True  # Nothing is recorded when False
+        self.counters = {}  # { (name, labels): value } where labels is a sorted tuple of (label, value)
+        self.histograms = {}  # { (name, labels): Histogram }
+        self.descriptions = {}  # { name: help text }
+        self.profiler = None  # cProfile.Profile while profiling is enabled
+        self._lock = threading.Lock()
+        self._server = None
+
+    @staticmethod
+    def _key(name, labels):
+        return name, tuple(sorted((label, str(value)) for label, value in labels.items()))
+
+    def describe(self, name, description):
+        """ Sets the help text of a metric in the Prometheus export. """
+        self.descriptions[name] = description
+
+    def increment(self, name, value=1, **labels):
+        """ Adds a value to a counter. """
+        if not self.enabled:
+            return
+        key = self._key(name, labels)
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def observe(self, name, value, **labels):
+        """ Records an observation (in seconds for timings) in a histogram. """
+        if not self.enabled:
+            return
+        key = self._key(name, labels)
+        with self._lock:
+            if key not in self.histograms:
+                self.histograms[key] = Histogram(self.window)
+            self.histograms[key].observe(value)
+
+    @contextmanager
+    def timer(self, name, **labels):
+        """ Times the enclosed block into a histogram, even if it raises. """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def getCounter(self, name, **labels):
+        return self.counters.get(self._key(name, labels), 0)
+
+    def getHistogram(self, name, **labels):
+        """ RETURN: (Histogram/None) histogram with the given labels, None if nothing has been observed """
+        return self.histograms.get(self._key(name, labels))
+
+    def getSummary(self, name):
+        """
+        Summarises every histogram of a metric.
+
+        RETURN
+        ------
+        - (dict): { labels (dict as a sorted tuple): {'count', 'sum', 'p50', 'p95', 'p99'} }
+        """
+        with self._lock:
+            histograms = [(key[1], histogram) for key, histogram in self.histograms.items() if key[0] == name]
+        summary = {}
+        for labels, histogram in histograms:
+            quantiles = histogram.getQuantiles()
+            summary[labels] = {'count': histogram.count, 'sum': histogram.sum,
+                               'p50': quantiles[0.5], 'p95': quantiles[0.95], 'p99': quantiles[0.99]}
+        return summary
+
+    def reset(self):
+        """ Removes all counters and histograms. """
+        with self._lock:
+            self.counters.clear()
+            self.histograms.clear()
+
+    # --------------------------------------------------------------------------------------------------------- profiling
+
+    def enableProfiling(self):
+        """ Starts a cProfile profiler in the calling thread; it runs until disableProfiling is called. """
+        if self.profiler is None:
+            self.profiler = cProfile.Profile()
+            self.profiler.enable()
+
+    def disableProfiling(self, path=None, limit=25):
+        """
+        Stops the profiler.
+
+        PARAMETERS
+        ----------
+        - path (str/None): file to which the raw profile is dumped, for snakeviz or pstats
+        - limit (int): number of functions listed in the report
+
+        RETURN
+        ------
+        - (str): the functions with the highest cumulative time, empty if profiling was not enabled
+        """
+        if self.profiler is None:
+            return ''
+        self.profiler.disable()
+        if path is not None:
+            self.profiler.dump_stats(path)
+        output = io.StringIO()
+        pstats.Stats(self.profiler, stream=output).sort_stats('cumulative').print_stats(limit)
+        self.profiler = None
+        return output.getvalue()
+
+    # ------------------------------------------------------------------------------------------------------------ export
+
+    def toPrometheus(self):
+        """
+        RETURN
+        ------
+        - (str): all metrics in the Prometheus text exposition format; histograms are exported as summaries
+        """
+        def formatLabels(labels, extra=()):
+            labels = list(labels) + list(extra)
+            if len(labels) == 0:
+                return ''
+            return '{' + ','.join('{}="{}"'.format(label, value.replace('\\', '\\\\').replace('"', '\\"')) for label, value in labels) + '}'
+
+        with self._lock:
+            counters = sorted(self.counters.items())
+            histograms = sorted(self.histograms.items(), key=lambda item: item[0])
+
+        lines = []
+        names = set()
+        for (name, labels), value in counters:
+            metric = '{}_{}_total'.format(self.namespace, name)
+            if name not in names:
+                names.add(name)
+                lines.append('# HELP {} {}'.format(metric, self.descriptions.get(name, name)))
+                lines.append('# TYPE {} counter'.format(metric))
+            lines.append('{}{} {}'.format(metric, formatLabels(labels), value))
+
+        for (name, labels), histogram in histograms:
+            metric = '{}_{}'.format(self.namespace, name)
+            if name not in names:
+                names.add(name)
+                lines.append('# HELP {} {}'.format(metric, self.descriptions.get(name, name)))
+                lines.append('# TYPE {} summary'.format(metric))
+            for quantile, value in histogram.getQuantiles().items():
+                lines.append('{}{} {!r}'.format(metric, formatLabels(labels, [('quantile', str(quantile))]), value))
+            lines.append('{}_sum{} {!r}'.format(metric, formatLabels(labels), histogram.sum))
+            lines.append('{}_count{} {}'.format(metric, formatLabels(labels), histogram.count))
+
+        return '\n'.join(lines) + '\n'
+
+    def writePrometheus(self, path):
+        """ Writes all metrics to a file in the Prometheus text format, e.g. for the node exporter textfile collector. """
+        temporaryPath = path + '.tmp'
+        with open(temporaryPath, 'w') as file:
+            file.write(self.toPrometheus())
+        os.replace(temporaryPath, path)  # Replaced in one step, so that a collector never reads a partially written file
+
+    def serve(self, port=8000, host='127.0.0.1'):
+        """
+        Serves all metrics in the Prometheus text format at http://host:port/metrics from a background thread.
+
+        RETURN
+        ------
+        - (str): URL of the endpoint
+        """
+        registry = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+
+            def do_GET(self):
+                if self.path.split('?')[0] != '/metrics':
+                    self.send_error(404)
+                    return
+                body = registry.toPrometheus().encode()
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), MetricsHandler)
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return 'http://{}:{}/metrics'.format(host, self._server.server_address[1])
+
+    def stopServing(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+
+def endpointTemplate(endpoint):
+    """
+    Replaces the resource id of a REST endpoint by {id}, so that all products share one label: '/products/BTC-USD/book'
+    becomes '/products/{id}/book'.
+    """
+    segments = endpoint.split('/')
+    if len(segments) > 2 and segments[2] != '':
+        segments[2] = '{id}'
+    return '/'.join(segments)
+
+
+METRICS = MetricsRegistry()  # Default registry used by the program
+METRICS.describe('stage_seconds', 'Seconds spent in each stage of a scan')
+METRICS.describe('http_request_seconds', 'Seconds taken by each HTTP request to the exchange')
+METRICS.describe('http_requests', 'HTTP requests sent to the exchange by status code')
+METRICS.describe('http_throttled', 'HTTP requests answered with 429 (rate limit exceeded) by the exchange')
+METRICS.describe('http_retries', 'HTTP requests sent again after a 429 or 5xx response')
+METRICS.describe('scans', 'Scans completed')
+METRICS.describe('opportunities', 'Arbitrages found')
+METRICS.describe('scans_over_budget', 'Scans that took longer than the latency budget')
@@ -0,0 +1,136 @@
+"""
+Brief: This script contains a class that keeps the digraph up to date from the Coinbase Pro WebSocket feed.
+Description: The feed pushes level2 order book snapshots and updates (and optionally ticker messages) for each subscribed
+             currency pair. The best bid and best ask of every pair are kept in memory and only the two edge weights of a pair
+             whose best bid or best ask price has changed are rewritten in the graph, so detection can run on the latest
+             prices without polling the REST order book endpoint.
+             https://docs.cloud.coinbase.com/exchange/docs/websocket-channels
+"""
+
+import json
+import time
+
+import numpy as np
+
+
+class OrderBookStream:
+    """ Maintains top-of-book prices and the digraph from level2/ticker WebSocket messages. """
+
+    def __init__(self, nodesKey, edges, graph, orderBooks=None):
+        self.nodesKey = nodesKey  # Currency code to vertex number relation {ccy0: 0, ccy1: 1, ..., ccyN: N}
+        self.edges = edges  # Currency pairs [(BASE, QUOTE), (BASE, QUOTE), ..., (BASE, QUOTE)]
+        self.graph = graph  # Digraph, updated in place (SparseGraph/np.array)
+        self.orderBooks = dict(orderBooks) if orderBooks is not None else {}  # Top of book per pair, in the REST order book format
+        self.products = dict([(base + '-' + quote, (base, quote)) for base, quote in edges])  # Product ID to currency pair relation
+        self.levels = {}  # { (BASE, QUOTE): {'bids': {price: [price, size]}, 'asks': {...}} } level2 books keyed by float price
+        self.weightUpdates = 0  # Number of edge weights rewritten (int)
+        self.latencies = []  # Seconds from receipt of a message to the end of the update callback (list)
+
+    def handleMessage(self, message):
+        """
+        Applies a feed message to the in-memory order books and to the graph.
+
+        PARAMETERS
+        ----------
+        - message (dict): decoded WebSocket message
+
+        RETURN
+        ------
+        - pair (tuple/None): (BASE, QUOTE) if the best bid or best ask price of the pair changed, else None
+        """
+        pair = self.products.get(message.get('product_id'))
+        if pair is None:
+            return None
+
+        if message['type'] == 'snapshot':
+            self.levels[pair] = {'bids': dict([(float(price), [price, size]) for price, size in message['bids']]),
+                                 'asks': dict([(float(price), [price, size]) for price, size in message['asks']])}
+
+        elif message['type'] == 'l2update':
+            if pair not in self.levels:  # Updates received before the snapshot cannot be applied
+                return None
+            for side, price, size in message['changes']:
+                book = self.levels[pair]['bids' if side == 'buy' else 'asks']
+                if float(size) == 0:
+                    book.pop(float(price), None)
+                else:
+                    book[float(price)] = [price, size]
+
+        elif message['type'] == 'ticker':
+            if pair in self.levels:  # Level2 data is more detailed than the ticker
+                return None
+            return self._setTopOfBook(pair, [message['best_bid'], message.get('best_bid_size', '0')],
+                                      [message['best_ask'], message.get('best_ask_size', '0')])
+
+        else:
+            return None
+
+        levels = self.levels[pair]
+        if len(levels['bids']) == 0 or len(levels['asks']) == 0:
+            return None
+
+        return self._setTopOfBook(pair, levels['bids'][max(levels['bids'])], levels['asks'][min(levels['asks'])])
+
+    def _setTopOfBook(self, pair, bid, ask):
+        """
+        Stores the best bid and best ask of a pair and rewrites its edge weights if a price changed.
+
+        PARAMETERS
+        ----------
+        - pair (tuple): (BASE, QUOTE)
+        - bid (list): [price, size] of the best bid (str)
+        - ask (list): [price, size] of the best ask (str)
+
+        RETURN
+        ------
+        - pair (tuple/None): pair if the best bid or best ask price changed, else None
+        """
+        previous = self.orderBooks.get(pair)
+        self.orderBooks[pair] = {'bids': [[bid[0], bid[1], 1]], 'asks': [[ask[0], ask[1], 1]]}
+
+        if previous is not None and float(previous['bids'][0][0]) == float(bid[0]) and float(previous['asks'][0][0]) == float(ask[0]):
+            return None
+
+        baseNode = self.nodesKey[pair[0]]
+        quoteNode = self.nodesKey[pair[1]]
+        self.graph[baseNode, quoteNode] = -1 * np.log(float(bid[0]))
+        self.graph[quoteNode, baseNode] = -1 * np.log(1 / float(ask[0]))
+        self.weightUpdates += 2
+
+        return pair
+
+    async def run(self, url, onUpdate, channels=('level2_batch',), maxMessages=None):
+        """
+        Subscribes to the feed and applies every message. After each message that changes a price, onUpdate is called
+        and the time from receipt of the message to the end of the callback is recorded in latencies.
+
+        PARAMETERS
+        ----------
+        - url (str): WebSocket feed URL, e.g. wss://ws-feed.exchange.coinbase.com
+        - onUpdate (function): called as onUpdate(graph, orderBooks, pair) after a price change
+        - channels (tuple): feed channels to subscribe to
+        - maxMessages (int/None): stop after this number of messages, None to run until the connection closes
+        """
+        import aiohttp  # Only needed to connect to the feed
+
+        messages = 0
+        async with aiohttp.ClientSession() as session:
+            async with session.ws_connect(url) as websocket:
+
+                await websocket.send_str(json.dumps({'type': 'subscribe',
+                                                     'product_ids': list(self.products),
+                                                     'channels': list(channels)}))
+
+                async for frame in websocket:
+                    if frame.type != aiohttp.WSMsgType.TEXT:
+                        break
+
+                    receivedTime = time.perf_counter()
+                    pair = self.handleMessage(json.loads(frame.data))
+                    if pair is not None:
+                        onUpdate(self.graph, self.orderBooks, pair)
+                        self.latencies.append(time.perf_counter() - receivedTime)
+
+                    messages += 1
+                    if maxMessages is not None and messages >= maxMessages:
+                        break
@@ -0,0 +1,142 @@
+"""
+Brief: This script contains a detector that searches the strongly connected components of a graph in parallel processes.
+Description: The edge arrays of the graph (see SparseGraph) are copied into a shared memory block. Each worker process attaches
+             to the block and extracts the sub-graph of the component it is given, so only the vertex numbers of the components
+             are pickled.
+             Components are submitted largest first to balance the load, and the negative cycles are merged in the order of
+             the components, so the result is identical to that of the sequential search (see findNegativeCycles).
+             The process pool and the shared memory block are kept across scans; the block is only reallocated when the
+             number of currencies or of edges changes.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from sparse_graph import SparseGraph, asSparseGraph
+from strongly_connected_components import ConnectedComponents
+
+_attached = {}  # Shared memory block a worker process is attached to { 'name': str, 'block': SharedMemory }
+
+
+def _edgeArrays(buffer, edges):
+    """ RETURN: (np.array, np.array, np.array) the sources, targets and weights of the edges laid out one after the other """
+    return (np.ndarray(edges, dtype=np.int64, buffer=buffer), np.ndarray(edges, dtype=np.int64, buffer=buffer, offset=8 * edges),
+            np.ndarray(edges, dtype=np.float64, buffer=buffer, offset=16 * edges))
+
+
+def _attach(name, shape):
+    """ Attaches a worker process to a shared memory block, keeping the attachment for the following tasks. """
+    if _attached.get('name') != name:
+        if 'block' in _attached:
+            _attached['block'].close()
+        _attached['block'] = shared_memory.SharedMemory(name=name)
+        _attached['name'] = name
+    return SparseGraph(shape[0], *_edgeArrays(_attached['block'].buf, shape[1]))
+
+
+def _detectInComponent(name, shape, componentVertices, detectorClass):
+    """
+    Runs in a worker process: finds every distinct negative cycle in one strongly connected component.
+
+    PARAMETERS
+    ----------
+    - name (str): name of the shared memory block holding the edge arrays of the graph
+    - shape (tuple): (number of vertices, number of edges) of the graph
+    - componentVertices (list): vertices of the component in the graph
+    - detectorClass (class): negative cycle detector exposing getAllNegativeCycles() and negativeCycles
+
+    RETURN
+    ------
+    - (list): negative cycles with original vertex numbers
+    """
+    graph = _attach(name, shape)
+    subGraph = graph.subGraph(componentVertices)  # Copy of the component only
+
+    detectorObject = detectorClass(subGraph)
+    detectorObject.getAllNegativeCycles()
+
+    return [[componentVertices[v] for v in negativeCycle] for negativeCycle in detectorObject.negativeCycles]
+
+
+class ParallelDetector:
+    """ Searches the strongly connected components of a graph for negative cycles in a pool of processes. """
+
+    def __init__(self, maxWorkers=None):
+        """
+        PARAMETERS
+        ----------
+        - maxWorkers (int/None): number of worker processes, None for the number of processors
+        """
+        self.maxWorkers = maxWorkers
+        self._executor = ProcessPoolExecutor(max_workers=maxWorkers)
+        self._block = None  # Shared memory block holding the edge arrays of the graph
+        self._shape = None  # (number of vertices, number of edges)
+
+    def _share(self, graph):
+        """ Copies the edge arrays into the shared memory block, allocating the block if the shape has changed. """
+        shape = (graph.vertices, graph.edgeCount)
+        if self._shape != shape:
+            self._release()
+            self._block = shared_memory.SharedMemory(create=True, size=max(1, 24 * graph.edgeCount))
+            self._shape = shape
+        sources, targets, weights = _edgeArrays(self._block.buf, graph.edgeCount)
+        sources[:], targets[:], weights[:] = graph.sources, graph.targets, graph.weights
+
+    def findNegativeCycles(self, graph, detectorClass, connectedComponentsObject=None):
+        """
+        Finds every distinct negative cycle in the strongly connected components of the graph.
+
+        PARAMETERS
+        ----------
+        - graph (SparseGraph/np.array): graph, or matrix representing the graph
+        - detectorClass (class): negative cycle detector, one of the values of DETECTORS
+        - connectedComponentsObject (ConnectedComponents/None): components of a graph with the same edges, to be reused
+
+        RETURN
+        ------
+        - arbitrageCycles (list/None): negative cycles with original vertex numbers, None if there is no strongly connected
+          component with 3 or more vertices
+        """
+        graph = asSparseGraph(graph)
+        if connectedComponentsObject is None:
+            connectedComponentsObject = ConnectedComponents(graph)
+        if connectedComponentsObject.vertexInformation is None:
+            connectedComponentsObject.getConnectedComponents()
+
+        components = [component['componentVertices'] for component in connectedComponentsObject.vertexInformation['components']]
+        if len(components) == 0:
+            return None
+
+        self._share(graph)
+
+        # Largest components first, so that no worker is left with a large component at the end
+        futures = {}
+        for index in sorted(range(len(components)), key=lambda index: -len(components[index])):
+            futures[index] = self._executor.submit(_detectInComponent, self._block.name, self._shape, components[index], detectorClass)
+
+        # Merged in the order of the components, whatever order the workers finish in
+        arbitrageCycles = []
+        for index in range(len(components)):
+            arbitrageCycles.extend(futures[index].result())
+
+        return arbitrageCycles
+
+    def _release(self):
+        if self._block is not None:
+            self._block.close()
+            self._block.unlink()
+            self._block = None
+            self._shape = None
+
+    def close(self):
+        """ Shuts the worker processes down and frees the shared memory block. """
+        self._executor.shutdown()
+        self._release()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exception):
+        self.close()
@@ -0,0 +1,209 @@
+"""
+Brief: This script contains a class that finds every negative cycle of a few edges only in weighted digraphs, using min-plus matrix products.
+Description: Only cycles of 3 to maxHops edges (triangular and quadrilateral arbitrages by default) can be executed before prices
+             move, whereas the Bellman-Ford algorithm finds negative cycles of any length.
+             The min-plus product of two matrices is (A * B)[i, j] = min_k A[i, k] + B[k, j]. With W the matrix of edge
+             weights, the r-th min-plus power D_r[v, s] is the weight of the lightest walk of exactly r edges from v to s, and
+             its diagonal D_r[s, s] the weight of the lightest closed walk of r edges through s. The columns of the powers are
+             computed for a batch of vertices s at a time, by joining the edge arrays of the graph with the finite entries of
+             the previous power only: no dense matrix is ever built, and a sparse market costs little more than its edges.
+             Every negative cycle of 3 to maxHops edges goes through a vertex s with a negative D_r[s, s], r <= maxHops. Paths
+             are then extended from every such s, one edge at a time and all at once with vectorized NumPy operations, keeping
+             a path of weight c ending at v only if c + D_r[v, s] < 0 for a number of remaining edges r: it can still be closed
+             into a negative cycle. A cycle is only found from its smallest vertex, so every cycle is found once.
+             Cycles are ranked by log-return, i.e. by increasing weight, as the weight of an edge is minus the log of its rate.
+             The graph is a SparseGraph, or a dense matrix in which a weight of 0 signals that there is no edge. It need not be
+             strongly connected.
+"""
+
+import numpy as np
+
+from bellman_ford_algorithm import BellmanFordAlgorithm
+from sparse_graph import asSparseGraph
+
+BATCH_SIZE = 2 ** 20  # Bound on both the edges and the vertices of the graph times the vertices of a batch, i.e. on the walks held at once
+
+
+class ShortCycleAlgorithm:
+    """ Finds every negative cycle of 3 to maxHops edges in a weighted digraph, most profitable first. """
+
+    def __init__(self, graph, maxHops=4):
+        """
+        PARAMETERS
+        ----------
+        - graph (SparseGraph/np.array): graph, or matrix representing the graph
+        - maxHops (int): maximum number of edges of a cycle, at least 3
+        """
+        if maxHops < 3:
+            raise ValueError('A cycle has at least 3 edges, maxHops is {}.'.format(maxHops))
+
+        self.graph = asSparseGraph(graph)  # Graph (SparseGraph)
+        self.vertices = self.graph.vertices  # Number of vertices in the graph (int)
+        self.maxHops = maxHops  # Maximum number of edges of a cycle (int)
+        self.minHops = 3  # Minimum number of edges of a cycle (int)
+        self.negativeCycle = []  # Default empty list for containment of the most profitable negative cycle if exists
+        self.negativeCycles = []  # Default empty list for containment of all distinct negative cycles if exist
+        self.cycleWeights = []  # Sum of the edge weights of each negative cycle, i.e. minus its log-return (float)
+
+        self._inEdges = np.argsort(self.graph.targets, kind='stable')  # Edges sorted by target vertex
+        self._inIndptr = np.searchsorted(self.graph.targets[self._inEdges], np.arange(self.vertices + 1))  # Incoming edges of v
+
+    def _minPlusProduct(self, walkWeights, batch):
+        """
+        Computes the min-plus product W * M, where W is the matrix of edge weights of the graph and M a (vertices, batch)
+        matrix: the entry [v, b] of the product is the minimum over the edges v --> u of the edge weight plus M[u, b]. Only the
+        finite entries of M are joined with the edges, so the cost follows the number of walks rather than vertices * batch.
+
+        PARAMETERS
+        ----------
+        - walkWeights (np.array): M flattened, entry [v, b] at v * batch + b; infinity where there is no walk
+        - batch (int): number of columns of M
+
+        RETURN
+        ------
+        - (np.array): the product flattened in the same way
+        """
+        keys = np.flatnonzero(walkWeights < np.inf)
+        rows, columns = keys // batch, keys % batch
+
+        # Join every entry [u, b] with every edge v --> u
+        counts = self._inIndptr[rows + 1] - self._inIndptr[rows]
+        entries = np.repeat(np.arange(len(keys)), counts)
+        edges = self._inEdges[self._inIndptr[rows][entries] + np.arange(len(entries)) - np.repeat(np.cumsum(counts) - counts, counts)]
+
+        # Keep the lightest walk of each entry
+        product = np.full(self.vertices * batch, np.inf)
+        np.minimum.at(product, self.graph.sources[edges] * batch + columns[entries], walkWeights[keys][entries] + self.graph.weights[edges])
+        return product
+
+    def _getWalkWeights(self, sources):
+        """
+        Computes the columns of the min-plus powers of the weight matrix for a batch of vertices.
+
+        PARAMETERS
+        ----------
+        - sources (np.array): vertices s of the batch
+
+        RETURN
+        ------
+        - (list): element r holds the weights of the lightest walks of r edges from every vertex to every vertex of the batch,
+          for r = 0, 1, ..., maxHops - 1, as a flattened (vertices, batch) matrix (see _minPlusProduct)
+        """
+        batch = len(sources)
+        walkWeights = [np.full(self.vertices * batch, np.inf)]
+        walkWeights[0][sources * batch + np.arange(batch)] = 0
+        for _ in range(self.maxHops - 1):
+            walkWeights.append(self._minPlusProduct(walkWeights[-1], batch))
+        return walkWeights
+
+    def _getClosedWalkWeights(self, sources, walkWeights):
+        """
+        Computes the diagonal of the next min-plus power only, from the outgoing edges of the vertices of the batch.
+
+        PARAMETERS
+        ----------
+        - sources (np.array): vertices s of the batch
+        - walkWeights (np.array): weights of the lightest walks of r edges to the vertices of the batch (see _getWalkWeights)
+
+        RETURN
+        ------
+        - (np.array): weight of the lightest closed walk of r + 1 edges through each vertex of the batch
+        """
+        counts = self.graph.indptr[sources + 1] - self.graph.indptr[sources]
+        columns = np.repeat(np.arange(len(sources)), counts)
+        edges = self.graph.indptr[sources][columns] + np.arange(len(columns)) - np.repeat(np.cumsum(counts) - counts, counts)
+
+        closedWalks = np.full(len(sources), np.inf)
+        np.minimum.at(closedWalks, columns, self.graph.weights[edges] + walkWeights[self.graph.targets[edges] * len(sources) + columns])
+        return closedWalks
+
+    def _searchBatch(self, sources):
+        """
+        Finds every negative cycle of 3 to maxHops edges whose smallest vertex is in the batch.
+
+        PARAMETERS
+        ----------
+        - sources (np.array): vertices of the batch
+
+        RETURN
+        ------
+        - cycles (list): arrays of vertices of the cycles in order, starting at their smallest vertex
+        - weights (list): weight of each cycle
+        """
+        batch = len(sources)
+        walkWeights = self._getWalkWeights(sources)
+
+        # Only vertices on a negative closed walk of 3 to maxHops edges can be on a negative cycle of as many edges
+        closedWalks = np.min([self._getClosedWalkWeights(sources, walkWeights[hops - 1])
+                              for hops in range(self.minHops, self.maxHops + 1)], axis=0)
+        batchIndex = np.flatnonzero(closedWalks < 0)
+
+        paths = sources[batchIndex][:, None]  # One path per row, from the smallest vertex of the cycle
+        pathWeights = np.zeros(len(batchIndex))
+        cycles, weights = [], []
+
+        for hops in range(1, self.maxHops):
+            # Extend every path by every outgoing edge of its last vertex
+            lastVertices = paths[:, -1]
+            counts = self.graph.indptr[lastVertices + 1] - self.graph.indptr[lastVertices]
+            rows = np.repeat(np.arange(len(paths)), counts)
+            edges = self.graph.indptr[lastVertices][rows] + np.arange(len(rows)) - np.repeat(np.cumsum(counts) - counts, counts)
+
+            nextVertices = self.graph.targets[edges]
+            keep = (nextVertices > paths[rows, 0]) & ~(paths[rows] == nextVertices[:, None]).any(axis=1)  # Simple, smallest first
+            rows, edges, nextVertices = rows[keep], edges[keep], nextVertices[keep]
+
+            paths = np.hstack([paths[rows], nextVertices[:, None]])
+            pathWeights = pathWeights[rows] + self.graph.weights[edges]
+            batchIndex = batchIndex[rows]
+            entries = nextVertices * batch + batchIndex  # Entries [v, b] of the walk weights from the last vertex to the first
+
+            # Close the paths of 2 edges or more with the edge back to the first vertex
+            if hops + 1 >= self.minHops:
+                cycleWeights = pathWeights + walkWeights[1][entries]
+                negative = cycleWeights < 0
+                cycles.extend(paths[negative])
+                weights.extend(cycleWeights[negative])
+
+            # Keep the paths that can still be closed into a negative cycle of at most maxHops edges with 2 edges or more
+            remaining = range(max(2, self.minHops - hops), self.maxHops - hops + 1)
+            if len(remaining) == 0:
+                break
+            bound = np.min([walkWeights[r][entries] for r in remaining], axis=0)
+            promising = pathWeights + bound < 0
+            paths, pathWeights, batchIndex = paths[promising], pathWeights[promising], batchIndex[promising]
+
+        return cycles, weights
+
+    def getAllNegativeCycles(self):
+        """
+        Finds all distinct negative cycles of 3 to maxHops edges in graph, stored from the most to the least profitable.
+        Cycles are canonicalised by rotation (see BellmanFordAlgorithm.canonicaliseCycle).
+        """
+
+        batchSize = max(1, BATCH_SIZE // max(1, self.graph.edgeCount, self.vertices))
+        found = []
+        for start in range(0, self.vertices, batchSize):
+            cycles, weights = self._searchBatch(np.arange(start, min(start + batchSize, self.vertices)))
+            found.extend(zip(weights, [BellmanFordAlgorithm.canonicaliseCycle(cycle.tolist()) for cycle in cycles]))
+
+        found.sort()  # By increasing weight, i.e. decreasing log-return, then by vertices
+        self.negativeCycles = [list(cycle) for weight, cycle in found]
+        self.cycleWeights = [float(weight) for weight, cycle in found]
+
+    def getANegativeCycle(self):
+        """
+        Finds the most profitable negative cycle of 3 to maxHops edges in graph if exists.
+        """
+
+        self.getAllNegativeCycles()
+        if len(self.negativeCycles) > 0:
+            self.negativeCycle = self.negativeCycles[0]
+
+    def getLogReturns(self):
+        """
+        RETURN
+        ------
+        - (list): log-return of each negative cycle, i.e. minus the sum of its edge weights, in the order of negativeCycles
+        """
+        return [-weight for weight in self.cycleWeights]
@@ -0,0 +1,154 @@
+"""
+Brief: This script contains a sparse representation of a weighted digraph.
+Description: The graph is stored as an edge list sorted by source then target vertex, with a row pointer giving the outgoing
+             edges of every vertex (compressed sparse row layout). Memory scales with the number of edges, i.e. the number of
+             currency pairs, rather than with the square of the number of currencies.
+             Edges exist explicitly, so an edge of weight 0 (an exchange rate of exactly 1) is a valid edge. Dense matrices are
+             still accepted by the classes of the program; there a weight of 0 signals that there is no edge.
+"""
+
+import numpy as np
+
+
+class SparseGraph:
+    """ Weighted digraph stored as a sorted edge list with a row pointer. """
+
+    def __init__(self, vertices, sources, targets, weights):
+        """
+        PARAMETERS
+        ----------
+        - vertices (int): number of vertices
+        - sources (list/np.array): source vertex of each edge
+        - targets (list/np.array): target vertex of each edge
+        - weights (list/np.array): weight of each edge; if an edge is given twice, the last weight is kept
+        """
+        sources = np.asarray(sources, dtype=np.intp).ravel()
+        targets = np.asarray(targets, dtype=np.intp).ravel()
+        weights = np.asarray(weights, dtype=float).ravel()
+
+        order = np.lexsort((targets, sources))  # Stable, so duplicate edges stay in the order given
+        sources, targets, weights = sources[order], targets[order], weights[order]
+        last = np.ones(len(sources), dtype=bool)
+        last[:-1] = (sources[1:] != sources[:-1]) | (targets[1:] != targets[:-1])
+
+        self.vertices = int(vertices)  # Number of vertices (int)
+        self.sources = sources[last]  # Source vertex of each edge (np.array)
+        self.targets = targets[last]  # Target vertex of each edge (np.array)
+        self.weights = weights[last]  # Weight of each edge (np.array)
+        self.indptr = np.searchsorted(self.sources, np.arange(self.vertices + 1))  # Edges of vertex v: indptr[v]:indptr[v + 1]
+
+    @classmethod
+    def fromMatrix(cls, matrix, mask=None):
+        """
+        Converts a dense matrix.
+
+        PARAMETERS
+        ----------
+        - matrix (np.array/list): a (N, N) matrix of weights
+        - mask (np.array/None): boolean (N, N) matrix of the edges; by default every non-zero weight is an edge
+
+        RETURN
+        ------
+        - (SparseGraph)
+        """
+        matrix = np.asarray(matrix, dtype=float)
+
+        if matrix.ndim != 2:  # Degenerate input, i.e. a graph without any edges
+            return cls(matrix.shape[0] if matrix.ndim else 0, [], [], [])
+
+        sources, targets = np.nonzero(matrix if mask is None else np.asarray(mask, dtype=bool))
+        return cls(matrix.shape[0], sources, targets, matrix[sources, targets])
+
+    @property
+    def shape(self):
+        return self.vertices, self.vertices
+
+    @property
+    def edgeCount(self):
+        return len(self.sources)
+
+    @property
+    def nbytes(self):
+        """ Memory used by the arrays of the graph, in bytes. """
+        return self.sources.nbytes + self.targets.nbytes + self.weights.nbytes + self.indptr.nbytes
+
+    def _edgeIndex(self, source, target):
+        """ RETURN: (int/None) position of the edge source --> target in the edge arrays, None if there is no such edge """
+        start, end = self.indptr[source], self.indptr[source + 1]
+        index = start + int(np.searchsorted(self.targets[start:end], target))
+        if index < end and self.targets[index] == target:
+            return index
+        return None
+
+    def hasEdge(self, source, target):
+        return self._edgeIndex(source, target) is not None
+
+    def __getitem__(self, edge):
+        """ RETURN: (float) weight of the edge graph[source, target]; raises KeyError if there is no such edge """
+        index = self._edgeIndex(*edge)
+        if index is None:
+            raise KeyError(edge)
+        return self.weights[index]
+
+    def __setitem__(self, edge, weight):
+        """ Sets the weight of the existing edge graph[source, target]; raises KeyError if there is no such edge. """
+        index = self._edgeIndex(*edge)
+        if index is None:
+            raise KeyError(edge)
+        self.weights[index] = weight
+
+    def copy(self):
+        return SparseGraph(self.vertices, self.sources.copy(), self.targets.copy(), self.weights.copy())
+
+    def withWeights(self, weights):
+        """
+        RETURN
+        ------
+        - (SparseGraph): graph with the same edges and the given weights, in the order of the edge arrays
+        """
+        graph = SparseGraph.__new__(SparseGraph)
+        graph.vertices, graph.sources, graph.targets, graph.indptr = self.vertices, self.sources, self.targets, self.indptr
+        graph.weights = np.asarray(weights, dtype=float)
+        return graph
+
+    def subGraph(self, vertices):
+        """
+        Extracts the graph induced by some vertices, renumbered 0, 1, ..., in the order given.
+
+        PARAMETERS
+        ----------
+        - vertices (list): vertices of the sub-graph, in increasing order
+
+        RETURN
+        ------
+        - (SparseGraph)
+        """
+        newVertex = np.full(self.vertices, -1, dtype=np.intp)
+        newVertex[np.asarray(vertices, dtype=np.intp)] = np.arange(len(vertices))
+
+        keep = (newVertex[self.sources] != -1) & (newVertex[self.targets] != -1)
+        return SparseGraph(len(vertices), newVertex[self.sources[keep]], newVertex[self.targets[keep]], self.weights[keep])
+
+    def toDense(self, missing=0.0):
+        """
+        PARAMETERS
+        ----------
+        - missing (float): value of the cells without an edge
+
+        RETURN
+        ------
+        - matrix (np.array): a (N, N) matrix of weights, for small graphs only
+        - mask (np.array): boolean (N, N) matrix of the edges
+        """
+        matrix = np.full(self.shape, missing, dtype=float)
+        mask = np.zeros(self.shape, dtype=bool)
+        matrix[self.sources, self.targets] = self.weights
+        mask[self.sources, self.targets] = True
+        return matrix, mask
+
+
+def asSparseGraph(graph):
+    """ Returns the graph itself if it is a SparseGraph, else converts a dense matrix (see SparseGraph.fromMatrix). """
+    if isinstance(graph, SparseGraph):
+        return graph
+    return SparseGraph.fromMatrix(graph)
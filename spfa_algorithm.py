@@ -0,0 +1,219 @@
+"""
+Brief: This script contains a class that detects negative cycles in weighted digraphs using a queue-based Bellman-Ford algorithm (SPFA).
+Description: Instead of relaxing every edge on each of |vertices|-1 passes, only the outgoing edges of vertices whose distance has
+             just improved are relaxed. Vertices waiting to be processed are kept in a first-in first-out queue, so the algorithm
+             terminates as soon as the queue is empty, i.e. as soon as no further relaxation is possible.
+             Negative cycles are detected with subtree disassembly (Tarjan): the shortest path tree is maintained explicitly and
+             when the distance of a vertex improves its whole subtree is removed from the tree. If the vertex that caused the
+             improvement is found in that subtree, a negative cycle has just been formed and is reported immediately.
+             Distinct negative cycles can be enumerated: the edges of a found cycle are removed and the queue is processed
+             again from the current distances. A negative cycle that shares an edge with a cycle found before it is therefore
+             skipped.
+             We ASSUME that the digraph is a strongly connected component.
+             The graph is a SparseGraph, or a dense matrix in which a weight of 0 signals that there is no edge.
+"""
+
+from collections import deque
+
+import numpy as np
+
+from bellman_ford_algorithm import BellmanFordAlgorithm
+from sparse_graph import asSparseGraph
+
+
+class SPFAAlgorithm:
+    """ Utilises the SPFA with subtree disassembly to detect existence of a negative cycle in a strongly connected weighted digraph. """
+
+    def __init__(self, graph):
+        self.graph = asSparseGraph(graph)  # Graph (SparseGraph)
+        self.vertices = self.graph.vertices  # Number of vertices in the graph (int)
+        self.distances = np.full(self.vertices, np.inf)  # Initialize distance to all vertices from source vertex to infinity (np.array)
+        self.predecessors = np.full(self.vertices, -1)  # Initialize predecessor vertices store (np.array)
+        self.negativeCycle = []  # Default empty list for containment of negative cycle if exists
+        self.negativeCycles = []  # Default empty list for containment of distinct negative cycles if exist (see getAllNegativeCycles)
+        self.adjacency = self._getAdjacency()  # Outgoing edges of each vertex [[(target, weight), ...], ..., [(target, weight), ...]]
+        self.relaxations = 0  # Number of successful edge relaxations performed (int)
+
+    def _getAdjacency(self):
+        """
+        Extracts the outgoing edges of every vertex from the rows of the graph.
+
+        RETURN
+        ------
+        - adjacency (list): [[(target, weight), ...], ..., [(target, weight), ...]]
+        """
+        edges = list(zip(self.graph.targets.tolist(), self.graph.weights.tolist()))
+        indptr = self.graph.indptr.tolist()
+
+        return [edges[indptr[vertex]:indptr[vertex + 1]] for vertex in range(self.vertices)]
+
+    def initializeSourceVertex(self):
+        """
+        Picks the source vertex. As graph is strongly connected, any vertex can be a source vertex. We pick the source vertex to be vertex 0.
+        """
+
+        # Distance from source vertex to itself is zero
+        self.distances[0] = 0
+
+    def getANegativeCycle(self):
+        """
+        Finds negative cycle in graph if exists. The queue is processed until it is empty (no negative cycle) or until a relaxation
+        closes a cycle in the shortest path tree (negative cycle).
+        """
+
+        self.initializeSourceVertex()
+
+        distances = self.distances.tolist()  # Python lists are faster than np.array for scalar access
+        predecessors = self.predecessors.tolist()
+
+        cycle = self._processQueue(self.adjacency, distances, predecessors, [0])
+        if cycle is not None:
+            self.negativeCycle = cycle
+
+        self.distances = np.array(distances)
+        self.predecessors = np.array(predecessors)
+
+    def getAllNegativeCycles(self):
+        """
+        Finds distinct negative cycles in graph. Each time a negative cycle is found its edges are removed, the shortest path
+        tree is discarded and every vertex with a finite distance is queued again, keeping the current distances. A negative
+        cycle that shares an edge with a cycle found before it is therefore never reported.
+        Cycles are canonicalised by rotation (see BellmanFordAlgorithm.canonicaliseCycle) and stored in order of detection.
+        """
+
+        self.initializeSourceVertex()
+
+        distances = self.distances.tolist()
+        predecessors = self.predecessors.tolist()
+        adjacency = [list(edges) for edges in self.adjacency]  # Copy, as edges of found cycles are removed
+
+        queue = [0]
+        while True:
+
+            cycle = self._processQueue(adjacency, distances, predecessors, queue)
+            if cycle is None:
+                break
+
+            self.negativeCycles.append(list(BellmanFordAlgorithm.canonicaliseCycle(cycle)))
+
+            # Remove the edges of the cycle
+            for index, source in enumerate(cycle):
+                target = cycle[(index + 1) % len(cycle)]
+                adjacency[source] = [edge for edge in adjacency[source] if edge[0] != target]
+
+            predecessors = [-1] * self.vertices
+            queue = [vertex for vertex in range(self.vertices) if distances[vertex] < np.inf]
+
+        self.distances = np.array(distances)
+        self.predecessors = np.array(predecessors)
+
+    def _processQueue(self, adjacency, distances, predecessors, queue):
+        """
+        Relaxes the outgoing edges of queued vertices until the queue is empty or a negative cycle is formed.
+        The predecessor vertices must describe a forest, and distances and predecessors are updated in place.
+
+        PARAMETERS
+        ----------
+        - adjacency (list): outgoing edges of each vertex [[(target, weight), ...], ..., [(target, weight), ...]]
+        - distances (list): current distance of each vertex
+        - predecessors (list): predecessor vertex of each vertex in the shortest path tree
+        - queue (list): vertices to be processed first
+
+        RETURN
+        ------
+        - cycle (list/None): vertices in the negative cycle in order if one has been formed, else None
+        """
+
+        children = [set() for _ in range(self.vertices)]  # Children of each vertex in the shortest path tree
+        for vertex, predecessor in enumerate(predecessors):
+            if predecessor != -1:
+                children[predecessor].add(vertex)
+
+        inQueue = [False] * self.vertices
+        for vertex in queue:
+            inQueue[vertex] = True
+        queue = deque(queue)
+
+        while queue:
+
+            vertex = queue.popleft()
+            if not inQueue[vertex]:  # Vertex has been removed from the tree since it was queued
+                continue
+            inQueue[vertex] = False
+
+            for target, weight in adjacency[vertex]:
+
+                if distances[vertex] + weight < distances[target]:
+
+                    cycle = self._disassembleSubtree(target, vertex, predecessors, children, inQueue)
+                    if cycle is not None:
+                        return cycle
+
+                    # Attach target to the shortest path tree below vertex
+                    if predecessors[target] != -1:
+                        children[predecessors[target]].discard(target)
+                    predecessors[target] = vertex
+                    children[vertex].add(target)
+
+                    distances[target] = distances[vertex] + weight
+                    self.relaxations += 1
+
+                    if not inQueue[target]:
+                        inQueue[target] = True
+                        queue.append(target)
+
+        return None
+
+    def _disassembleSubtree(self, root, vertex, predecessors, children, inQueue):
+        """
+        Removes all descendants of root from the shortest path tree, as their distances are no longer the shortest known.
+        If vertex is one of the descendants, the edge vertex --> root closes a negative cycle and nothing is removed.
+
+        PARAMETERS
+        ----------
+        - root (int): vertex for which a shorter path has been found
+        - vertex (int): vertex through which the shorter path has been found
+        - predecessors (list): predecessor vertex of each vertex in the shortest path tree
+        - children (list): children of each vertex in the shortest path tree
+        - inQueue (list): flags of vertices waiting in the queue
+
+        RETURN
+        ------
+        - cycle (list/None): vertices in the negative cycle in order if one has been formed, else None
+        """
+
+        descendants = []
+        stack = list(children[root])
+
+        while stack:
+            descendant = stack.pop()
+            if descendant == vertex:
+                return self._traceCycle(root, vertex, predecessors)
+            descendants.append(descendant)
+            stack.extend(children[descendant])
+
+        if root == vertex:  # Negative self-loop
+            return [root]
+
+        for descendant in descendants:
+            children[descendant].clear()
+            predecessors[descendant] = -1
+            inQueue[descendant] = False  # Descendant will be queued again once its distance improves
+        children[root].clear()
+
+        return None
+
+    @staticmethod
+    def _traceCycle(root, vertex, predecessors):
+        """
+        Follows the shortest path tree from vertex back to root.
+
+        RETURN
+        ------
+        - cycle (list): [root, ..., vertex], where the edge vertex --> root closes the cycle
+        """
+        cycle = [vertex]
+        while cycle[-1] != root:
+            cycle.append(predecessors[cycle[-1]])
+        cycle.reverse()
+        return cycle
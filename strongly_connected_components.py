@@ -3,33 +3,126 @@ Brief: This script contains a class that finds and analyses strongly connected c
 Description: A graph is said to be strongly connected if every vertex is reachable from every other vertex.
              Strongly connected components partition a graph into sub-graphs that themselves are strongly connected.
              A cycle can only exist in a strongly connected component.
+             The graph is a SparseGraph, or a dense matrix in which a weight of 0 signals that there is no edge. Sub-graphs of the
+             components are SparseGraphs too, so that no dense matrix is ever built.
+             The components are found by an iterative version of Tarjan's algorithm, with the memory savings of Pearce:
+             http://homepages.ecs.vuw.ac.nz/~djp/files/P05.pdf
+             It visits the vertices and numbers the components in the same order as scipy.sparse.csgraph.connected_components,
+             so the labels are identical, without the cost of importing scipy.
 """
 
-from scipy.sparse import csr_matrix
-from scipy.sparse.csgraph import connected_components
+import numpy as np
+
+from sparse_graph import asSparseGraph
+
+VOID = -1
+END = -2
+
+
+def findStronglyConnectedComponents(vertices, targets, indptr):
+    """
+    Labels the strongly connected components of a digraph in compressed sparse row layout, in O(V + E).
+
+    PARAMETERS
+    ----------
+    - vertices (int): number of vertices
+    - targets (list/np.array): target vertex of each edge, edges sorted by source vertex
+    - indptr (list/np.array): edges of vertex v are targets[indptr[v]:indptr[v + 1]]
+
+    RETURN
+    ------
+    - numberOfComponents (int): number of strongly connected components
+    - labels (np.array): component of each vertex, numbered in the order the components are completed
+    """
+    targets = np.asarray(targets).tolist()  # Lists are indexed much faster than arrays element by element
+    indptr = np.asarray(indptr).tolist()
+
+    # Lowlinks of the vertices not yet assigned to a component; labels, counted down from vertices - 1 so that they are never
+    # lower than a lowlink, once assigned
+    lowlinks = [VOID] * vertices
+    backtracked = [VOID] * vertices  # Stack of the backtracked vertices of the current component, as next pointers
+    stackForward = [VOID] * vertices  # Depth-first stack as a doubly linked list, so that a vertex can be moved to the top
+    stackBackward = [VOID] * vertices
+    backtrackedHead = END
+    index = 0
+    label = vertices - 1
+
+    for start in range(vertices):
+        if lowlinks[start] != VOID:
+            continue
+
+        stackHead = start
+        stackForward[start] = stackBackward[start] = END
+        while stackHead != END:
+            v = stackHead
+            if lowlinks[v] == VOID:
+                lowlinks[v] = index
+                index += 1
+
+                # Push the unvisited successors, moving those already on the stack to the top
+                for w in targets[indptr[v]:indptr[v + 1]]:
+                    if lowlinks[w] == VOID:
+                        if stackForward[w] != VOID:
+                            forward, backward = stackForward[w], stackBackward[w]
+                            if backward != END:
+                                stackForward[backward] = forward
+                            if forward != END:
+                                stackBackward[forward] = backward
+                        stackForward[w] = stackHead
+                        stackBackward[w] = END
+                        stackBackward[stackHead] = w
+                        stackHead = w
+            else:
+                # Pop the vertex, all of its successors having been visited
+                stackHead = stackForward[v]
+                if stackHead >= 0:
+                    stackBackward[stackHead] = END
+                stackForward[v] = stackBackward[v] = VOID
+
+                root = True
+                lowV = lowlinks[v]
+                for w in targets[indptr[v]:indptr[v + 1]]:
+                    if lowlinks[w] < lowV:
+                        lowV = lowlinks[w]
+                        root = False
+                lowlinks[v] = lowV
+
+                if root:  # v is the first vertex visited of its component: the component is complete
+                    index -= 1
+                    while backtrackedHead != END and lowV <= lowlinks[backtrackedHead]:
+                        w = backtrackedHead
+                        backtrackedHead = backtracked[w]
+                        backtracked[w] = VOID
+                        lowlinks[w] = label
+                        index -= 1
+                    lowlinks[v] = label
+                    label -= 1
+                else:
+                    backtracked[v] = backtrackedHead
+                    backtrackedHead = v
+
+    labels = (vertices - 1) - np.array(lowlinks, dtype=np.intp)  # Counted up from 0
+    return (vertices - 1) - label, labels
 
 
 class ConnectedComponents:
     """ Finds strongly connected components in a weighted digraph. """
 
-    def __init__(self, matrix):
-        self.matrix = csr_matrix(matrix)  # Sparse matrix
+    def __init__(self, graph):
+        self.graph = asSparseGraph(graph)  # Graph (SparseGraph)
         self.numberOfComponents, self.componentLabels = self._getDetails()
+        self.vertexInformation = None  # Result of getConnectedComponents, kept to be reused for graphs with the same edges
 
     def _getDetails(self):
         """
-        Finds all strongly connected components using scipy.sparse.csgraph library in the graph.
+        Finds all strongly connected components in the graph.
 
         RETURN
         ------
-        - n_components (int): number of strongly connected components
-        - labels (list): indicates which vertices belong to the same component
+        - numberOfComponents (int): number of strongly connected components
+        - labels (np.array): indicates which vertices belong to the same component
         """
-        n_components, labels = connected_components(csgraph=self.matrix,
-                                                    directed=True,
-                                                    connection='strong',
-                                                    return_labels=True)
-        return n_components, list(labels)
+        return findStronglyConnectedComponents(self.graph.vertices, self.graph.targets, self.graph.indptr)
 
     def getConnectedComponents(self):
         """
@@ -40,32 +133,53 @@ class ConnectedComponents:
         - vertexInformation (dict):
             - 'isolatedVertices' (str | key) --> all vertices from connected components with 1 or 2 vertices (list | value)
             - 'components' (str | key) --> information about connected components with 3 or more vertices (list of dictionaries | value)
-                - 'subGraph' (str | key) --> sub-matrix of original matrix containing the connected component only (np.array | value)
+                - 'subGraph' (str | key) --> sub-graph of the original graph containing the connected component only (SparseGraph | value)
                 - 'componentVertices' (str | key) --> vertices in connected component (list | value)
                 - 'componentVerticesMap' (str | key) --> list of tuples mapping new sub-graph vertex to original digraph vertex (list | value)
         """
         vertexInformation = {'components': [], 'isolatedVertices': []}  # Initialize data store
 
-        # Iterate through all of the connected components
-        for component in range(self.numberOfComponents):
+        # Group the vertices by component in one pass: sorted by label, vertices of a component stay in increasing order
+        order = np.argsort(self.componentLabels, kind='stable')
+        boundaries = np.cumsum(np.bincount(self.componentLabels, minlength=self.numberOfComponents))
 
-            verticesInComponent = self.componentLabels.count(component)  # Get number of vertices in connected component
+        # Iterate through all of the connected components
+        for componentVertices in np.split(order, boundaries[:-1]):
+            componentVertices = componentVertices.tolist()
 
-            if verticesInComponent <= 2:  # Discard any connected components with 1 or 2 vertices
-                for index, vertex in enumerate(self.componentLabels):
-                    if vertex == component:
-                        vertexInformation['isolatedVertices'].append(index)
+            if len(componentVertices) <= 2:  # Discard any connected components with 1 or 2 vertices
+                vertexInformation['isolatedVertices'].extend(componentVertices)
             else:
                 # TODO - ensure all vertices have more than 2 degrees in the connected component (not essential though)
-                componentVertices = []
-                for index, vertex in enumerate(self.componentLabels):
-                    if vertex == component:
-                        componentVertices.append(index)  # Keep track of vertices in connected component
-
                 vertexInformation['components'].append({
-                                                        'subGraph': self.matrix[componentVertices, :][:, componentVertices].toarray(),
+                                                        'subGraph': self.graph.subGraph(componentVertices),
                                                         'componentVertices': componentVertices,
                                                         'componentVerticesMap': [(i, v) for i, v in enumerate(componentVertices)]
                                                         })
 
+        self.vertexInformation = vertexInformation
         return vertexInformation
+
+    def getConnectedComponentsOf(self, graph):
+        """
+        Collates the same information for a graph with the same edges but different weights, e.g. a later snapshot of the same
+        currency pairs, reusing the strongly connected components that have already been found.
+
+        PARAMETERS
+        ----------
+        - graph (SparseGraph/np.array): graph with the same edges as the graph used to find the components
+
+        RETURN
+        ------
+        - vertexInformation (dict): see getConnectedComponents
+        """
+        if self.vertexInformation is None:
+            self.getConnectedComponents()
+
+        graph = asSparseGraph(graph)
+
+        return {'isolatedVertices': self.vertexInformation['isolatedVertices'],
+                'components': [{'subGraph': graph.subGraph(component['componentVertices']),
+                                'componentVertices': component['componentVertices'],
+                                'componentVerticesMap': component['componentVerticesMap']}
+                               for component in self.vertexInformation['components']]}
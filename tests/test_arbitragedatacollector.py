@@ -34,33 +34,33 @@ class TestArbitrageDataCollector(TestCase):
         secondPair = arbitrageData[1]
         thirdPair = arbitrageData[2]
 
-        self.assertTupleEqual(firstPair['pair'], ('BTC', 'USD'))
-        self.assertTupleEqual(secondPair['pair'], ('ETH', 'USD'))
-        self.assertTupleEqual(thirdPair['pair'], ('ETH', 'BTC'))
+        self.assertTupleEqual(firstPair.pair, ('BTC', 'USD'))
+        self.assertTupleEqual(secondPair.pair, ('ETH', 'USD'))
+        self.assertTupleEqual(thirdPair.pair, ('ETH', 'BTC'))
 
-        self.assertEqual(firstPair['position'], 'short')
-        self.assertEqual(secondPair['position'], 'long')
-        self.assertEqual(thirdPair['position'], 'short')
+        self.assertEqual(firstPair.position, 'short')
+        self.assertEqual(secondPair.position, 'long')
+        self.assertEqual(thirdPair.position, 'short')
 
-        self.assertEqual(firstPair['availableQuantity'], '0.00163887')
-        self.assertEqual(secondPair['availableQuantity'], '0.35199679')
-        self.assertEqual(thirdPair['availableQuantity'], '1.1')
+        self.assertEqual(firstPair.availableQuantity, 0.00163887)
+        self.assertEqual(secondPair.availableQuantity, 0.35199679)
+        self.assertEqual(thirdPair.availableQuantity, 1.1)
 
-        self.assertEqual(firstPair['price'], '21652.44')
-        self.assertEqual(secondPair['price'], '1751.54')
-        self.assertEqual(thirdPair['price'], '0.08084')
+        self.assertEqual(firstPair.price, 21652.44)
+        self.assertEqual(secondPair.price, 1751.54)
+        self.assertEqual(thirdPair.price, 0.08084)
 
-        self.assertEqual(firstPair['fee'], '0.0015')
-        self.assertEqual(secondPair['fee'], '0.0015')
-        self.assertEqual(thirdPair['fee'], '0.0015')
+        self.assertEqual(firstPair.fee, 0.0015)
+        self.assertEqual(secondPair.fee, 0.0015)
+        self.assertEqual(thirdPair.fee, 0.0015)
 
-        self.assertEqual(firstPair['basePrecision'], -8)
-        self.assertEqual(secondPair['basePrecision'], -8)
-        self.assertEqual(thirdPair['basePrecision'], -8)
+        self.assertEqual(firstPair.basePrecision, -8)
+        self.assertEqual(secondPair.basePrecision, -8)
+        self.assertEqual(thirdPair.basePrecision, -8)
 
-        self.assertEqual(firstPair['notionalMinimumLimit'], '1')
-        self.assertEqual(secondPair['notionalMinimumLimit'], '1')
-        self.assertEqual(thirdPair['notionalMinimumLimit'], '0.00001')
+        self.assertEqual(firstPair.notionalMinimumLimit, 1)
+        self.assertEqual(secondPair.notionalMinimumLimit, 1)
+        self.assertEqual(thirdPair.notionalMinimumLimit, 0.00001)
 
     def tearDown(self):
         self.testData.client.closeSession()
@@ -0,0 +1,102 @@
+"""
+Brief: Unit tests for async_coinbase_client.py and GraphConstructor.buildGraphAsync
+"""
+
+from unittest import IsolatedAsyncioTestCase
+import asyncio
+import time
+
+from aiohttp import web
+
+from clients.coinbase.async_coinbase_client import AsyncCoinbaseClient
+from graph_constructor import GraphConstructor
+from main_implementation import mainAsync
+
+import numpy as np
+
+LATENCY = 0.2  # Seconds taken by the local server to answer an order book request
+
+PRODUCTS = [{'id': base + '-' + quote, 'base_currency': base, 'quote_currency': quote, 'base_increment': '0.00000001',
+             'min_market_funds': '1', 'status': 'online', 'trading_disabled': False}
+            for base, quote in [('ETH', 'USD'), ('ETH', 'BTC'), ('BTC', 'USD'), ('ETH', 'EUR'), ('BTC', 'EUR'), ('EUR', 'USD')]]
+CURRENCIES = [{'id': ccy, 'status': 'online'} for ccy in ['ETH', 'BTC', 'USD', 'EUR']]
+BOOKS = {'ETH-USD': ('1751.27', '1751.54'), 'ETH-BTC': ('0.08084', '0.08086'), 'BTC-USD': ('21652.44', '21652.45'),
+         'ETH-EUR': ('1700.10', '1700.20'), 'BTC-EUR': ('21030.00', '21030.50'), 'EUR-USD': ('1.0300', '1.0301')}
+
+
+class TestAsyncCoinbaseClient(IsolatedAsyncioTestCase):
+    """ Unit tests for AsyncCoinbaseClient class against a local server. """
+
+    async def asyncSetUp(self):
+
+        async def products(request):
+            return web.json_response(PRODUCTS)
+
+        async def currencies(request):
+            return web.json_response(CURRENCIES)
+
+        async def book(request):
+            await asyncio.sleep(LATENCY)
+            bid, ask = BOOKS[request.match_info['product_id']]
+            return web.json_response({'bids': [[bid, '1', 1]], 'asks': [[ask, '1', 1]], 'sequence': 1})
+
+        app = web.Application()
+        app.router.add_get('/products', products)
+        app.router.add_get('/currencies', currencies)
+        app.router.add_get('/products/{product_id}/book', book)
+
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, '127.0.0.1', 0)
+        await site.start()
+        port = self.runner.addresses[0][1]
+        self.url = 'http://127.0.0.1:{}'.format(port)
+
+    async def asyncTearDown(self):
+        await self.runner.cleanup()
+
+    async def test_loadCatalog(self):
+        """ Test if the metadata lookups are answered from the catalog. """
+        client = AsyncCoinbaseClient(self.url)
+        with self.assertRaises(RuntimeError):
+            client.getBasePrecision('ETH', 'USD')
+
+        await client.loadCatalog()
+        client.checkCurrenciesExistence(['ETH', 'BTC', 'USD'])
+        self.assertTrue(client.checkCurrencyPairExistence('ETH', 'BTC'))
+        self.assertEqual(client.getBasePrecision('ETH', 'USD'), -8)
+        await client.closeSession()
+
+    async def test_buildGraphAsync(self):
+        """ Test if order books are fetched concurrently and the graph matches the order books. """
+        client = AsyncCoinbaseClient(self.url, concurrency=10)
+        await client.loadCatalog()
+        graphObject = GraphConstructor(client, ['ETH', 'BTC', 'USD', 'EUR'])
+
+        start = time.perf_counter()
+        graph, orderBooks = await graphObject.buildGraphAsync()
+        elapsed = time.perf_counter() - start
+        await client.closeSession()
+
+        self.assertEqual(len(orderBooks), 6)
+        self.assertLess(elapsed, 3 * LATENCY)  # Serial fetching would take 6 * LATENCY
+        self.assertAlmostEqual(np.exp(-graph[0, 1]), 0.08084)
+        self.assertAlmostEqual(np.exp(-graph[1, 0]), 1 / 0.08086)
+
+    async def test_concurrencyLimit(self):
+        """ Test if no more than the configured number of requests are in flight. """
+        client = AsyncCoinbaseClient(self.url, concurrency=2)
+        await client.loadCatalog()
+        graphObject = GraphConstructor(client, ['ETH', 'BTC', 'USD', 'EUR'])
+
+        start = time.perf_counter()
+        await graphObject.buildGraphAsync()
+        elapsed = time.perf_counter() - start
+        await client.closeSession()
+
+        self.assertGreaterEqual(elapsed, 3 * LATENCY)
+
+    async def test_mainAsync(self):
+        """ Test if the whole pipeline runs with the asyncio client. """
+        opportunities = await mainAsync(AsyncCoinbaseClient(self.url), ['ETH', 'BTC', 'USD', 'EUR'])
+        self.assertIsInstance(opportunities, list)
@@ -0,0 +1,163 @@
+"""
+Brief: Unit tests for base_client.py
+"""
+
+from unittest import TestCase
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+import time
+
+import requests
+
+from clients.base.base_client import BaseClient
+from clients.base.request_scheduler import RequestScheduler
+from clients.coinbase.coinbase_client import CoinbaseClient
+from metrics import METRICS
+
+LATENCY = 0.1  # Seconds taken by the local server to answer a request
+
+
+class SlowHandler(BaseHTTPRequestHandler):
+    """ Answers every request with its path after a fixed latency. """
+
+    def do_GET(self):
+        time.sleep(LATENCY)
+        body = json.dumps({'path': self.path, 'bids': [['1', '1', 1]], 'asks': [['1', '1', 1]]}).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FlakyHandler(BaseHTTPRequestHandler):
+    """ Answers /<status>/<n>/<name> with the status code n times, then with 200; answers /missing with 404. """
+
+    attempts = {}  # Number of requests received per path
+
+    def do_GET(self):
+        FlakyHandler.attempts[self.path] = FlakyHandler.attempts.get(self.path, 0) + 1
+        if self.path == '/missing':
+            status, body = 404, {'message': 'NotFound'}
+        else:
+            code, failures = self.path.split('/')[1:3]
+            status = int(code) if FlakyHandler.attempts[self.path] <= int(failures) else 200
+            body = {'path': self.path} if status == 200 else {'message': 'error'}
+        body = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        if status == 429:
+            self.send_header('Retry-After', '0')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestBaseClient(TestCase):
+    """ Unit tests for BaseClient class against a local server. """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), SlowHandler)
+        cls.url = 'http://127.0.0.1:{}'.format(cls.server.server_address[1])
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def test_sendMessagesSequentially(self):
+        """ Test if a batch is sent in order without worker threads. """
+        client = BaseClient(self.url)
+        responses = client.send_messages([('get', '/a', None), ('get', '/b', {'level': 1})])
+        client.close()
+
+        self.assertListEqual([response['path'] for response in responses], ['/a', '/b?level=1'])
+        self.assertEqual(len(client.batchLatencies), 1)
+        self.assertGreaterEqual(client.batchLatencies[0], 2 * LATENCY)
+
+    def test_sendMessagesConcurrently(self):
+        """ Test if a batch is sent concurrently with worker threads and responses keep their order. """
+        client = BaseClient(self.url, maxWorkers=8)
+        paths = ['/{}'.format(index) for index in range(8)]
+        responses = client.send_messages([('get', path, None) for path in paths])
+        client.close()
+
+        self.assertListEqual([response['path'] for response in responses], paths)
+        self.assertLess(client.batchLatencies[0], 4 * LATENCY)  # Sequential sending would take 8 * LATENCY
+
+    def test_getOrderBooks(self):
+        """ Test if the Coinbase client fetches a batch of order books keyed by currency pair. """
+        client = CoinbaseClient(api_url=self.url, maxWorkers=4)
+        orderBooks = client.getOrderBooks([('ETH', 'USD'), ('BTC', 'USD')])
+        client.closeSession()
+
+        self.assertEqual(orderBooks[('ETH', 'USD')]['path'], '/products/ETH-USD/book?level=1')
+        self.assertEqual(orderBooks[('BTC', 'USD')]['path'], '/products/BTC-USD/book?level=1')
+        self.assertEqual(len(client.getBatchLatencies()), 1)
+
+    def test_requestMetrics(self):
+        """ Test if every request is timed per endpoint template and counted per status code. """
+        METRICS.reset()
+        client = CoinbaseClient(api_url=self.url)
+        client.getOrderBooks([('ETH', 'USD'), ('BTC', 'USD')])
+        client.closeSession()
+
+        histogram = METRICS.getHistogram('http_request_seconds', method='GET', endpoint='/products/{id}/book')
+        self.assertEqual(histogram.count, 2)
+        self.assertGreaterEqual(min(histogram.samples), LATENCY)
+        self.assertEqual(METRICS.getCounter('http_requests', status=200), 2)
+
+
+class TestBaseClientRetries(TestCase):
+    """ Unit tests for the retries of BaseClient against a local server returning error responses. """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), FlakyHandler)
+        cls.url = 'http://127.0.0.1:{}'.format(cls.server.server_address[1])
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.client = BaseClient(self.url, scheduler=RequestScheduler(maxRetries=3, backoffBase=0.01, seed=0))
+
+    def tearDown(self):
+        self.client.close()
+
+    def test_retryThrottledAndServerErrors(self):
+        """ Test if 429 and 5xx responses are retried until the request succeeds, and counted. """
+        METRICS.reset()
+        self.assertEqual(self.client.send_message('get', '/429/2/a')['path'], '/429/2/a')
+        self.assertEqual(self.client.send_message('get', '/503/1/b')['path'], '/503/1/b')
+
+        stats = self.client.scheduler.getStats()
+        self.assertEqual(stats['throttled'], 2)
+        self.assertEqual(stats['retried'], 3)
+        self.assertEqual(stats['requests'], 5)
+        self.assertEqual(METRICS.getCounter('http_throttled'), 2)
+        self.assertEqual(METRICS.getCounter('http_retries'), 3)
+
+    def test_retriesExhausted(self):
+        """ Test if an HTTPError is raised once the retries are exhausted. """
+        with self.assertRaises(requests.HTTPError):
+            self.client.send_message('get', '/500/10/c')
+        self.assertEqual(FlakyHandler.attempts['/500/10/c'], 4)
+        self.assertEqual(self.client.scheduler.getStats()['failed'], 1)
+
+    def test_notFound(self):
+        """ Test if a 404 response is returned as JSON without a retry. """
+        self.assertDictEqual(self.client.send_message('get', '/missing'), {'message': 'NotFound'})
+        self.assertEqual(self.client.scheduler.getStats()['retried'], 0)
@@ -0,0 +1,55 @@
+"""
+Brief: Unit tests for batch_arbitrage.py
+"""
+
+from unittest import TestCase
+from arbitrage import Arbitrage
+from batch_arbitrage import BatchArbitrage
+from leg import Leg
+
+import numpy as np
+
+
+class TestBatchArbitrage(TestCase):
+    """ Unit tests for BatchArbitrage class; results must be identical to those of the Arbitrage class. """
+
+    def setUp(self):
+        generator = np.random.default_rng(0)
+        self.cycles = []
+        for _ in range(500):
+            self.cycles.append([Leg(('A', 'B'),
+                                    'short' if generator.random() < 0.5 else 'long',
+                                    10 ** generator.uniform(-3, 3),
+                                    10 ** generator.uniform(-4, 4),
+                                    generator.choice([0, 0.001, 0.006]),
+                                    generator.integers(-8, 2),
+                                    10 ** generator.uniform(-5, 1)) for _ in range(generator.integers(2, 7))])
+        self.batch = BatchArbitrage.fromLegs(self.cycles)
+
+    def test_fromLegs(self):
+        """ Test if ragged cycles are padded to the length of the longest cycle. """
+        self.assertEqual(self.batch.prices.shape, (500, 6))
+        self.assertListEqual(list(self.batch.lengths), [len(cycle) for cycle in self.cycles])
+        self.assertListEqual(list(self.batch.active.sum(axis=1)), [len(cycle) for cycle in self.cycles])
+
+    def test_matchesArbitrage(self):
+        """ Test if sizes, adjusted sizes, notional checks and profits equal those of the Arbitrage class exactly. """
+        sizes = self.batch.calculateMaximumOrderSize()
+        adjustedSizes = self.batch.adjustOrderSizeForBaseTickSize(sizes)
+        valid = self.batch.checkNotionalMinimumLimit(adjustedSizes)
+        profits = self.batch.calculateProfit(adjustedSizes)
+
+        for index, cycle in enumerate(self.cycles):
+            arbitrage = Arbitrage(cycle)
+            expectedSizes = arbitrage.calculateMaximumOrderSize()
+            expectedAdjustedSizes = arbitrage.adjustOrderSizeForBaseTickSize(expectedSizes)
+
+            self.assertListEqual(list(sizes[index, :len(cycle)]), list(expectedSizes))
+            self.assertListEqual(list(adjustedSizes[index, :len(cycle)]), list(expectedAdjustedSizes))
+            self.assertEqual(valid[index], arbitrage.checkNotionalMinimumLimit(expectedAdjustedSizes))
+            self.assertEqual(profits[index], arbitrage.calculateProfit(expectedAdjustedSizes))
+
+    def test_paddingIsZero(self):
+        """ Test if order sizes beyond the length of a cycle are zero. """
+        adjustedSizes = self.batch.adjustOrderSizeForBaseTickSize(self.batch.calculateMaximumOrderSize())
+        self.assertTrue((adjustedSizes[~self.batch.active] == 0).all())
@@ -104,3 +104,33 @@ class TestBellmanFordAlgorithm(TestCase):
 
         self.assertListEqual(self.testMatrixOne.negativeCycle, [2, 3, 1])
         self.assertListEqual(additionalTestMatrix.negativeCycle, [2, 3, 0, 4])
+
+    def test_getEdgeArrays(self):
+        """ Test if the edges are correctly extracted from the matrix """
+        self.assertListEqual(list(self.testMatrixOne.sources), [0, 1, 1, 2, 3, 3])
+        self.assertListEqual(list(self.testMatrixOne.targets), [1, 0, 2, 3, 0, 1])
+        self.assertListEqual(list(self.testMatrixOne.weights), [2, 1, -1, -1, 1, -1])
+
+    def test_getAllNegativeCycles(self):
+        """ Test if every distinct negative cycle is found """
+        twoCyclesMatrix = BellmanFordAlgorithm(np.array([[0, -1, 1, 1, 1, 1],
+                                                         [1, 0, -1, 1, 1, 1],
+                                                         [1.5, 1, 0, 1, 1, 1],
+                                                         [1, 1, 1, 0, -1, 1],
+                                                         [1, 1, 1, 1, 0, -1],
+                                                         [1, 1, 1, 1, 1, 0]]))
+        self.testMatrixOne.getAllNegativeCycles()
+        self.testMatrixTwo.getAllNegativeCycles()
+        self.testMatrixThree.getAllNegativeCycles()
+        twoCyclesMatrix.getAllNegativeCycles()
+
+        self.assertListEqual(self.testMatrixOne.negativeCycles, [[1, 2, 3]])
+        self.assertListEqual(self.testMatrixTwo.negativeCycles, [])
+        self.assertListEqual(self.testMatrixThree.negativeCycles, [[2, 4]])
+        self.assertListEqual(sorted(twoCyclesMatrix.negativeCycles), [[0, 1, 2], [3, 4, 5]])
+
+    def test_canonicaliseCycle(self):
+        """ Test if all rotations of a cycle are canonicalised to the same cycle """
+        self.assertTupleEqual(BellmanFordAlgorithm.canonicaliseCycle([2, 3, 1]), (1, 2, 3))
+        self.assertTupleEqual(BellmanFordAlgorithm.canonicaliseCycle([3, 1, 2]), (1, 2, 3))
+        self.assertTupleEqual(BellmanFordAlgorithm.canonicaliseCycle([0, 4, 2]), (0, 4, 2))
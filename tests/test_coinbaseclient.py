@@ -55,5 +55,13 @@ class TestCoinbaseClient(TestCase):
         self.assertFalse(self.client.checkCurrencyPairExistence('PENCIL', 'USD'))
         self.assertFalse(self.client.checkCurrencyPairExistence('FOX', 'FOX'))
 
+    def test_positionalParameters(self):
+        """ Test if the metadata parameters keep their positions, the newer parameters being added after them """
+        client = CoinbaseClient(600, 16)
+        self.assertEqual(client.metadataTTL, 600)
+        self.assertEqual(client.metadataCache.maxSize, 16)
+        self.assertEqual(client.apiUrl, 'https://api.pro.coinbase.com')
+        client.closeSession()
+
     def tearDown(self):
         self.client.closeSession()
\ No newline at end of file
@@ -0,0 +1,74 @@
+"""
+Brief: Unit tests for depth_arbitrage.py
+"""
+
+from unittest import TestCase
+from arbitrage import Arbitrage
+from depth_arbitrage import DepthArbitrage
+from leg import Leg
+
+import numpy as np
+
+
+class TestDepthArbitrage(TestCase):
+    """ Unit tests for DepthArbitrage class. """
+
+    def setUp(self):
+        # Sell A for B, sell B for C and buy A back with C; the second level of each side of A is still profitable
+        self.legs = [
+            Leg(('A', 'B'), 'short', '1', '2', '0', -2, '0.01', depth=[['2', '1', 1], ['1.8', '1', 1]]),
+            Leg(('B', 'C'), 'short', '10', '1', '0', -2, '0.01', depth=[['1', '10', 1]]),
+            Leg(('A', 'C'), 'long', '1', '1.5', '0', -2, '0.01', depth=[['1.5', '1', 1], ['1.7', '1', 1], ['2.5', '10', 4]])
+        ]
+        self.testData = DepthArbitrage(self.legs)
+
+    def test_calculateMaximumOrderSize(self):
+        """ Test if the profit-maximising volume stops where the next level is no longer profitable. """
+        sizes = self.testData.calculateMaximumOrderSize()
+
+        self.assertAlmostEqual(self.testData.volume, 5 / 3)
+        for size, expectedSize in zip(sizes, [5 / 3, 3.2, 2]):
+            self.assertAlmostEqual(size, expectedSize)
+
+    def test_adjustOrderSizeForBaseTickSize(self):
+        """ Test if rounding an order size down reduces the amounts available to the following legs. """
+        adjustedSizes = self.testData.adjustOrderSizeForBaseTickSize(self.testData.calculateMaximumOrderSize())
+
+        for size, expectedSize in zip(adjustedSizes, [1.66, 3.18, 1.98]):
+            self.assertAlmostEqual(size, expectedSize)
+        self.assertAlmostEqual(self.testData.calculateProfit(adjustedSizes), 0.32)
+
+    def test_checkNotionalMinimumLimit(self):
+        """ Test if the notional value of every order is its value over the levels it consumes. """
+        adjustedSizes = self.testData.adjustOrderSizeForBaseTickSize(self.testData.calculateMaximumOrderSize())
+        self.assertTrue(self.testData.checkNotionalMinimumLimit(adjustedSizes))
+
+        legs = self.legs[:2] + [Leg(('A', 'C'), 'long', '1', '1.5', '0', -2, '3.2', depth=self.legs[2].depth)]
+        self.assertFalse(DepthArbitrage(legs).checkNotionalMinimumLimit(adjustedSizes))
+
+    def test_moreProfitableThanTopOfBook(self):
+        """ Test if using the depth of the order books makes more profit than the best prices only. """
+        topOfBook = Arbitrage(self.legs)
+        topOfBookProfit = topOfBook.calculateProfit(topOfBook.adjustOrderSizeForBaseTickSize(topOfBook.calculateMaximumOrderSize()))
+        depthProfit = self.testData.calculateProfit(self.testData.adjustOrderSizeForBaseTickSize(self.testData.calculateMaximumOrderSize()))
+
+        self.assertAlmostEqual(topOfBookProfit, 0.25)
+        self.assertGreater(depthProfit, topOfBookProfit)
+
+    def test_matchesArbitrageWithoutDepth(self):
+        """ Test if legs without depth are sized as by the Arbitrage class. """
+        legs = [Leg(leg.pair, leg.position, leg.availableQuantity, leg.price, '0.001', leg.basePrecision, leg.notionalMinimumLimit)
+                for leg in self.legs]
+        expectedSizes = Arbitrage(legs).calculateMaximumOrderSize()
+        sizes = DepthArbitrage(legs).calculateMaximumOrderSize()
+
+        for size, expectedSize in zip(sizes, expectedSizes):
+            self.assertAlmostEqual(size, expectedSize)
+
+    def test_optimality(self):
+        """ Test if no starting volume on a fine grid makes more profit than the one found by bisection. """
+        self.testData.calculateMaximumOrderSize()
+        profit = self.testData._traverse(self.testData.volume)[-1] - self.testData.volume
+
+        for volume in np.linspace(0, 2, 2001):
+            self.assertLessEqual(self.testData._traverse(volume)[-1] - volume, profit + 1e-12)
@@ -0,0 +1,129 @@
+"""
+Brief: Unit tests for floyd_warshall_algorithm.py
+"""
+
+from unittest import TestCase
+import itertools
+
+from bellman_ford_algorithm import BellmanFordAlgorithm
+from floyd_warshall_algorithm import FloydWarshallAlgorithm, autoDetector
+from spfa_algorithm import SPFAAlgorithm
+from sparse_graph import SparseGraph
+from strongly_connected_components import ConnectedComponents
+
+import numpy as np
+
+
+class TestFloydWarshallAlgorithm(TestCase):
+    """ Unit tests for the FloydWarshallAlgorithm class. """
+
+    def setUp(self):
+        """ Contains negative cycle - self.testMatrixOne
+        Contains no negative cycle - self.testMatrixTwo """
+        self.testMatrixOne = FloydWarshallAlgorithm(np.array([[0,  2,  0,  0],
+                                                              [1,  0, -1,  0],
+                                                              [0,  0,  0, -1],
+                                                              [1, -1,  0,  0]]))
+        self.testMatrixTwo = FloydWarshallAlgorithm(np.array([[0, 3, 1, 1, 0, 4],
+                                                              [0, 0, 2, 7, 1, 0],
+                                                              [-1, -1, 0, 0, 0, 1],
+                                                              [1, 0, 2, 0, 0, 6],
+                                                              [9, 1, 0, 1, 0, 0],
+                                                              [0, 1, 3, 0, -1, 0]]))
+
+    def test_shortestPathsWithoutNegativeCycle(self):
+        """ Test if the shortest distances and paths between all pairs are found when there is no negative cycle """
+        self.testMatrixTwo.implementFloydWarshallAlgorithm()
+
+        for index, distance in enumerate([0, 0, 1, 1, 1, 2]):
+            self.assertEqual(self.testMatrixTwo.distances[0, index], distance)
+        self.assertListEqual(self.testMatrixTwo.getPath(0, 5), [0, 2, 5])
+        self.assertListEqual(self.testMatrixTwo.getPath(5, 3), [5, 4, 3])
+        self.assertListEqual(self.testMatrixTwo.getPath(3, 3), [3])
+        self.assertListEqual(self.testMatrixTwo.negativeWalkVertices, [])
+
+    def test_getNegativeCycle(self):
+        """ Test if the vertices on the negative cycle and the cycle are found """
+        self.testMatrixOne.getANegativeCycle()
+        self.testMatrixTwo.getANegativeCycle()
+
+        self.assertListEqual(self.testMatrixOne.negativeWalkVertices, [1, 2, 3])
+        self.assertListEqual(self.testMatrixOne.negativeCycleVertices, [1, 2, 3])
+        self.assertListEqual(self.testMatrixOne.negativeCycle, [1, 2, 3])
+        self.assertListEqual(self.testMatrixOne.cycleWeights, [-3.0])
+        self.assertListEqual(self.testMatrixTwo.negativeCycle, [])
+
+    def test_negativeWalkVertices(self):
+        """ Test if a vertex on a negative closed walk but on no negative cycle is not reported as on a negative cycle """
+        detectorObject = FloydWarshallAlgorithm(np.array([[0, -1, 0, 1],
+                                                          [0, 0, -1, 0],
+                                                          [-1, 0, 0, 0],
+                                                          [1, 0, 0, 0]]))
+        detectorObject.getAllNegativeCycles()
+
+        self.assertListEqual(detectorObject.negativeWalkVertices, [0, 1, 2, 3])
+        self.assertListEqual(detectorObject.negativeCycleVertices, [0, 1, 2])
+        self.assertListEqual(detectorObject.negativeCycles, [[0, 1, 2]])
+
+    def test_sharedEdgeCycle(self):
+        """ Test if a negative cycle sharing an edge with a more negative one is skipped, and its vertex only reported on a walk """
+        detectorObject = FloydWarshallAlgorithm(np.array([[0, -0.4, 0.5, -0.9],
+                                                          [1.3, 0, 0.4, 0],
+                                                          [1.1, 0, 0, 0],
+                                                          [-1.0, -0.3, -0.6, 0]]))
+        detectorObject.getAllNegativeCycles()
+
+        self.assertListEqual(detectorObject.negativeCycles, [[0, 3]])  # 0 --> 3 --> 2 --> 0 shares the edge 0 --> 3
+        self.assertListEqual(detectorObject.negativeCycleVertices, [0, 3])
+        self.assertListEqual(detectorObject.negativeWalkVertices, [0, 1, 2, 3])
+
+    def test_getAllNegativeCycles(self):
+        """ Test if negative cycles hidden by a more negative one are found once its edges are removed """
+        twoCyclesMatrix = FloydWarshallAlgorithm(np.array([[0, -1, 1, 1, 1, 1],
+                                                           [1, 0, -1, 1, 1, 1],
+                                                           [1.5, 1, 0, 1, 1, 1],
+                                                           [1, 1, 1, 0, -1, 1],
+                                                           [1, 1, 1, 1, 0, -1],
+                                                           [1, 1, 1, 1, 1, 0]]))
+        twoCyclesMatrix.getAllNegativeCycles()
+
+        self.assertListEqual(twoCyclesMatrix.negativeCycles, [[3, 4, 5], [0, 1, 2]])
+        self.assertListEqual(twoCyclesMatrix.cycleWeights, [-1.0, -0.5])
+
+    def test_randomGraphs(self):
+        """ Test on random digraphs if every vertex on a negative cycle is on a negative closed walk, only vertices of strongly
+        connected components with a negative cycle are, and every cycle found is a negative cycle """
+        generator = np.random.default_rng(0)
+        for _ in range(100):
+            vertices = int(generator.integers(1, 8))
+            mask = generator.random((vertices, vertices)) < generator.random()
+            np.fill_diagonal(mask, False)
+            matrix = generator.normal(0.3, 1, (vertices, vertices)) * mask
+            graph = SparseGraph.fromMatrix(matrix, mask)
+
+            negativeCycles = set()
+            for hops in range(2, vertices + 1):
+                for cycle in itertools.permutations(range(vertices), hops):
+                    edges = [(cycle[i], cycle[(i + 1) % hops]) for i in range(hops)]
+                    if all(mask[edge] for edge in edges) and sum(matrix[edge] for edge in edges) < 0:
+                        negativeCycles.add(BellmanFordAlgorithm.canonicaliseCycle(list(cycle)))
+            labels = ConnectedComponents(graph).componentLabels
+            negativeComponents = set(labels[cycle[0]] for cycle in negativeCycles)
+
+            detectorObject = FloydWarshallAlgorithm(graph)
+            detectorObject.getAllNegativeCycles()
+
+            self.assertTrue(set(vertex for cycle in negativeCycles for vertex in cycle) <= set(detectorObject.negativeWalkVertices))
+            self.assertTrue(all(labels[vertex] in negativeComponents for vertex in detectorObject.negativeWalkVertices))
+            self.assertListEqual(detectorObject.negativeCycleVertices,
+                                 sorted(set(vertex for cycle in detectorObject.negativeCycles for vertex in cycle)))
+            self.assertTrue(set(map(tuple, detectorObject.negativeCycles)) <= negativeCycles)
+            self.assertEqual(set(labels[cycle[0]] for cycle in detectorObject.negativeCycles), negativeComponents)
+
+    def test_autoDetector(self):
+        """ Test if the SPFA detector, the fastest in benchmark_floyd_warshall, is picked for small dense and large sparse graphs """
+        ring = SparseGraph(10, range(10), [(vertex + 1) % 10 for vertex in range(10)], [-0.1] * 10)
+        completeGraph = np.ones((300, 300)) - np.eye(300)
+
+        for graph in (self.testMatrixTwo.graph, ring, completeGraph):
+            self.assertIsInstance(autoDetector(graph), SPFAAlgorithm)
@@ -24,10 +24,11 @@ class TestGraphConstructor(TestCase):
         self.assertSetEqual(set(self.testGraph.edges), {('BOBA', 'USDT'), ('ETH', 'BTC'), ('ETH', 'USDT'), ('BTC', 'USDT')})
 
     def test_buildGraph(self):
-        """ Test if the matrix representation of the graph is constructed correctly """
+        """ Test if the graph is constructed correctly """
         graph, orderBooks = self.testGraph.buildGraph()
+        self.assertEqual(graph.edgeCount, 8)
         for i, j in [(0, 0), (1, 1), (2, 2), (3, 3), (1, 0), (0, 1), (1, 2), (2, 1)]:
-            self.assertEqual(graph[i, j], 0)
+            self.assertFalse(graph.hasEdge(i, j))
 
         self.assertAlmostEqual(np.exp(-graph[1, 3]), eval(orderBooks[('BOBA', 'USDT')]['bids'][0][0]))
         self.assertAlmostEqual(np.exp(-graph[2, 0]), eval(orderBooks[('ETH', 'BTC')]['bids'][0][0]))
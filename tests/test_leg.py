@@ -0,0 +1,43 @@
+"""
+Brief: Unit tests for leg.py
+"""
+
+from unittest import TestCase
+from leg import Leg
+
+
+class TestLeg(TestCase):
+    """ Unit tests for Leg class. """
+
+    def test_parsing(self):
+        """ Test if the strings from the exchange are parsed into typed attributes. """
+        leg = Leg(('ETH', 'BTC'), 'short', '1.1', '0.08084', '0.0015', -8, '0.00001')
+
+        self.assertTupleEqual(leg.pair, ('ETH', 'BTC'))
+        self.assertEqual(leg.position, 'short')
+        self.assertEqual(leg.availableQuantity, 1.1)
+        self.assertEqual(leg.price, 0.08084)
+        self.assertEqual(leg.fee, 0.0015)
+        self.assertEqual(leg.basePrecision, -8)
+        self.assertEqual(leg.notionalMinimumLimit, 0.00001)
+
+    def test_fromDict(self):
+        """ Test if a leg is created from a dictionary with the same keys as the attributes. """
+        leg = Leg.fromDict({'pair': ('A', 'B'), 'position': 'long', 'availableQuantity': '5', 'price': '10', 'fee': '0.01',
+                            'basePrecision': -2, 'quotePrecision': None, 'notionalMinimumLimit': '0.1'})
+        self.assertEqual(leg, Leg(('A', 'B'), 'long', 5, 10, 0.01, -2, 0.1))
+
+    def test_slots(self):
+        """ Test if no attributes other than the declared ones can be set. """
+        leg = Leg(('A', 'B'), 'long', 5, 10, 0.01, -2, 0.1)
+        with self.assertRaises(AttributeError):
+            leg.quotePrecision = None
+
+    def test_depth(self):
+        """ Test if the order book levels are parsed once into (price, quantity) tuples. """
+        leg = Leg(('A', 'B'), 'short', '2', '10', '0.01', -2, '0.1', depth=[['10', '2', 1], ['9.5', '3', 2]])
+        self.assertTupleEqual(leg.depth, ((10.0, 2.0), (9.5, 3.0)))
+        self.assertIsNone(Leg(('A', 'B'), 'short', '2', '10', '0.01', -2, '0.1').depth)
+        self.assertEqual(Leg.fromDict({'pair': ('A', 'B'), 'position': 'short', 'availableQuantity': '2', 'price': '10',
+                                       'fee': '0.01', 'basePrecision': -2, 'notionalMinimumLimit': '0.1',
+                                       'depth': [['10', '2', 1]]}).depth, ((10.0, 2.0),))
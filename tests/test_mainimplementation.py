@@ -0,0 +1,203 @@
+"""
+Brief: Unit tests for main_implementation.py
+"""
+
+from unittest import TestCase, IsolatedAsyncioTestCase
+from contextlib import redirect_stdout
+import io
+import signal
+
+from main_implementation import main, mainStreaming, runScanner
+from metrics import METRICS
+from benchmarks.websocket_replay_server import ReplayWebSocketServer
+
+
+class FakeClient:
+    """ Exchange client serving fixed order books and counting the calls made. """
+
+    def __init__(self, orderBooks):
+        self.orderBooks = orderBooks
+        self.pairDiscoveries = 0
+        self.orderBookFetches = 0
+        self.levels = []
+        self.closed = False
+
+    def checkCurrenciesExistence(self, currencies):
+        pass
+
+    def getCurrencyPairs(self, currencies):
+        self.pairDiscoveries += 1
+        return [pair for pair in self.orderBooks if pair[0] in currencies and pair[1] in currencies]
+
+    def getTradableUniverse(self):
+        return sorted(set(ccy for pair in self.orderBooks for ccy in pair)), list(self.orderBooks)
+
+    def getOrderBook(self, base, quote, level=1):
+        self.orderBookFetches += 1
+        self.levels.append(level)
+        book = self.orderBooks[(base, quote)]
+        return book if level > 1 else {side: book[side][:1] for side in ('bids', 'asks')}
+
+    @staticmethod
+    def getFees(tradedVolume):
+        return '0.001'
+
+    @staticmethod
+    def getBasePrecision(base, quote):
+        return -8
+
+    @staticmethod
+    def getNotionalMinLimit(base, quote):
+        return '0.00001'
+
+    def closeSession(self):
+        self.closed = True
+
+
+DEEP_ORDER_BOOKS = {('ETH', 'BTC'): {'bids': [['0.0850', '2', 1], ['0.0849', '5', 2]], 'asks': [['0.0851', '2', 1]]},
+                    ('ETH', 'USD'): {'bids': [['1751.27', '2', 1]], 'asks': [['1751.54', '2', 1], ['1751.60', '5', 3]]},
+                    ('BTC', 'USD'): {'bids': [['21652.44', '1', 1]], 'asks': [['21652.45', '1', 1]]}}
+
+ORDER_BOOKS = {('ETH', 'BTC'): {'bids': [['0.0850', '2', 1]], 'asks': [['0.0851', '2', 1]]},
+               ('ETH', 'USD'): {'bids': [['1751.27', '2', 1]], 'asks': [['1751.54', '2', 1]]},
+               ('BTC', 'USD'): {'bids': [['21652.44', '1', 1]], 'asks': [['21652.45', '1', 1]]}}
+
+
+class TestMainImplementation(TestCase):
+    """ Unit tests for the entry points of the program. """
+
+    def test_main(self):
+        """ Test if every arbitrage in the snapshot is sized and returned. """
+        client = FakeClient(ORDER_BOOKS)
+        with redirect_stdout(io.StringIO()) as output:
+            opportunities = main(client, ['ETH', 'BTC', 'USD'])
+
+        self.assertEqual(len(opportunities), 1)
+        self.assertSetEqual(set(opportunities[0]['cycle']), {'ETH', 'BTC', 'USD'})
+        self.assertTrue(opportunities[0]['valid'])
+        self.assertGreater(opportunities[0]['profit'], 0)
+        self.assertIn('A profitable arbitrage has been found.', output.getvalue())
+        self.assertTrue(client.closed)
+
+    def test_mainParallel(self):
+        """ Test if searching the components in worker processes gives the same arbitrages. """
+        with redirect_stdout(io.StringIO()):
+            sequential = main(FakeClient(ORDER_BOOKS), ['ETH', 'BTC', 'USD'])
+            parallel = main(FakeClient(ORDER_BOOKS), ['ETH', 'BTC', 'USD'], processes=2)
+
+        self.assertListEqual([opportunity['cycle'] for opportunity in parallel],
+                             [opportunity['cycle'] for opportunity in sequential])
+        self.assertEqual(parallel[0]['profit'], sequential[0]['profit'])
+
+    def test_mainShortCycles(self):
+        """ Test if the hop-bounded detector finds the same triangular arbitrage. """
+        with redirect_stdout(io.StringIO()):
+            opportunities = main(FakeClient(ORDER_BOOKS), ['ETH', 'BTC', 'USD'], detector='short-cycles')
+
+        self.assertEqual(len(opportunities), 1)
+        self.assertSetEqual(set(opportunities[0]['cycle']), {'ETH', 'BTC', 'USD'})
+        self.assertGreater(opportunities[0]['profit'], 0)
+
+    def test_mainFloydWarshall(self):
+        """ Test if the all-pairs detector and the detector picked automatically find the same triangular arbitrage. """
+        with redirect_stdout(io.StringIO()):
+            floydWarshall = main(FakeClient(ORDER_BOOKS), ['ETH', 'BTC', 'USD'], detector='floyd-warshall')
+            auto = main(FakeClient(ORDER_BOOKS), ['ETH', 'BTC', 'USD'], detector='auto')
+
+        for opportunities in (floydWarshall, auto):
+            self.assertEqual(len(opportunities), 1)
+            self.assertSetEqual(set(opportunities[0]['cycle']), {'ETH', 'BTC', 'USD'})
+            self.assertGreater(opportunities[0]['profit'], 0)
+
+    def test_stageMetrics(self):
+        """ Test if every stage of main is timed and the scan and its arbitrages are counted. """
+        METRICS.reset()
+        with redirect_stdout(io.StringIO()):
+            main(FakeClient(ORDER_BOOKS), ['ETH', 'BTC', 'USD'])
+
+        for stage in ('currency_check', 'pair_discovery', 'order_book_fetch', 'build_graph', 'scc', 'bellman-ford', 'sizing'):
+            self.assertEqual(METRICS.getHistogram('stage_seconds', stage=stage).count, 1)
+        self.assertEqual(METRICS.getCounter('scans'), 1)
+        self.assertEqual(METRICS.getCounter('opportunities'), 1)
+
+    def test_mainDepthAware(self):
+        """ Test if level 2 order books are fetched once and the deeper levels increase the size and profit of the arbitrage. """
+        topOfBookClient, depthClient = FakeClient(DEEP_ORDER_BOOKS), FakeClient(DEEP_ORDER_BOOKS)
+        with redirect_stdout(io.StringIO()):
+            topOfBook = main(topOfBookClient, ['ETH', 'BTC', 'USD'])[0]
+            depth = main(depthClient, ['ETH', 'BTC', 'USD'], level=2)[0]
+
+        self.assertListEqual(depthClient.levels, [2, 2, 2])
+        self.assertListEqual(topOfBookClient.levels, [1, 1, 1])
+        self.assertTrue(depth['valid'])
+        self.assertGreater(max(depth['sizes']), max(topOfBook['sizes']))
+        self.assertGreater(depth['profit'], topOfBook['profit'])
+
+    def test_runScanner(self):
+        """ Test if the scanner keeps the currency pairs across scans and reports per scan timings. """
+        METRICS.reset()
+        client = FakeClient(ORDER_BOOKS)
+        with redirect_stdout(io.StringIO()) as output:
+            timings = runScanner(client, ['ETH', 'BTC', 'USD'], interval=None, maxScans=3)
+
+        self.assertListEqual([timing['scan'] for timing in timings], [1, 2, 3])
+        self.assertListEqual([timing['opportunities'] for timing in timings], [1, 1, 1])
+        for timing in timings:
+            self.assertAlmostEqual(timing['total'], timing['fetch'] + timing['detection'])
+        self.assertEqual(client.pairDiscoveries, 1)
+        self.assertEqual(client.orderBookFetches, 9)
+        self.assertIn('3 scan(s)', output.getvalue())
+        self.assertTrue(client.closed)
+        self.assertEqual(METRICS.getHistogram('stage_seconds', stage='scc_build').count, 1)
+        self.assertEqual(METRICS.getHistogram('stage_seconds', stage='scc').count, 3)
+
+    def test_runScannerRestoresSignalHandlers(self):
+        """ Test if the signal handlers are restored and the session closed when the scanner fails to start. """
+        client = FakeClient(ORDER_BOOKS)
+        handler = signal.getsignal(signal.SIGINT)
+        with self.assertRaises(ValueError):
+            runScanner(client, ['ETH', 'BTC', 'USD'], interval=None, maxScans=1, processes=0)
+
+        self.assertIs(signal.getsignal(signal.SIGINT), handler)
+        self.assertTrue(client.closed)
+
+    def test_runScannerUniverse(self):
+        """ Test if the whole exchange is scanned without a currency list and every scan is reported against the budget. """
+        client = FakeClient(ORDER_BOOKS)
+        with redirect_stdout(io.StringIO()) as output:
+            timings = runScanner(client, None, interval=None, maxScans=2, latencyBudget=60.0)
+
+        self.assertEqual(client.pairDiscoveries, 0)
+        self.assertListEqual([timing['opportunities'] for timing in timings], [1, 1])
+        self.assertTrue(all(timing['budget'] == 60.0 and timing['withinBudget'] for timing in timings))
+        self.assertIn('3 currencies, 3 currency pairs', output.getvalue())
+        self.assertIn('2 of 2 scan(s) within the latency budget', output.getvalue())
+
+
+class TestMainStreaming(IsolatedAsyncioTestCase):
+    """ Runs mainStreaming against a local server replaying feed messages. """
+
+    async def test_mainStreaming(self):
+        """ Test if the strongly connected components are found once for every update and the session is closed. """
+        METRICS.reset()
+        server = ReplayWebSocketServer([{'type': 'snapshot', 'product_id': 'ETH-BTC', 'bids': [['0.0860', '2']], 'asks': [['0.0861', '2']]},
+                                        {'type': 'l2update', 'product_id': 'ETH-BTC', 'changes': [['buy', '0.0858', '1']]},
+                                        {'type': 'l2update', 'product_id': 'ETH-BTC', 'changes': [['buy', '0.0860', '0']]}])
+        await server.start()
+        client = FakeClient(ORDER_BOOKS)
+        with redirect_stdout(io.StringIO()):
+            stream = await mainStreaming(client, ['ETH', 'BTC', 'USD'], feedUrl=server.url)
+        await server.stop()
+
+        self.assertEqual(len(stream.latencies), 2)
+        self.assertEqual(METRICS.getHistogram('stage_seconds', stage='scc_build').count, 1)
+        self.assertEqual(METRICS.getHistogram('stage_seconds', stage='scc').count, 2)
+        self.assertTrue(client.closed)
+
+    async def test_mainStreamingClosesSession(self):
+        """ Test if the session is closed when the feed cannot be reached. """
+        client = FakeClient(ORDER_BOOKS)
+        with self.assertRaises(OSError):
+            await mainStreaming(client, ['ETH', 'BTC', 'USD'], feedUrl='ws://127.0.0.1:9')
+
+        self.assertTrue(client.closed)
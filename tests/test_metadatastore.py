@@ -0,0 +1,97 @@
+"""
+Brief: Unit tests for metadata_store.py
+"""
+
+from unittest import TestCase
+import os
+import sqlite3
+import tempfile
+import time
+
+from clients.coinbase.coinbase_client import CoinbaseClient
+from clients.coinbase.metadata_store import MetadataStore
+from clients.coinbase.product_catalog import ProductCatalog
+from tests.test_productcatalog import CURRENCIES, PRODUCTS, FakeCoinbaseInterface
+
+SOURCE = 'https://api.pro.coinbase.com'
+
+
+class TestMetadataStore(TestCase):
+    """ Unit tests for MetadataStore class and for the warm start of CoinbaseClient. """
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'metadata.sqlite')
+        self.store = MetadataStore(self.path)
+        self.catalog = ProductCatalog(PRODUCTS, CURRENCIES)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def createClient(self, **kwargs):
+        client = CoinbaseClient(metadataPath=self.path, **kwargs)
+        client.coinbaseClient = FakeCoinbaseInterface()
+        return client
+
+    def test_saveAndLoad(self):
+        """ Test if the listings and the fetch time are read back as saved. """
+        self.store.save(self.catalog, SOURCE, fetchedAt=1000.5)
+        catalog, fetchedAt = self.store.load(SOURCE)
+
+        self.assertEqual(fetchedAt, 1000.5)
+        self.assertDictEqual(catalog.products, self.catalog.products)
+        self.assertDictEqual(dict((code, currency['status']) for code, currency in catalog.currencies.items()),
+                             dict((code, currency['status']) for code, currency in self.catalog.currencies.items()))
+
+    def test_invalidFiles(self):
+        """ Test if a missing file, another exchange, another schema version or a corrupted file are ignored. """
+        self.assertIsNone(self.store.load(SOURCE))
+
+        self.store.save(self.catalog, SOURCE)
+        self.assertIsNone(self.store.load('http://127.0.0.1:8000'))
+
+        connection = sqlite3.connect(self.path)
+        with connection:
+            connection.execute("UPDATE meta SET value = '0' WHERE key = 'schema_version'")
+        connection.close()
+        self.assertIsNone(self.store.load(SOURCE))
+
+        with open(self.path, 'wb') as file:
+            file.write(b'not a database' * 100)
+        self.assertIsNone(self.store.load(SOURCE))
+
+    def test_warmStart(self):
+        """ Test if a restarted client answers metadata queries from the file without any request. """
+        coldClient = self.createClient()
+        coldClient.checkCurrenciesExistence(['ETH', 'BTC'])
+        self.assertEqual(coldClient.coinbaseClient.requests, 2)
+        self.assertEqual(coldClient.catalogSource, 'exchange')
+
+        warmClient = self.createClient()
+        warmClient.checkCurrenciesExistence(['ETH', 'BTC', 'USD'])
+        self.assertListEqual(warmClient.getCurrencyPairs(['ETH', 'BTC']), [('ETH', 'BTC')])
+        self.assertEqual(warmClient.getBasePrecision('ETH', 'BTC'), -8)
+        self.assertEqual(warmClient.getNotionalMinLimit('ETH', 'BTC'), '0.00001')
+        self.assertEqual(warmClient.coinbaseClient.requests, 0)
+        self.assertEqual(warmClient.catalogSource, 'file')
+
+    def test_staleCatalogIsRefreshedInBackground(self):
+        """ Test if a catalog older than the TTL is used at once while a newer one is fetched and saved. """
+        self.store.save(self.catalog, SOURCE, fetchedAt=time.time() - 120)
+        client = self.createClient(metadataTTL=60)
+
+        self.assertTrue(client.checkCurrencyPairExistence('ETH', 'BTC'))
+        client.waitForCatalogRefresh()
+
+        self.assertEqual(client.coinbaseClient.requests, 2)
+        self.assertEqual(client.catalogSource, 'exchange')
+        self.assertGreater(self.store.load(SOURCE)[1], time.time() - 60)
+
+    def test_catalogTooOld(self):
+        """ Test if a catalog older than the maximum age is fetched again before use. """
+        self.store.save(self.catalog, SOURCE, fetchedAt=time.time() - 7200)
+        client = self.createClient(metadataTTL=60, metadataMaxAge=3600)
+
+        client.checkCurrenciesExistence(['ETH'])
+        self.assertEqual(client.coinbaseClient.requests, 2)
+        self.assertEqual(client.catalogSource, 'exchange')
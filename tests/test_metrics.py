@@ -0,0 +1,92 @@
+"""
+Brief: Unit tests for metrics.py
+"""
+
+from unittest import TestCase
+import os
+import tempfile
+import urllib.request
+
+from metrics import MetricsRegistry, Histogram, endpointTemplate
+
+
+class TestMetrics(TestCase):
+    """ Unit tests for the Histogram and MetricsRegistry classes. """
+
+    def setUp(self):
+        self.registry = MetricsRegistry(namespace='test')
+
+    def test_histogram(self):
+        """ Test if the quantiles are computed over the window and the count and sum over all observations. """
+        histogram = Histogram(window=100)
+        for value in range(1, 201):
+            histogram.observe(value)
+
+        self.assertEqual(histogram.count, 200)
+        self.assertEqual(histogram.sum, 20100)
+        quantiles = histogram.getQuantiles()
+        self.assertAlmostEqual(quantiles[0.5], 150.5)
+        self.assertAlmostEqual(quantiles[0.99], 199.01)
+
+    def test_counterAndTimer(self):
+        """ Test if counters add up per label and the timer records a block that raises. """
+        self.registry.increment('requests', status=200)
+        self.registry.increment('requests', 2, status=200)
+        self.registry.increment('requests', status=429)
+        with self.assertRaises(KeyError):
+            with self.registry.timer('stage_seconds', stage='fetch'):
+                raise KeyError('bids')
+
+        self.assertEqual(self.registry.getCounter('requests', status=200), 3)
+        self.assertEqual(self.registry.getCounter('requests', status='429'), 1)
+        self.assertEqual(self.registry.getHistogram('stage_seconds', stage='fetch').count, 1)
+        self.assertIn((('stage', 'fetch'),), self.registry.getSummary('stage_seconds'))
+
+        self.registry.enabled = False
+        self.registry.increment('requests', status=200)
+        self.assertEqual(self.registry.getCounter('requests', status=200), 3)
+
+    def test_toPrometheus(self):
+        """ Test if counters and histograms are exported in the Prometheus text format. """
+        self.registry.describe('stage_seconds', 'Seconds per stage')
+        self.registry.increment('scans')
+        self.registry.observe('stage_seconds', 0.5, stage='scc')
+        text = self.registry.toPrometheus()
+
+        self.assertIn('# TYPE test_scans_total counter\ntest_scans_total 1\n', text)
+        self.assertIn('# HELP test_stage_seconds Seconds per stage\n# TYPE test_stage_seconds summary\n', text)
+        self.assertIn('test_stage_seconds{stage="scc",quantile="0.95"} 0.5\n', text)
+        self.assertIn('test_stage_seconds_sum{stage="scc"} 0.5\n', text)
+        self.assertIn('test_stage_seconds_count{stage="scc"} 1\n', text)
+
+    def test_export(self):
+        """ Test if the metrics are written to a file and served from a local endpoint. """
+        self.registry.increment('scans')
+        path = os.path.join(tempfile.mkdtemp(), 'metrics.prom')
+        self.registry.writePrometheus(path)
+        with open(path) as file:
+            self.assertEqual(file.read(), self.registry.toPrometheus())
+        os.remove(path)
+
+        url = self.registry.serve(port=0)
+        try:
+            with urllib.request.urlopen(url) as response:
+                self.assertEqual(response.read().decode(), self.registry.toPrometheus())
+        finally:
+            self.registry.stopServing()
+
+    def test_profiling(self):
+        """ Test if the profiler reports the functions called while it was enabled. """
+        self.assertEqual(self.registry.disableProfiling(), '')
+        self.registry.enableProfiling()
+        sorted(range(1000), key=lambda value: -value)
+        report = self.registry.disableProfiling()
+        self.assertIn('sorted', report)
+        self.assertIsNone(self.registry.profiler)
+
+    def test_endpointTemplate(self):
+        """ Test if resource ids are replaced so that endpoints share labels. """
+        self.assertEqual(endpointTemplate('/products/BTC-USD/book'), '/products/{id}/book')
+        self.assertEqual(endpointTemplate('/currencies/BTC'), '/currencies/{id}')
+        self.assertEqual(endpointTemplate('/products'), '/products')
+        self.assertEqual(endpointTemplate('/time'), '/time')
@@ -0,0 +1,100 @@
+"""
+Brief: Unit tests for order_book_store.py
+"""
+
+from unittest import TestCase
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+from clients.replay.order_book_store import OrderBookStore
+from graph_constructor import GraphConstructor
+
+
+class PairsClient:
+    """ Exchange client that only knows the currency pairs. """
+
+    @staticmethod
+    def getCurrencyPairs(currencies):
+        return [('ETH', 'BTC'), ('ETH', 'USD'), ('BTC', 'USD')]
+
+
+class TestOrderBookStore(TestCase):
+    """ Unit tests for OrderBookStore class. """
+
+    def setUp(self):
+        self.directory = os.path.join(tempfile.mkdtemp(), 'store')
+        store = OrderBookStore(self.directory, 'a')
+        for second in range(10):
+            store.appendSnapshot(100.0 + second, {
+                ('ETH', 'BTC'): {'bids': [['0.0850', '2', 1]], 'asks': [['0.0851', '2', 1]]},
+                ('ETH', 'USD'): {'bids': [[str(1750 + second), '2', 1]], 'asks': [[str(1751 + second), '3', 1]]}})
+        # BTC-USD is only quoted once, at the start
+        store.append([109.5], [('BTC', 'USD')], [21652.44], [1], [21652.45], [1])
+        store.append([110.0], [('ETH', 'USD')], [1700], [2], [1701], [3])
+        store.close()
+        self.store = OrderBookStore(self.directory, searchWindow=4)
+
+    def tearDown(self):
+        self.store.close()
+        shutil.rmtree(os.path.dirname(self.directory))
+
+    def test_reopen(self):
+        """ Test if the records and the pair dictionary are read back after reopening the store. """
+        self.assertEqual(len(self.store), 22)
+        self.assertListEqual(self.store.pairs, [('ETH', 'BTC'), ('ETH', 'USD'), ('BTC', 'USD')])
+        self.assertListEqual(list(self.store.columns['pairId'][:4]), [0, 1, 0, 1])
+        self.assertEqual(self.store.columns['ask'][3], 1752)
+
+    def test_timeRange(self):
+        """ Test if a time range is found by binary search, including both ends. """
+        self.assertEqual(self.store.timeRange(102, 103), slice(4, 8))
+        self.assertEqual(self.store.timeRange(end=99), slice(0, 0))
+        self.assertEqual(self.store.timeRange(109.5), slice(20, 22))
+
+    def test_view(self):
+        """ Test if views are zero-copy views of the memory-mapped columns. """
+        view = self.store.view(102, 103)
+        self.assertTrue(np.shares_memory(view['bid'], self.store.columns['bid']))
+        self.assertListEqual(list(view['bid']), [0.0850, 1752, 0.0850, 1753])
+        with self.assertRaises(ValueError):
+            view['bid'][0] = 0  # Read only
+
+    def test_appendInTimeOrder(self):
+        """ Test if records older than the last record are refused, and if appending after reopening works. """
+        store = OrderBookStore(self.directory, 'a')
+        with self.assertRaises(ValueError):
+            store.append([105.0], [('ETH', 'BTC')], [1], [1], [1], [1])
+        store.append([111.0], [('ETH', 'EUR')], [1600], [1], [1601], [1])
+        self.assertEqual(len(store), 23)
+        self.assertEqual(store.getPairId(('ETH', 'EUR')), 3)
+        store.close()
+
+    def test_partialAppend(self):
+        """ Test if a record that has only been written to some of the columns is discarded. """
+        with open(os.path.join(self.directory, 'timestamp.bin'), 'ab') as file:
+            file.write(np.array([120.0]).tobytes())
+        self.assertEqual(len(OrderBookStore(self.directory)), 22)
+
+    def test_getLatestQuotes(self):
+        """ Test if the latest quote at or before a timestamp is found for each pair, searching back over several windows. """
+        quotes = self.store.getLatestQuotes(105.5, [('ETH', 'USD'), ('ETH', 'BTC'), ('BTC', 'USD')])
+        self.assertDictEqual(quotes, {('ETH', 'USD'): (1755, 2, 1756, 3), ('ETH', 'BTC'): (0.0850, 2, 0.0851, 2)})
+
+        quotes = self.store.getLatestQuotes(110, [('ETH', 'USD'), ('BTC', 'USD')])
+        self.assertDictEqual(quotes, {('ETH', 'USD'): (1700, 2, 1701, 3), ('BTC', 'USD'): (21652.44, 1, 21652.45, 1)})
+
+    def test_buildGraphAt(self):
+        """ Test if the matrix is rebuilt from the latest quotes at a timestamp. """
+        graphObject = GraphConstructor(PairsClient(), ['ETH', 'BTC', 'USD'])
+        graph, orderBooks = graphObject.buildGraphAt(self.store, 109.5)
+
+        self.assertAlmostEqual(graph[0, 2], -np.log(1759))
+        self.assertAlmostEqual(graph[2, 0], -np.log(1 / 1760))
+        self.assertAlmostEqual(graph[1, 2], -np.log(21652.44))
+        self.assertListEqual(orderBooks[('ETH', 'BTC')]['asks'], [[0.0851, 2]])
+
+        with self.assertRaises(ValueError):
+            graphObject.buildGraphAt(self.store, 105)  # BTC-USD has not been quoted yet
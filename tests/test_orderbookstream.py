@@ -0,0 +1,80 @@
+"""
+Brief: Unit tests for order_book_stream.py
+"""
+
+from unittest import TestCase, IsolatedAsyncioTestCase
+from order_book_stream import OrderBookStream
+from benchmarks.websocket_replay_server import ReplayWebSocketServer
+
+import numpy as np
+
+NODES_KEY = {'ETH': 0, 'BTC': 1, 'USD': 2}
+EDGES = [('ETH', 'BTC'), ('ETH', 'USD'), ('BTC', 'USD')]
+MESSAGES = [
+    {'type': 'subscriptions', 'channels': []},
+    {'type': 'snapshot', 'product_id': 'ETH-BTC', 'bids': [['0.08084', '1.1'], ['0.08080', '3']], 'asks': [['0.08086', '0.15']]},
+    {'type': 'snapshot', 'product_id': 'ETH-USD', 'bids': [['1751.27', '0.24']], 'asks': [['1751.54', '0.35']]},
+    {'type': 'snapshot', 'product_id': 'BTC-USD', 'bids': [['21652.44', '0.0016']], 'asks': [['21652.45', '0.044']]},
+    {'type': 'l2update', 'product_id': 'ETH-BTC', 'changes': [['buy', '0.08084', '0.5']]},
+    {'type': 'l2update', 'product_id': 'ETH-BTC', 'changes': [['buy', '0.08084', '0']]},
+    {'type': 'l2update', 'product_id': 'ETH-USD', 'changes': [['sell', '1751.50', '2']]}
+]
+
+
+class TestOrderBookStream(TestCase):
+    """ Unit tests for OrderBookStream class. """
+
+    def setUp(self):
+        self.stream = OrderBookStream(NODES_KEY, EDGES, np.zeros((3, 3)))
+
+    def test_snapshotAndUpdates(self):
+        """ Test if top of book and edge weights follow snapshots and updates. """
+        self.assertIsNone(self.stream.handleMessage(MESSAGES[0]))
+        self.assertTupleEqual(self.stream.handleMessage(MESSAGES[1]), ('ETH', 'BTC'))
+        self.assertAlmostEqual(np.exp(-self.stream.graph[0, 1]), 0.08084)
+        self.assertAlmostEqual(np.exp(-self.stream.graph[1, 0]), 1 / 0.08086)
+
+        # Change of size at the best bid changes no weight, but updates the available quantity
+        self.assertIsNone(self.stream.handleMessage(MESSAGES[4]))
+        self.assertEqual(self.stream.orderBooks[('ETH', 'BTC')]['bids'][0], ['0.08084', '0.5', 1])
+        self.assertEqual(self.stream.weightUpdates, 2)
+
+        # Removal of the best bid moves the best bid to the next level
+        self.assertTupleEqual(self.stream.handleMessage(MESSAGES[5]), ('ETH', 'BTC'))
+        self.assertEqual(self.stream.orderBooks[('ETH', 'BTC')]['bids'][0], ['0.08080', '3', 1])
+        self.assertAlmostEqual(np.exp(-self.stream.graph[0, 1]), 0.08080)
+        self.assertEqual(self.stream.weightUpdates, 4)
+
+    def test_onlyChangedWeightsAreTouched(self):
+        """ Test if an update leaves the weights of other pairs untouched. """
+        for message in MESSAGES[1:4]:
+            self.stream.handleMessage(message)
+        before = self.stream.graph.copy()
+
+        self.stream.handleMessage(MESSAGES[6])
+        changed = np.argwhere(before != self.stream.graph)
+        self.assertListEqual(sorted(map(tuple, changed)), [(2, 0)])
+
+    def test_ticker(self):
+        """ Test if ticker messages set the top of book of pairs without level2 data. """
+        pair = self.stream.handleMessage({'type': 'ticker', 'product_id': 'BTC-USD', 'best_bid': '21652.44',
+                                          'best_bid_size': '1', 'best_ask': '21652.45', 'best_ask_size': '2'})
+        self.assertTupleEqual(pair, ('BTC', 'USD'))
+        self.assertAlmostEqual(np.exp(-self.stream.graph[1, 2]), 21652.44)
+
+
+class TestOrderBookStreamReplay(IsolatedAsyncioTestCase):
+    """ Runs OrderBookStream against a local server replaying recorded messages. """
+
+    async def test_run(self):
+        server = ReplayWebSocketServer(MESSAGES)
+        await server.start()
+
+        stream = OrderBookStream(NODES_KEY, EDGES, np.zeros((3, 3)))
+        updates = []
+        await stream.run(server.url, lambda graph, orderBooks, pair: updates.append(pair))
+        await server.stop()
+
+        self.assertListEqual(updates, [('ETH', 'BTC'), ('ETH', 'USD'), ('BTC', 'USD'), ('ETH', 'BTC'), ('ETH', 'USD')])
+        self.assertEqual(len(stream.latencies), 5)
+        self.assertAlmostEqual(np.exp(-stream.graph[2, 0]), 1 / 1751.50)
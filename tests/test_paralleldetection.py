@@ -0,0 +1,66 @@
+"""
+Brief: Unit tests for parallel_detection.py
+"""
+
+from unittest import TestCase
+
+import numpy as np
+
+from bellman_ford_algorithm import BellmanFordAlgorithm
+from graph_constructor import GraphConstructor
+from main_implementation import findNegativeCycles
+from parallel_detection import ParallelDetector
+from sparse_graph import SparseGraph
+from strongly_connected_components import ConnectedComponents
+from benchmarks.synthetic_market import SyntheticMarket
+
+
+def blockGraph(blocks, seed=0):
+    """ Graph made of disjoint synthetic markets, each with planted negative cycles. """
+    sources, targets, weights = [], [], []
+    start = 0
+    for block in range(blocks):
+        market = SyntheticMarket(8 + 2 * block, 1.0, (3, 4), seed=seed + block)
+        graph = GraphConstructor(market.client(), market.codes).buildGraph()[0]
+        sources.append(graph.sources + start)
+        targets.append(graph.targets + start)
+        weights.append(graph.weights)
+        start += graph.vertices
+    return SparseGraph(start, np.concatenate(sources), np.concatenate(targets), np.concatenate(weights))
+
+
+class TestParallelDetector(TestCase):
+    """ Unit tests for the parallel search of the strongly connected components. """
+
+    def test_findNegativeCycles(self):
+        """ Test if the cycles found in parallel are the same, and in the same order, as those of the sequential search. """
+        graph = blockGraph(4)
+        sequential = findNegativeCycles(graph)
+
+        with ParallelDetector(2) as parallelDetector:
+            parallel = parallelDetector.findNegativeCycles(graph, BellmanFordAlgorithm)
+            again = parallelDetector.findNegativeCycles(graph, BellmanFordAlgorithm, ConnectedComponents(graph))
+
+        self.assertGreaterEqual(len(sequential), 4)
+        self.assertListEqual(parallel, sequential)
+        self.assertListEqual(again, sequential)
+
+    def test_sharedMemory(self):
+        """ Test if the shared memory block is reused for graphs with the same numbers of vertices and edges and freed on close. """
+        graph = blockGraph(2)
+        parallelDetector = ParallelDetector(1)
+        parallelDetector.findNegativeCycles(graph, BellmanFordAlgorithm)
+        name = parallelDetector._block.name
+        parallelDetector.findNegativeCycles(graph, BellmanFordAlgorithm)
+        self.assertEqual(parallelDetector._block.name, name)
+
+        parallelDetector.findNegativeCycles(blockGraph(3), BellmanFordAlgorithm)
+        self.assertNotEqual(parallelDetector._block.name, name)
+
+        parallelDetector.close()
+        self.assertIsNone(parallelDetector._block)
+
+    def test_noComponents(self):
+        """ Test if a graph without a strongly connected component of 3 or more vertices gives None. """
+        with ParallelDetector(1) as parallelDetector:
+            self.assertIsNone(parallelDetector.findNegativeCycles(np.zeros((4, 4)), BellmanFordAlgorithm))
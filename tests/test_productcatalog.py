@@ -0,0 +1,115 @@
+"""
+Brief: Unit tests for product_catalog.py
+"""
+
+from unittest import TestCase
+from clients.coinbase.product_catalog import ProductCatalog
+from clients.coinbase.coinbase_client import CoinbaseClient, CurrencyNotFound
+
+PRODUCTS = [
+    {'id': 'ETH-USD', 'base_currency': 'ETH', 'quote_currency': 'USD', 'base_increment': '0.00000001',
+     'min_market_funds': '1', 'status': 'online', 'trading_disabled': False},
+    {'id': 'ETH-BTC', 'base_currency': 'ETH', 'quote_currency': 'BTC', 'base_increment': '0.00000001',
+     'min_market_funds': '0.00001', 'status': 'online', 'trading_disabled': False},
+    {'id': 'BTC-USD', 'base_currency': 'BTC', 'quote_currency': 'USD', 'base_increment': '0.00000001',
+     'min_market_funds': '1', 'status': 'online', 'trading_disabled': False},
+    {'id': 'LRC-BTC', 'base_currency': 'LRC', 'quote_currency': 'BTC', 'base_increment': '1',
+     'min_market_funds': '0.000016', 'status': 'delisted', 'trading_disabled': True}
+]
+CURRENCIES = [
+    {'id': 'ETH', 'name': 'Ether', 'status': 'online'},
+    {'id': 'BTC', 'name': 'Bitcoin', 'status': 'online'},
+    {'id': 'USD', 'name': 'United States Dollar', 'status': 'online'},
+    {'id': 'LRC', 'name': 'Loopring', 'status': 'delisted'}
+]
+
+
+class FakeCoinbaseInterface:
+    """ Serves the bulk listings and counts the requests made. """
+
+    def __init__(self):
+        self.requests = 0
+
+    def getProducts(self):
+        self.requests += 1
+        return PRODUCTS
+
+    def getCurrencies(self):
+        self.requests += 1
+        return CURRENCIES
+
+
+class TestProductCatalog(TestCase):
+    """ Unit tests for ProductCatalog class. """
+
+    def setUp(self):
+        self.catalog = ProductCatalog(PRODUCTS, CURRENCIES)
+
+    def test_indexes(self):
+        """ Test if products are indexed by currency pair and by currency. """
+        self.assertSetEqual(set(self.catalog.products), {('ETH', 'USD'), ('ETH', 'BTC'), ('BTC', 'USD'), ('LRC', 'BTC')})
+        self.assertSetEqual(set(self.catalog.productsByCurrency['BTC']), {('ETH', 'BTC'), ('BTC', 'USD'), ('LRC', 'BTC')})
+        self.assertEqual(self.catalog.getProduct('ETH', 'BTC')['min_market_funds'], '0.00001')
+        self.assertEqual(self.catalog.getProduct('LRC', 'BTC')['status'], 'delisted')
+
+    def test_getTradableUniverse(self):
+        """ Test if only online products between online currencies make up the universe. """
+        catalog = ProductCatalog(PRODUCTS + [
+            {'id': 'USDT-USD', 'base_currency': 'USDT', 'quote_currency': 'USD', 'base_increment': '0.01',
+             'min_market_funds': '1', 'status': 'online', 'trading_disabled': True}], CURRENCIES)
+        currencies, pairs = catalog.getTradableUniverse()
+
+        self.assertListEqual(currencies, ['BTC', 'ETH', 'USD'])
+        self.assertListEqual(pairs, [('BTC', 'USD'), ('ETH', 'BTC'), ('ETH', 'USD')])
+        self.assertTrue(catalog.isTradable('ETH', 'BTC'))
+        self.assertFalse(catalog.isTradable('LRC', 'BTC'))
+        self.assertFalse(catalog.isTradable('USDT', 'USD'))
+
+    def test_hasCurrency(self):
+        self.assertTrue(self.catalog.hasCurrency('ETH'))
+        self.assertFalse(self.catalog.hasCurrency('LRC'))
+        self.assertTrue(self.catalog.hasCurrency('LRC', status=None))
+        self.assertFalse(self.catalog.hasCurrency('UNICORN'))
+
+    def test_hasProduct(self):
+        self.assertTrue(self.catalog.hasProduct('ETH', 'USD'))
+        self.assertFalse(self.catalog.hasProduct('USD', 'ETH'))
+        self.assertFalse(self.catalog.hasProduct('ETH', 'ETH'))
+
+    def test_getCurrencyPairs(self):
+        self.assertListEqual(self.catalog.getCurrencyPairs(['ETH', 'BTC', 'USD']), [('ETH', 'USD'), ('ETH', 'BTC'), ('BTC', 'USD')])
+        self.assertListEqual(self.catalog.getCurrencyPairs(['BTC', 'USD']), [('BTC', 'USD')])
+
+    def test_clientUsesConstantNumberOfRequests(self):
+        """ Test if the client answers all metadata queries from two bulk requests. """
+        client = CoinbaseClient()
+        client.coinbaseClient = FakeCoinbaseInterface()
+
+        client.checkCurrenciesExistence(['ETH', 'BTC', 'USD'])
+        with self.assertRaises(CurrencyNotFound):
+            client.checkCurrenciesExistence(['ETH', 'LRC', 'UNICORN'])
+        self.assertTrue(client.checkCurrencyPairExistence('ETH', 'BTC'))
+        self.assertFalse(client.checkCurrencyPairExistence('BTC', 'ETH'))
+        self.assertEqual(client.getBasePrecision('ETH', 'BTC'), -8)
+        self.assertEqual(client.getBasePrecision('LRC', 'BTC'), 0)
+        self.assertEqual(client.getNotionalMinLimit('ETH', 'BTC'), '0.00001')
+        self.assertListEqual(client.getCurrencyPairs(['ETH', 'BTC']), [('ETH', 'BTC')])
+
+        self.assertEqual(client.coinbaseClient.requests, 2)
+
+    def test_clientCachesProductMetadata(self):
+        """ Test if the metadata of a product is looked up once and then served from the cache. """
+        client = CoinbaseClient()
+        client.coinbaseClient = FakeCoinbaseInterface()
+
+        for _ in range(3):
+            client.getBasePrecision('ETH', 'BTC')
+            client.getNotionalMinLimit('ETH', 'BTC')
+        self.assertDictEqual(client.getMetadataCacheStats(), {'hits': 5, 'misses': 1, 'size': 1})
+
+        client.invalidateMetadata('ETH', 'BTC')
+        self.assertEqual(client.getMetadataCacheStats()['size'], 0)
+
+        client.invalidateMetadata()
+        client.getBasePrecision('ETH', 'BTC')
+        self.assertEqual(client.coinbaseClient.requests, 4)  # Catalog is rebuilt after full invalidation
@@ -0,0 +1,117 @@
+"""
+Brief: Unit tests for the snapshot recorder and replay client (clients/replay)
+"""
+
+from unittest import TestCase
+from contextlib import redirect_stdout
+import io
+import os
+import tempfile
+
+from clients.coinbase.coinbase_client import CurrencyNotFound
+from clients.replay.recording_client import RecordingClient
+from clients.replay.replay_client import ReplayClient, ReplayFinished
+from clients.replay.snapshot_file import SnapshotReader
+from graph_constructor import GraphConstructor
+from main_implementation import main, runBacktest
+
+
+class MarketClient:
+    """ Exchange client whose ETH-BTC bid moves up with every order book fetched. """
+
+    def __init__(self):
+        self.fetches = 0
+        self.orderBooks = {('ETH', 'BTC'): {'bids': [['0.0850', '2', 1], ['0.0849', '5', 2]], 'asks': [['0.0851', '2', 1]]},
+                           ('ETH', 'USD'): {'bids': [['1751.27', '2', 1]], 'asks': [['1751.54', '2', 1]]},
+                           ('BTC', 'USD'): {'bids': [['21652.44', '1', 1]], 'asks': [['21652.45', '1', 1]]}}
+
+    def checkCurrenciesExistence(self, currencies):
+        pass
+
+    def getCurrencyPairs(self, currencies):
+        return [pair for pair in self.orderBooks if pair[0] in currencies and pair[1] in currencies]
+
+    def getOrderBook(self, base, quote, level=1):
+        self.fetches += 1
+        if (base, quote) == ('ETH', 'BTC'):
+            self.orderBooks[(base, quote)]['bids'][0][0] = '{:.4f}'.format(0.0800 + 0.0025 * (self.fetches // 3))
+        book = self.orderBooks[(base, quote)]
+        return book if level > 1 else {side: book[side][:1] for side in ('bids', 'asks')}
+
+    @staticmethod
+    def getBasePrecision(base, quote):
+        return -8
+
+    @staticmethod
+    def getNotionalMinLimit(base, quote):
+        return '0.00001'
+
+    def closeSession(self):
+        pass
+
+
+class TestReplayClient(TestCase):
+    """ Unit tests for the RecordingClient, SnapshotReader and ReplayClient classes. """
+
+    def setUp(self):
+        self.path = os.path.join(tempfile.mkdtemp(), 'snapshots.bin')
+        self.market = MarketClient()
+        self.recorder = RecordingClient(self.market, self.path)
+        graphObject = GraphConstructor(self.recorder, ['ETH', 'BTC', 'USD'], level=2)
+        self.recorded = [graphObject.buildGraph()[1] for _ in range(3)]
+        self.recorder.closeSession()
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_snapshotFile(self):
+        """ Test if the products are written once and every snapshot is read back with the same levels. """
+        reader = SnapshotReader(self.path)
+
+        self.assertEqual(len(reader), 3)
+        self.assertEqual(len(reader.products), 3)
+        self.assertDictEqual(reader.products[0], {'pair': ('ETH', 'BTC'), 'basePrecision': -8, 'notionalMinimumLimit': '0.00001'})
+
+        for index in range(3):
+            _, level, orderBooks = reader.readSnapshot(index)
+            self.assertEqual(level, 2)
+            self.assertListEqual(orderBooks[('ETH', 'BTC')]['bids'], [(0.0800 + 0.0025 * index, 2.0, 1), (0.0849, 5.0, 2)])
+            self.assertListEqual(orderBooks[('ETH', 'USD')]['asks'], [(1751.54, 2.0, 1)])
+
+    def test_replay(self):
+        """ Test if the replay client serves the recorded snapshots in order and the recorded metadata. """
+        client = ReplayClient(self.path)
+
+        self.assertListEqual(client.getCurrencyPairs(['ETH', 'BTC', 'USD']), [('ETH', 'BTC'), ('ETH', 'USD'), ('BTC', 'USD')])
+        self.assertEqual(client.getBasePrecision('ETH', 'BTC'), -8)
+        self.assertEqual(client.getNotionalMinLimit('BTC', 'USD'), '0.00001')
+        self.assertEqual(client.getFees(20000001), '0.0016')
+        with self.assertRaises(CurrencyNotFound):
+            client.checkCurrenciesExistence(['ETH', 'EUR'])
+        with self.assertRaises(ValueError):
+            client.getOrderBook('ETH', 'BTC')  # No snapshot has been loaded yet
+
+        for index, recorded in enumerate(self.recorded):
+            orderBooks = client.getOrderBooks(list(recorded))
+            self.assertEqual(orderBooks[('ETH', 'BTC')]['bids'][0][0], 0.0800 + 0.0025 * index)
+            self.assertEqual(len(orderBooks[('ETH', 'BTC')]['bids']), 1)
+
+        with self.assertRaises(ReplayFinished):
+            client.getOrderBooks(list(self.recorded[0]))
+
+    def test_main(self):
+        """ Test if main runs on the first recorded snapshot, where the ETH-BTC bid is too low for an arbitrage. """
+        with redirect_stdout(io.StringIO()) as output:
+            opportunities = main(ReplayClient(self.path), ['ETH', 'BTC', 'USD'], level=2)
+        self.assertListEqual(opportunities, [])
+        self.assertIn('No arbitrage has been found.', output.getvalue())
+
+    def test_runBacktest(self):
+        """ Test if every snapshot is replayed and the arbitrages found in each are reported. """
+        with redirect_stdout(io.StringIO()) as output:
+            results = runBacktest(ReplayClient(self.path), ['ETH', 'BTC', 'USD'])
+
+        self.assertListEqual([result['snapshot'] for result in results], [1, 2, 3])
+        self.assertListEqual([result['opportunities'] for result in results], [0, 1, 1])
+        self.assertListEqual([result['profitable'] for result in results], [0, 1, 1])
+        self.assertIn('3 snapshot(s) replayed', output.getvalue())
@@ -0,0 +1,76 @@
+"""
+Brief: Unit tests for request_scheduler.py
+"""
+
+from unittest import TestCase
+import threading
+import time
+
+from clients.base.request_scheduler import METADATA, ORDER_BOOK, RequestScheduler
+
+
+class TestRequestScheduler(TestCase):
+    """ Unit tests for RequestScheduler class. """
+
+    def test_tokenBucket(self):
+        """ Test if a burst is sent at once and further requests are paced at the rate. """
+        scheduler = RequestScheduler(rate=20, burst=5)
+        start = time.monotonic()
+        for _ in range(5):
+            scheduler.acquire()
+        self.assertLess(time.monotonic() - start, 0.05)
+
+        for _ in range(10):
+            scheduler.acquire()
+        self.assertGreaterEqual(time.monotonic() - start, 0.45)
+        self.assertEqual(scheduler.getStats()['requests'], 15)
+        self.assertGreaterEqual(scheduler.getStats()['delayed'], 9)
+
+    def test_noRateLimit(self):
+        """ Test if requests are never delayed without a rate. """
+        scheduler = RequestScheduler()
+        for _ in range(100):
+            scheduler.acquire()
+        self.assertEqual(scheduler.getStats()['delayed'], 0)
+
+    def test_priorityLanes(self):
+        """ Test if an order book request goes ahead of a metadata request that has been waiting longer. """
+        scheduler = RequestScheduler(rate=10, burst=1)
+        scheduler.acquire()  # Empties the bucket
+        served = []
+
+        def request(priority, name):
+            scheduler.acquire(priority)
+            served.append(name)
+
+        threads = [threading.Thread(target=request, args=(METADATA, 'metadata'))]
+        threads[0].start()
+        time.sleep(0.02)
+        threads.append(threading.Thread(target=request, args=(ORDER_BOOK, 'orderBook')))
+        threads[1].start()
+        for thread in threads:
+            thread.join()
+
+        self.assertListEqual(served, ['orderBook', 'metadata'])
+
+    def test_throttled(self):
+        """ Test if a 429 empties the bucket for the Retry-After delay. """
+        scheduler = RequestScheduler(rate=10, burst=10)
+        scheduler.recordThrottled(retryAfter=1)
+        self.assertLessEqual(scheduler._tokens, -10)
+        self.assertEqual(scheduler.getStats()['throttled'], 1)
+
+    def test_backoff(self):
+        """ Test if the backoff is jittered below an exponentially growing cap and respects Retry-After. """
+        scheduler = RequestScheduler(backoffBase=0.25, backoffCap=8.0, seed=0)
+        delays = [scheduler.backoff(0) for _ in range(100)]
+        self.assertTrue(all(0 <= delay <= 0.25 for delay in delays))
+        self.assertGreater(len(set(delays)), 1)
+        self.assertTrue(all(scheduler.backoff(10) <= 8.0 for _ in range(100)))
+        self.assertGreaterEqual(scheduler.backoff(0, retryAfter=3), 3)
+
+    def test_isRetryable(self):
+        self.assertTrue(RequestScheduler.isRetryable(429))
+        self.assertTrue(RequestScheduler.isRetryable(503))
+        self.assertFalse(RequestScheduler.isRetryable(404))
+        self.assertFalse(RequestScheduler.isRetryable(200))
@@ -0,0 +1,126 @@
+"""
+Brief: Unit tests for short_cycle_algorithm.py
+"""
+
+from unittest import TestCase
+import itertools
+
+import short_cycle_algorithm
+from short_cycle_algorithm import ShortCycleAlgorithm
+from sparse_graph import SparseGraph
+
+import numpy as np
+
+
+def enumerateNegativeCycles(matrix, mask, maxHops):
+    """ Every negative cycle of 3 to maxHops edges starting at its smallest vertex, by brute force: [(weight, cycle), ...] """
+    cycles = []
+    for hops in range(3, maxHops + 1):
+        for cycle in itertools.permutations(range(len(matrix)), hops):
+            edges = [(cycle[i], cycle[(i + 1) % hops]) for i in range(hops)]
+            if cycle[0] == min(cycle) and all(mask[edge] for edge in edges):
+                weight = sum(matrix[edge] for edge in edges)
+                if weight < 0:
+                    cycles.append((weight, list(cycle)))
+    return sorted(cycles)
+
+
+class TestShortCycleAlgorithm(TestCase):
+    """ Unit tests for the ShortCycleAlgorithm class. """
+
+    def setUp(self):
+        """ Contains a negative triangle, quadrilateral and 5-cycle - self.testMatrixOne
+        Contains no negative cycle - self.testMatrixTwo """
+        self.testMatrixOne = np.array([[0, -1, 0, 0, 0, 0, 0],
+                                       [0, 0, -1, 0, 0, 0, 0],
+                                       [1.5, 0, 0, 0.2, 0, 0, 0],
+                                       [0, 0, 0, 0, -1, 0, 0],
+                                       [0, 0, 0, 0, 0, -1, 0],
+                                       [0, 0.2, 0, 0, 0, 0, -1],
+                                       [0, 0, 0, 2, 0, 0, 0]])
+        self.testMatrixTwo = np.array([[0, 3, 1, 1, 0, 4],
+                                       [0, 0, 2, 7, 1, 0],
+                                       [-1, -1, 0, 0, 0, 1],
+                                       [1, 0, 2, 0, 0, 6],
+                                       [9, 1, 0, 1, 0, 0],
+                                       [0, 1, 3, 0, -1, 0]])
+
+    def test_getAllNegativeCycles(self):
+        """ Test if every negative cycle of 3 to maxHops edges is found once, most profitable first """
+        triangles = ShortCycleAlgorithm(self.testMatrixOne, maxHops=3)
+        quadrilaterals = ShortCycleAlgorithm(self.testMatrixOne)
+        fiveCycles = ShortCycleAlgorithm(self.testMatrixOne, maxHops=5)
+        noCycle = ShortCycleAlgorithm(self.testMatrixTwo)
+        for detectorObject in (triangles, quadrilaterals, fiveCycles, noCycle):
+            detectorObject.getAllNegativeCycles()
+
+        self.assertListEqual(triangles.negativeCycles, [[0, 1, 2]])
+        self.assertListEqual(quadrilaterals.negativeCycles, [[3, 4, 5, 6], [0, 1, 2]])
+        self.assertListEqual(fiveCycles.negativeCycles, [[1, 2, 3, 4, 5], [3, 4, 5, 6], [0, 1, 2]])
+        self.assertListEqual(noCycle.negativeCycles, [])
+
+        for logReturn, expected in zip(fiveCycles.getLogReturns(), [2.6, 1.0, 0.5]):
+            self.assertAlmostEqual(logReturn, expected)
+
+    def test_getANegativeCycle(self):
+        """ Test if the most profitable negative cycle is returned """
+        detectorObject = ShortCycleAlgorithm(self.testMatrixOne)
+        detectorObject.getANegativeCycle()
+
+        self.assertListEqual(detectorObject.negativeCycle, [3, 4, 5, 6])
+
+    def test_invalidMaxHops(self):
+        """ Test if a maximum below 3 edges is refused """
+        with self.assertRaises(ValueError):
+            ShortCycleAlgorithm(self.testMatrixOne, maxHops=2)
+
+    def test_sameCyclesAsEnumeration(self):
+        """ Test if the cycles and their weights are those found by brute force on random digraphs, with edges of weight 0 """
+        generator = np.random.default_rng(0)
+        for _ in range(100):
+            vertices, maxHops = int(generator.integers(1, 8)), int(generator.integers(3, 6))
+            mask = generator.random((vertices, vertices)) < generator.random()
+            np.fill_diagonal(mask, False)
+            matrix = generator.normal(0.2, 1, (vertices, vertices)) * (generator.random((vertices, vertices)) < 0.9) * mask
+
+            detectorObject = ShortCycleAlgorithm(SparseGraph.fromMatrix(matrix, mask), maxHops)
+            detectorObject.getAllNegativeCycles()
+            expected = enumerateNegativeCycles(matrix, mask, maxHops)
+
+            self.assertListEqual(sorted(map(tuple, detectorObject.negativeCycles)), sorted(tuple(cycle) for _, cycle in expected))
+            self.assertTrue(np.allclose(sorted(detectorObject.cycleWeights), [weight for weight, _ in expected]))
+
+    def test_batches(self):
+        """ Test if the vertices searched in several batches give the same cycles """
+        generator = np.random.default_rng(1)
+        mask = generator.random((30, 30)) < 0.2
+        np.fill_diagonal(mask, False)
+        graph = SparseGraph.fromMatrix(generator.normal(0.3, 1, (30, 30)), mask)
+
+        oneBatch = ShortCycleAlgorithm(graph)
+        oneBatch.getAllNegativeCycles()
+
+        batchSize = short_cycle_algorithm.BATCH_SIZE
+        self.addCleanup(setattr, short_cycle_algorithm, 'BATCH_SIZE', batchSize)
+        short_cycle_algorithm.BATCH_SIZE = 4 * graph.edgeCount  # Batches of 4 vertices
+        batches = ShortCycleAlgorithm(graph)
+        batches.getAllNegativeCycles()
+
+        self.assertGreater(len(oneBatch.negativeCycles), 0)
+        self.assertListEqual(batches.negativeCycles, oneBatch.negativeCycles)
+
+    def test_isolatedVertices(self):
+        """ Test if the batches of a graph with far more vertices than edges stay within BATCH_SIZE walks """
+        vertices = 5000
+        sources, targets = np.array([0, 1, 2, 3, 4]), np.array([1, 2, 0, 4, 3])
+        graph = SparseGraph(vertices, sources, targets, np.array([-1., 0.2, 0.3, 0.5, 0.5]))
+
+        batchSizes = []
+        detectorObject = ShortCycleAlgorithm(graph, maxHops=3)
+        searchBatch = detectorObject._searchBatch
+        detectorObject._searchBatch = lambda batch: batchSizes.append(len(batch)) or searchBatch(batch)
+        detectorObject.getAllNegativeCycles()
+
+        self.assertListEqual(detectorObject.negativeCycles, [[0, 1, 2]])
+        self.assertEqual(sum(batchSizes), vertices)
+        self.assertLessEqual(max(batchSizes) * vertices, short_cycle_algorithm.BATCH_SIZE)
@@ -0,0 +1,68 @@
+"""
+Brief: Unit tests for sparse_graph.py
+"""
+
+from unittest import TestCase
+
+import numpy as np
+
+from bellman_ford_algorithm import BellmanFordAlgorithm
+from sparse_graph import SparseGraph, asSparseGraph
+from spfa_algorithm import SPFAAlgorithm
+
+
+class TestSparseGraph(TestCase):
+    """ Unit tests for SparseGraph class. """
+
+    def setUp(self):
+        # Edges in no particular order, with 1 --> 2 given twice
+        self.graph = SparseGraph(4, [2, 0, 1, 1, 3], [3, 1, 2, 2, 0], [0.5, 0.0, 1.0, -1.0, 2.0])
+
+    def test_edgeArrays(self):
+        """ Test if edges are sorted by source then target, duplicates keep the last weight and the row pointer is correct. """
+        self.assertListEqual(self.graph.sources.tolist(), [0, 1, 2, 3])
+        self.assertListEqual(self.graph.targets.tolist(), [1, 2, 3, 0])
+        self.assertListEqual(self.graph.weights.tolist(), [0.0, -1.0, 0.5, 2.0])
+        self.assertListEqual(self.graph.indptr.tolist(), [0, 1, 2, 3, 4])
+        self.assertTupleEqual(self.graph.shape, (4, 4))
+        self.assertEqual(self.graph.edgeCount, 4)
+
+    def test_indexing(self):
+        """ Test if an edge of weight 0 exists and if missing edges raise KeyError. """
+        self.assertTrue(self.graph.hasEdge(0, 1))
+        self.assertEqual(self.graph[0, 1], 0.0)
+        self.assertFalse(self.graph.hasEdge(1, 0))
+        with self.assertRaises(KeyError):
+            self.graph[1, 0]
+        with self.assertRaises(KeyError):
+            self.graph[1, 0] = 1.0
+
+        self.graph[2, 3] = 0.25
+        self.assertEqual(self.graph[2, 3], 0.25)
+
+    def test_subGraph(self):
+        """ Test if the sub-graph keeps the edges between its vertices only, renumbered. """
+        subGraph = self.graph.subGraph([1, 2, 3])
+        self.assertEqual(subGraph.vertices, 3)
+        self.assertListEqual(list(zip(subGraph.sources.tolist(), subGraph.targets.tolist())), [(0, 1), (1, 2)])
+        self.assertListEqual(subGraph.weights.tolist(), [-1.0, 0.5])
+
+    def test_denseConversion(self):
+        """ Test if a dense matrix is converted with non-zero weights as edges, unless a mask is given. """
+        matrix = np.array([[0, 2, 0], [0, 0, -1], [0, 0, 0]])
+        self.assertEqual(SparseGraph.fromMatrix(matrix).edgeCount, 2)
+        self.assertEqual(SparseGraph.fromMatrix(matrix, mask=np.ones((3, 3))).edgeCount, 9)
+
+        dense, mask = self.graph.toDense()
+        self.assertEqual(mask.sum(), 4)
+        self.assertTrue(mask[0, 1])
+        self.assertEqual(dense[1, 2], -1.0)
+        self.assertIs(asSparseGraph(self.graph), self.graph)
+
+    def test_zeroWeightCycle(self):
+        """ Test if a negative cycle through edges of weight 0 is found by both detectors. """
+        graph = SparseGraph(3, [0, 1, 2, 1, 2, 0], [1, 2, 0, 0, 1, 2], [0.0, 0.0, -0.1, 0.2, 0.2, 0.2])
+        for detectorClass in (BellmanFordAlgorithm, SPFAAlgorithm):
+            detectorObject = detectorClass(graph)
+            detectorObject.getAllNegativeCycles()
+            self.assertListEqual(detectorObject.negativeCycles, [[0, 1, 2]])
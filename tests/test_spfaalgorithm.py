@@ -0,0 +1,86 @@
+"""
+Brief: Unit tests for spfa_algorithm.py
+"""
+
+from unittest import TestCase
+from spfa_algorithm import SPFAAlgorithm
+
+import numpy as np
+
+
+class TestSPFAAlgorithm(TestCase):
+    """ Unit tests for the SPFAAlgorithm class. """
+
+    def setUp(self):
+        """ Contains negative cycle - self.testMatrixOne
+        Contains no negative cycle - self.testMatrixTwo
+        Contains negative cycle - self.testMatrixThree """
+        self.testMatrixOne = SPFAAlgorithm(np.array([[0,  2,  0,  0],
+                                                     [1,  0, -1,  0],
+                                                     [0,  0,  0, -1],
+                                                     [1, -1,  0,  0]]))
+        self.testMatrixTwo = SPFAAlgorithm(np.array([[0, 3, 1, 1, 0, 4],
+                                                     [0, 0, 2, 7, 1, 0],
+                                                     [-1, -1, 0, 0, 0, 1],
+                                                     [1, 0, 2, 0, 0, 6],
+                                                     [9, 1, 0, 1, 0, 0],
+                                                     [0, 1, 3, 0, -1, 0]]))
+        self.testMatrixThree = SPFAAlgorithm(np.array([[0, 1, 0, 0, 1, 0],
+                                                       [0, 0, 1, 0, 0, 0],
+                                                       [0, 1, 0, 1, -1, 3],
+                                                       [0, 0, 0, 0, 0, 2],
+                                                       [0, 0, -1, 0, 0, 0],
+                                                       [-1, 0, 0, 0, 0, 0]]))
+
+    def test_getAdjacency(self):
+        """ Test if the outgoing edges are correctly extracted from the matrix """
+        self.assertListEqual(self.testMatrixOne.adjacency, [[(1, 2)], [(0, 1), (2, -1)], [(3, -1)], [(0, 1), (1, -1)]])
+
+    def test_getNegativeCycle(self):
+        """ Test if a negative cycle is correctly detected or not """
+        self.testMatrixOne.getANegativeCycle()
+        self.testMatrixTwo.getANegativeCycle()
+        self.testMatrixThree.getANegativeCycle()
+
+        self.assertListEqual(self.testMatrixOne.negativeCycle, [1, 2, 3])
+        self.assertListEqual(self.testMatrixTwo.negativeCycle, [])
+        self.assertListEqual(self.testMatrixThree.negativeCycle, [4, 2])
+
+    def test_shortestDistancesWithoutNegativeCycle(self):
+        """ Test if the shortest distances and predecessor vertices are found when there is no negative cycle """
+        self.testMatrixTwo.getANegativeCycle()
+
+        for index, distance in enumerate([0, 0, 1, 1, 1, 2]):
+            self.assertEqual(self.testMatrixTwo.distances[index], distance)
+        for index, predecessorVertex in enumerate([-1, 2, 0, 0, 5, 2]):
+            self.assertEqual(self.testMatrixTwo.predecessors[index], predecessorVertex)
+
+    def test_disassembleSubtree(self):
+        """ Test if the subtree is removed from the shortest path tree or a cycle is reported """
+        predecessors = [-1, 0, 1, 1]
+        children = [{1}, {2, 3}, set(), set()]
+        inQueue = [False, False, True, True]
+
+        self.assertListEqual(self.testMatrixOne._disassembleSubtree(1, 3, predecessors, children, inQueue), [1, 3])
+        self.assertIsNone(self.testMatrixOne._disassembleSubtree(1, 0, predecessors, children, inQueue))
+        self.assertListEqual(predecessors, [-1, 0, -1, -1])
+        self.assertListEqual(children, [{1}, set(), set(), set()])
+        self.assertListEqual(inQueue, [False, False, False, False])
+
+    def test_getAllNegativeCycles(self):
+        """ Test if every distinct negative cycle is found """
+        twoCyclesMatrix = SPFAAlgorithm(np.array([[0, -1, 1, 1, 1, 1],
+                                                  [1, 0, -1, 1, 1, 1],
+                                                  [1.5, 1, 0, 1, 1, 1],
+                                                  [1, 1, 1, 0, -1, 1],
+                                                  [1, 1, 1, 1, 0, -1],
+                                                  [1, 1, 1, 1, 1, 0]]))
+        self.testMatrixOne.getAllNegativeCycles()
+        self.testMatrixTwo.getAllNegativeCycles()
+        self.testMatrixThree.getAllNegativeCycles()
+        twoCyclesMatrix.getAllNegativeCycles()
+
+        self.assertListEqual(self.testMatrixOne.negativeCycles, [[1, 2, 3]])
+        self.assertListEqual(self.testMatrixTwo.negativeCycles, [])
+        self.assertListEqual(self.testMatrixThree.negativeCycles, [[2, 4]])
+        self.assertListEqual(sorted(twoCyclesMatrix.negativeCycles), [[0, 1, 2], [3, 4, 5]])
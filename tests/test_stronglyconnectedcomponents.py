@@ -2,11 +2,18 @@
 Brief: Unit tests for strongly_connected_components.py
 """
 
-from unittest import TestCase
-from strongly_connected_components import ConnectedComponents
+from unittest import TestCase, skipIf
+from sparse_graph import SparseGraph
+from strongly_connected_components import ConnectedComponents, findStronglyConnectedComponents
 
 import numpy as np
 
+try:
+    from scipy.sparse import csr_matrix
+    from scipy.sparse.csgraph import connected_components
+except ImportError:  # scipy is only needed to verify the built-in implementation
+    connected_components = None
+
 
 class TestConnectedComponents(TestCase):
     """ Unit tests for the ConnectedComponents class. """
@@ -39,9 +46,60 @@ class TestConnectedComponents(TestCase):
         self.assertSequenceEqual(componentsOne['components'], [])
         self.assertSequenceEqual(sorted(componentsTwo['components'][0]['componentVertices']), [2, 3, 4])
         self.assertSetEqual(set(componentsTwo['components'][0]['componentVerticesMap']), {(0, 2), (1, 3), (2, 4)})
-        for row in componentsTwo['components'][0]['subGraph'] - np.array([[0, -4, 0], [0, 0, 1], [-3, 0, 0]]):
+        for row in componentsTwo['components'][0]['subGraph'].toDense()[0] - np.array([[0, -4, 0], [0, 0, 1], [-3, 0, 0]]):
             for entry in row:
                 self.assertEqual(entry, 0)
 
         self.assertSequenceEqual(sorted(componentsOne['isolatedVertices']), [0, 1, 2])
         self.assertSequenceEqual(sorted(componentsTwo['isolatedVertices']), [0, 1, 5, 6])
+
+    def test_getConnectedComponentsOf(self):
+        """ Test if the components are reused for a matrix with the same edges but different weights. """
+        self.graphTwo.getConnectedComponents()
+        componentsTwo = self.graphTwo.getConnectedComponentsOf(np.array([[0, 1, 0, 0, 9, 0, 0],
+                                                                         [0, 0, 0, 0, 0, 0, 0],
+                                                                         [0, 0, 0, -5, 0, 0, 0],
+                                                                         [0, 0, 0, 0, 2, 0, 0],
+                                                                         [0, 0, -1, 0, 0, 0, 0],
+                                                                         [0, 1, 0, 0, 2, 0, -1],
+                                                                         [0, 0, 0, 0, 0, 1, 0]]))
+
+        self.assertSequenceEqual(sorted(componentsTwo['components'][0]['componentVertices']), [2, 3, 4])
+        self.assertSequenceEqual(sorted(componentsTwo['isolatedVertices']), [0, 1, 5, 6])
+        for row in componentsTwo['components'][0]['subGraph'].toDense()[0] - np.array([[0, -5, 0], [0, 0, 2], [-1, 0, 0]]):
+            for entry in row:
+                self.assertEqual(entry, 0)
+
+    def test_zeroWeightEdges(self):
+        """ Test if edges of weight 0 of a sparse graph connect the component. """
+        graph = SparseGraph(3, [0, 1, 2], [1, 2, 0], [0.0, 0.0, -0.1])
+        components = ConnectedComponents(graph).getConnectedComponents()
+
+        self.assertListEqual(components['components'][0]['componentVertices'], [0, 1, 2])
+        self.assertEqual(components['components'][0]['subGraph'].edgeCount, 3)
+
+    def test_emptyGraph(self):
+        """ Test if a graph without vertices has no components. """
+        numberOfComponents, labels = findStronglyConnectedComponents(0, [], [0])
+
+        self.assertEqual(numberOfComponents, 0)
+        self.assertEqual(len(labels), 0)
+        self.assertDictEqual(ConnectedComponents(SparseGraph(0, [], [], [])).getConnectedComponents(),
+                             {'components': [], 'isolatedVertices': []})
+
+    @skipIf(connected_components is None, 'scipy is not installed')
+    def test_sameLabelsAsScipy(self):
+        """ Test if the labels are identical to those of scipy on random digraphs, from very sparse to complete. """
+        generator = np.random.default_rng(0)
+        for vertices, density in [(1, 1.0), (2, 1.0), (10, 0.1), (30, 0.05), (50, 0.3), (200, 0.01), (200, 0.02), (500, 0.004)]:
+            for _ in range(5):
+                mask = generator.random((vertices, vertices)) < density
+                np.fill_diagonal(mask, False)
+                graph = SparseGraph.fromMatrix(np.zeros((vertices, vertices)), mask)
+
+                expected = connected_components(csr_matrix((np.ones(graph.edgeCount), graph.targets, graph.indptr), shape=graph.shape),
+                                                 directed=True, connection='strong', return_labels=True)
+                numberOfComponents, labels = findStronglyConnectedComponents(graph.vertices, graph.targets, graph.indptr)
+
+                self.assertEqual(numberOfComponents, expected[0])
+                self.assertListEqual(labels.tolist(), expected[1].tolist())
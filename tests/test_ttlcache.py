@@ -0,0 +1,61 @@
+"""
+Brief: Unit tests for ttl_cache.py
+"""
+
+from unittest import TestCase
+from clients.base.ttl_cache import TTLCache
+
+
+class FakeClock:
+    """ Clock that only moves when told to. """
+
+    def __init__(self):
+        self.time = 0
+
+    def __call__(self):
+        return self.time
+
+
+class TestTTLCache(TestCase):
+    """ Unit tests for TTLCache class. """
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.cache = TTLCache(ttl=10, maxSize=2, clock=self.clock)
+
+    def test_getAndSet(self):
+        """ Test if stored values are returned and counted as hits. """
+        self.assertIsNone(self.cache.get('A'))
+        self.cache.set('A', 1)
+        self.assertEqual(self.cache.get('A'), 1)
+        self.assertEqual(self.cache.get('B', 'missing'), 'missing')
+        self.assertDictEqual(self.cache.getStats(), {'hits': 1, 'misses': 2, 'size': 1})
+
+    def test_expiry(self):
+        """ Test if entries expire after the time-to-live. """
+        self.cache.set('A', 1)
+        self.clock.time = 9.9
+        self.assertEqual(self.cache.get('A'), 1)
+        self.clock.time = 10
+        self.assertIsNone(self.cache.get('A'))
+        self.assertEqual(len(self.cache), 0)
+
+    def test_leastRecentlyUsedEviction(self):
+        """ Test if the least recently used entry is evicted when the cache is full. """
+        self.cache.set('A', 1)
+        self.cache.set('B', 2)
+        self.cache.get('A')
+        self.cache.set('C', 3)
+        self.assertEqual(self.cache.get('A'), 1)
+        self.assertIsNone(self.cache.get('B'))
+        self.assertEqual(self.cache.get('C'), 3)
+
+    def test_invalidate(self):
+        """ Test if entries are removed on invalidation. """
+        self.cache.set('A', 1)
+        self.cache.set('B', 2)
+        self.cache.invalidate('A')
+        self.assertIsNone(self.cache.get('A'))
+        self.assertEqual(self.cache.get('B'), 2)
+        self.cache.invalidate()
+        self.assertEqual(len(self.cache), 0)